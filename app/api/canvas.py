@@ -1,13 +1,20 @@
 from flask import Blueprint, request, jsonify
 from datetime import datetime
 from app.database import db
-from app.models import Canvas
-from app.schemas import CanvasSchema
+from app.models import Canvas, Card
+from app.schemas import CanvasSchema, CardSchema
+from app.api.fieldsets import Projection, select_fields
+from app.api.pagination import paginated_response
 
 bp = Blueprint('canvas', __name__)
 
 canvas_schema = CanvasSchema()
-canvases_schema = CanvasSchema(many=True)
+
+# Fields and relations selectable with ?fields= / ?include=
+canvas_projection = Projection(CanvasSchema, Canvas, relations={'cards': Projection(CardSchema, Card)})
+canvas_list_projection = Projection(
+    CanvasSchema, Canvas, relations={'cards': Projection(CardSchema, Card)}, required=('created_at',)
+)
 
 @bp.route('/', methods=['POST'])
 def create_canvas():
@@ -29,27 +36,31 @@ def create_canvas():
 
 @bp.route('/', methods=['GET'])
 def list_canvases():
-    """List all canvases, optionally filtered by meeting"""
+    """List all canvases, optionally filtered by meeting (skip/limit, or cursor for keyset pages)"""
     meeting_id = request.args.get('meeting_id', type=int)
-    skip = request.args.get('skip', 0, type=int)
-    limit = request.args.get('limit', 100, type=int)
+    selection, error = select_fields(canvas_list_projection)
+    if error:
+        return error
     
-    query = Canvas.query
+    query = Canvas.query.options(*selection.options())
     
     if meeting_id is not None:
         query = query.filter_by(meeting_id=meeting_id)
     
-    canvases = query.offset(skip).limit(limit).all()
-    return jsonify(canvases_schema.dump(canvases))
+    return paginated_response(query, Canvas, selection.schema(many=True))
 
 @bp.route('/<int:canvas_id>', methods=['GET'])
 def get_canvas(canvas_id):
-    """Get a specific canvas with all cards"""
-    canvas = Canvas.query.get(canvas_id)
+    """Get a specific canvas with all cards (narrowed by ?fields= / ?include=)"""
+    selection, error = select_fields(canvas_projection)
+    if error:
+        return error
+    
+    canvas = Canvas.query.options(*selection.options()).filter_by(id=canvas_id).first()
     if not canvas:
         return jsonify({"error": "Canvas not found"}), 404
     
-    return jsonify(canvas_schema.dump(canvas))
+    return jsonify(selection.schema().dump(canvas))
 
 @bp.route('/<int:canvas_id>', methods=['PUT'])
 def update_canvas(canvas_id):
@@ -3,15 +3,24 @@ from datetime import datetime
 from app.database import db
 from app.models import Card, CardUpdate as CardUpdateModel, CardType, CardStatus
 from app.schemas import CardSchema, CardDetailSchema, CardUpdateSchema
+from app.api.fieldsets import Projection, select_fields
+from app.api.pagination import paginated_response
+from app.services.segment_locator import get_segment_locator
 
 bp = Blueprint('cards', __name__)
 
 card_schema = CardSchema()
 cards_schema = CardSchema(many=True)
-card_detail_schema = CardDetailSchema()
 card_update_schema = CardUpdateSchema()
 card_updates_schema = CardUpdateSchema(many=True)
 
+# Fields and relations selectable with ?fields= / ?include=
+card_list_projection = Projection(CardSchema, Card, required=('created_at',))
+card_detail_projection = Projection(CardDetailSchema, Card, relations={
+    'updates': Projection(CardUpdateSchema, CardUpdateModel),
+    'child_cards': Projection(CardSchema, Card),
+})
+
 @bp.route('/', methods=['POST'])
 def create_card():
     """Create a new card (manually added by user)"""
@@ -46,30 +55,61 @@ def create_card():
 
 @bp.route('/', methods=['GET'])
 def list_cards():
-    """List cards with optional filters"""
+    """List cards with optional filters (skip/limit, or cursor for keyset pages)"""
     meeting_id = request.args.get('meeting_id', type=int)
     canvas_id = request.args.get('canvas_id', type=int)
-    skip = request.args.get('skip', 0, type=int)
-    limit = request.args.get('limit', 100, type=int)
+    selection, error = select_fields(card_list_projection)
+    if error:
+        return error
     
-    query = Card.query
+    query = Card.query.options(*selection.options())
     
     if meeting_id is not None:
         query = query.filter_by(meeting_id=meeting_id)
     if canvas_id is not None:
         query = query.filter_by(canvas_id=canvas_id)
     
-    cards = query.offset(skip).limit(limit).all()
-    return jsonify(cards_schema.dump(cards))
+    return paginated_response(query, Card, selection.schema(many=True))
 
 @bp.route('/<int:card_id>', methods=['GET'])
 def get_card(card_id):
-    """Get a specific card with all updates and child cards"""
+    """Get a specific card with all updates and child cards (narrowed by ?fields= / ?include=)"""
+    selection, error = select_fields(card_detail_projection)
+    if error:
+        return error
+    
+    card = Card.query.options(*selection.options()).filter_by(id=card_id).first()
+    if not card:
+        return jsonify({"error": "Card not found"}), 404
+    
+    return jsonify(selection.schema().dump(card))
+
+@bp.route('/<int:card_id>/segment', methods=['GET'])
+def get_card_segment(card_id):
+    """
+    Locate the transcript span supporting a card, without calling the LLM.
+    
+    Uses the card's stored transcript_segment when present, otherwise its
+    content. Returns character offsets into the meeting transcript.
+    """
     card = Card.query.get(card_id)
     if not card:
         return jsonify({"error": "Card not found"}), 404
+    if not card.meeting or not card.meeting.transcript:
+        return jsonify({"error": "Card has no meeting transcript"}), 400
+    
+    min_score = request.args.get('min_score', 0.3, type=float)
+    locator = get_segment_locator(card.meeting.transcript)
+    
+    match = None
+    if card.transcript_segment:
+        match = locator.locate(card.transcript_segment, min_score=min_score)
+    if match is None:
+        match = locator.locate(card.content, min_score=min_score)
+    if match is None:
+        return jsonify({"error": "No matching segment found"}), 404
     
-    return jsonify(card_detail_schema.dump(card))
+    return jsonify(dict(match, card_id=card.id))
 
 @bp.route('/<int:card_id>', methods=['PUT'])
 def update_card(card_id):
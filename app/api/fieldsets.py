@@ -0,0 +1,154 @@
+"""
+Sparse fieldsets and selective includes for read endpoints.
+
+?fields= picks the fields to return, comma-separated. Dotted names reach
+into a nested relation (cards.title); a bare relation name (cards) returns
+that relation with all of its fields. ?include= adds relations with all of
+their fields; include= with no value returns none. With neither parameter
+the endpoint returns everything it always has. id is always returned.
+
+The same selection drives the marshmallow only= projection and the
+SQLAlchemy loader options: unrequested columns are not selected
+(load_only) and unrequested relations are not loaded at all.
+"""
+
+from functools import lru_cache
+
+from flask import request, jsonify
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, selectinload
+
+
+class InvalidFieldset(ValueError):
+    """Raised for a field or relation the endpoint does not have"""
+
+
+def _split(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+class Projection:
+    """
+    Fields and relations one endpoint can return, and how to load them.
+
+    relations maps a nested schema field to the Projection of its rows; the
+    field name must also be the model's relationship attribute. computed
+    maps a field that is not a column to a function returning the loader
+    option that provides it. required columns are always loaded (e.g.
+    created_at for cursor pagination) but only dumped when requested.
+    """
+
+    def __init__(self, schema_cls, model, relations=None, computed=None, required=()):
+        self.schema_cls = schema_cls
+        self.model = model
+        self.relations = relations or {}
+        self.computed = computed or {}
+        self.required = tuple(required)
+
+        # Column attributes load_only can select (query expressions are computed)
+        self.columns = {attr.key for attr in inspect(model).column_attrs} - set(self.computed)
+        declared = schema_cls().fields
+        self.scalars = [name for name in declared if name not in self.relations]
+        self._schema = lru_cache(maxsize=64)(self._build_schema)
+
+    def select(self, args):
+        """Selection for a request's fields/include query parameters."""
+        fields = _split(args.get("fields", ""))
+        include = args.get("include")
+        if not fields and include is None:
+            return Selection(self, None, None)
+
+        scalars = set(self.scalars) if not fields else set()
+        nested = {}
+        for name in fields:
+            head, _, rest = name.partition(".")
+            if head in self.relations:
+                if rest:
+                    if nested.get(head, []) is not None:
+                        nested.setdefault(head, []).append(rest)
+                else:
+                    nested[head] = None
+            elif rest or head not in self.scalars:
+                raise InvalidFieldset(f"Unknown field: {name}")
+            else:
+                scalars.add(head)
+        for name in _split(include or ""):
+            nested.setdefault(name, None)
+
+        unknown = set(nested) - set(self.relations)
+        if unknown:
+            raise InvalidFieldset(f"Unknown relation: {', '.join(sorted(unknown))}")
+        for relation, names in nested.items():
+            if names is not None:
+                self.relations[relation]._check(relation, names)
+
+        if "id" in self.scalars:
+            scalars.add("id")
+        return Selection(self, scalars, nested)
+
+    def _check(self, relation, names):
+        for name in names:
+            if name not in self.scalars:
+                raise InvalidFieldset(f"Unknown field: {relation}.{name}")
+
+    def options(self, scalars=None, nested=None):
+        """Loader options for the selected scalars and relations (None: all of them)."""
+        scalars = self.scalars if scalars is None else scalars
+        nested = {name: None for name in self.relations} if nested is None else nested
+
+        columns = {name for name in scalars if name in self.columns} | set(self.required)
+        options = [load_only(*(getattr(self.model, name) for name in sorted(columns)))] if columns else []
+        options.extend(self.computed[name]() for name in scalars if name in self.computed)
+        for relation, names in nested.items():
+            child = self.relations[relation]
+            child_scalars = None if names is None else set(names) | ({"id"} & set(child.scalars))
+            options.append(
+                selectinload(getattr(self.model, relation)).options(*child.options(child_scalars))
+            )
+        return options
+
+    def _build_schema(self, only, many):
+        return self.schema_cls(only=only, many=many)
+
+    def schema(self, only=None, many=False):
+        return self._schema(only, many)
+
+
+class Selection:
+    """What one request asked for from a Projection."""
+
+    def __init__(self, projection, scalars, nested):
+        self.projection = projection
+        self.scalars = scalars
+        self.nested = nested
+
+    def options(self):
+        return self.projection.options(self.scalars, self.nested)
+
+    def only(self):
+        """marshmallow only= tuple, or None for every field."""
+        if self.scalars is None:
+            return None
+        names = set(self.scalars)
+        for relation, fields in self.nested.items():
+            if fields is None:
+                names.add(relation)
+            else:
+                child = self.projection.relations[relation]
+                names.update(f"{relation}.{name}" for name in set(fields) | ({"id"} & set(child.scalars)))
+        return tuple(sorted(names))
+
+    def schema(self, many=False):
+        return self.projection.schema(self.only(), many)
+
+
+def select_fields(projection):
+    """
+    Selection for the current request's ?fields=/?include=.
+
+    Returns (selection, None) on success or (None, error_response).
+    """
+    try:
+        return projection.select(request.args), None
+    except InvalidFieldset as e:
+        return None, (jsonify({"error": "Invalid fields", "message": str(e)}), 400)
@@ -0,0 +1,17 @@
+from flask import Blueprint, jsonify
+from app.database import db
+from app.models import ExtractionJob
+from app.schemas import ExtractionJobSchema
+
+bp = Blueprint('jobs', __name__)
+
+job_schema = ExtractionJobSchema()
+
+@bp.route('/<int:job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get the status of a background extraction job"""
+    job = db.session.get(ExtractionJob, job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    
+    return jsonify(job_schema.dump(job))
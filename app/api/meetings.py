@@ -1,63 +1,88 @@
 import os
+import json
+import time
 import logging
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, Response, request, jsonify, session, stream_with_context
 from datetime import datetime
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload, with_expression
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
 from app.database import db
-from app.models import Meeting, Card, Canvas, CardType
-from app.schemas import MeetingSchema, MeetingCreateSchema, MeetingDetailSchema
-from app.services.extraction_service import ExtractionService
+from app.models import Meeting, Card, Canvas, CardType, ExtractionJob, JobStatus, transcript_stats
+from app.schemas import (
+    MeetingSchema,
+    MeetingSummarySchema,
+    MeetingCreateSchema,
+    MeetingDetailSchema,
+    MeetingCanvasSchema,
+    ExtractionJobSchema,
+    CardSchema,
+    TranscriptChunkSchema,
+)
+from app.services.extraction_service import get_extraction_service, EXTRACTION_BACKENDS
+from app.services.agenda_coverage import AgendaCoverage
+from app.services.meeting_extraction import (
+    add_generated_cards,
+    apply_extraction,
+    existing_generated_types,
+    upsert_generated_cards,
+)
+from app.services.job_queue import job_queue
+from app.services.live_extraction import LIVE_DEFAULT_TYPES, append_transcript_chunk, extract_pending_chunks
+from app.services.resilience import UpstreamUnavailableError
+from app.services.telemetry import get_extraction_telemetry
+from app.services.transcript_preprocessor import TokenBudgetExceeded
 from app.services.google_docs_service import GoogleDocsService
+from app.api.fieldsets import Projection, select_fields
+from app.api.pagination import paginated_response
 
 logger = logging.getLogger(__name__)
 
 bp = Blueprint('meetings', __name__)
 
 meeting_schema = MeetingSchema()
-meetings_schema = MeetingSchema(many=True)
 meeting_create_schema = MeetingCreateSchema()
 meeting_detail_schema = MeetingDetailSchema()
+job_schema = ExtractionJobSchema()
+card_schema = CardSchema()
+chunk_schema = TranscriptChunkSchema()
 google_service = GoogleDocsService()
 
+# Characters of transcript included in list responses
+TRANSCRIPT_PREVIEW_CHARS = 200
 
-def get_extraction_service() -> ExtractionService:
-    """Get ExtractionService instance with API key from environment."""
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY environment variable is not set")
-    return ExtractionService(api_key=api_key)
+# Fields and relations selectable with ?fields= / ?include=
+meeting_list_projection = Projection(
+    MeetingSummarySchema, Meeting,
+    computed={'transcript_preview': lambda: with_expression(
+        Meeting.transcript_preview, func.substr(Meeting.transcript, 1, TRANSCRIPT_PREVIEW_CHARS)
+    )},
+    required=('created_at',),
+)
+# Canvas cards are only needed for card_ids; full cards come from meeting.cards
+meeting_detail_projection = Projection(MeetingDetailSchema, Meeting, relations={
+    'cards': Projection(CardSchema, Card),
+    'canvases': Projection(MeetingCanvasSchema, Canvas, computed={
+        'card_ids': lambda: selectinload(Canvas.cards).load_only(Card.id),
+    }),
+})
 
-@bp.route('/', methods=['POST'])
-def create_meeting():
+def _prepare_meeting_payload(data):
     """
-    Create a new meeting and extract cards from transcript.
-    
-    This endpoint supports:
-    1. Direct transcript text
-    2. Google Docs URL (requires authentication)
-    
-    Request body can include:
-    - transcript: Direct text
-    - google_doc_url: URL to Google Doc
-    - google_doc_id: Direct document ID
+    Resolve the transcript (direct text or Google Doc) and validate a
+    meeting creation payload.
     
-    This endpoint:
-    1. Fetches transcript (from text or Google Doc)
-    2. Creates a meeting record
-    3. Extracts cards based on requested_card_types (placeholder for LLM)
-    4. Creates a default canvas
-    5. Returns meeting with generated cards
+    Returns (data, None) on success or (None, error_response).
     """
-    data = request.get_json()
-    
     # Handle Google Docs integration
     transcript = data.get('transcript')
     google_doc_url = data.get('google_doc_url')
     google_doc_id = data.get('google_doc_id')
     
     if not transcript and not google_doc_url and not google_doc_id:
-        return jsonify({
+        return None, (jsonify({
             'error': 'Either transcript, google_doc_url, or google_doc_id is required'
-        }), 400
+        }), 400)
     
     # Fetch from Google Docs if URL or ID provided
     if google_doc_url or google_doc_id:
@@ -66,16 +91,16 @@ def create_meeting():
             token_info = data.get('token_info') or session.get('google_token')
             
             if not token_info:
-                return jsonify({
+                return None, (jsonify({
                     'error': 'Google authentication required',
                     'message': 'Please authenticate with Google first using /api/google/auth/url'
-                }), 401
+                }), 401)
             
             # Extract document ID if URL provided
             if google_doc_url:
                 google_doc_id = google_service.extract_document_id_from_url(google_doc_url)
                 if not google_doc_id:
-                    return jsonify({'error': 'Invalid Google Docs URL'}), 400
+                    return None, (jsonify({'error': 'Invalid Google Docs URL'}), 400)
             
             # Fetch document content
             transcript = google_service.get_document_content(google_doc_id, token_info)
@@ -86,22 +111,26 @@ def create_meeting():
                 data['title'] = doc_metadata['title']
             
         except Exception as e:
-            return jsonify({
+            return None, (jsonify({
                 'error': 'Failed to fetch Google Doc',
                 'message': str(e)
-            }), 500
+            }), 500)
     
     # Update data with fetched transcript
     data['transcript'] = transcript
     
     errors = meeting_create_schema.validate(data)
     if errors:
-        return jsonify(errors), 400
+        return None, (jsonify(errors), 400)
     
     # Parse datetime if it's a string
     if isinstance(data.get('meeting_date'), str):
         data['meeting_date'] = datetime.fromisoformat(data['meeting_date'].replace('Z', '+00:00'))
     
+    return data, None
+
+def _create_meeting_with_canvas(data):
+    """Add a meeting and its default canvas to the session (flushed, not committed)"""
     # Create meeting
     meeting = Meeting(
         title=data['title'],
@@ -122,9 +151,66 @@ def create_meeting():
     db.session.add(canvas)
     db.session.flush()
     
+    return meeting, canvas
+
+def _load_meeting_detail(meeting_id, selection=None):
+    """
+    Meeting with everything MeetingDetailSchema dumps, in four queries,
+    or only what a ?fields= / ?include= selection asks for.
+    
+    Cards are loaded once through meeting.cards; canvas.cards only needs
+    ids for card_ids, and rows already in the session are reused.
+    """
+    options = selection.options() if selection else meeting_detail_projection.options()
+    return Meeting.query.options(*options).filter_by(id=meeting_id).first()
+
+def _get_or_create_canvas(meeting):
+    """The meeting's first canvas, creating a default one if it has none"""
+    canvas = Canvas.query.filter_by(meeting_id=meeting.id).first()
+    if not canvas:
+        canvas = Canvas(
+            meeting_id=meeting.id,
+            title=f"{meeting.title} - Canvas",
+            description="Main canvas for meeting cards"
+        )
+        db.session.add(canvas)
+        db.session.flush()
+    return canvas
+
+@bp.route('/', methods=['POST'])
+def create_meeting():
+    """
+    Create a new meeting and extract cards from transcript.
+    
+    This endpoint supports:
+    1. Direct transcript text
+    2. Google Docs URL (requires authentication)
+    
+    Request body can include:
+    - transcript: Direct text
+    - google_doc_url: URL to Google Doc
+    - google_doc_id: Direct document ID
+    - async: Queue extraction in the background (also ?async=1)
+    - callback_url: Webhook notified when an async extraction finishes
+    
+    This endpoint:
+    1. Fetches transcript (from text or Google Doc)
+    2. Creates a meeting record
+    3. Extracts cards based on requested_card_types (placeholder for LLM)
+    4. Creates a default canvas
+    5. Returns meeting with generated cards
+    
+    In async mode steps 1, 2 and 4 are committed immediately and the
+    response is 202 with a job to poll at GET /api/jobs/<job_id>.
+    """
+    data, error_response = _prepare_meeting_payload(request.get_json())
+    if error_response:
+        return error_response
+    
     # Extract cards from transcript using Gemini LLM
     try:
         extraction_service = get_extraction_service()
+        extraction_service.check_backend(data.get('extraction_backend'))
     except ValueError as e:
         logger.error(f"Failed to initialize extraction service: {e}")
         return jsonify({
@@ -133,56 +219,410 @@ def create_meeting():
         }), 500
     
     requested_types = [CardType(t) for t in data.get('requested_card_types', [CardType.TLDR.value, CardType.TODO.value])]
-    extracted_cards = extraction_service.extract_cards(
-        transcript=data['transcript'],
-        agenda_items=data.get('agenda_items'),
-        requested_types=requested_types
-    )
-    
-    # Create card records
-    for card_data in extracted_cards:
-        card = Card(
+    backend = data.get('extraction_backend')
+    
+    if data.get('async') is True or request.args.get('async') in ('1', 'true'):
+        backend = extraction_service.resolve_backend(backend)
+        if backend == 'llm':
+            try:
+                extraction_service.preprocessor.process(data['transcript'], record_stats=False)
+            except TokenBudgetExceeded as e:
+                return _token_budget_exceeded(e)
+        
+        meeting, canvas = _create_meeting_with_canvas(data)
+        job = ExtractionJob(
             meeting_id=meeting.id,
             canvas_id=canvas.id,
-            card_type=card_data["type"],
-            title=card_data["title"],
-            content=card_data["content"],
-            is_generated=True,
-            transcript_segment=card_data.get("segment"),
-            position_x=card_data.get("position_x", 0),
-            position_y=card_data.get("position_y", 0)
+            status=JobStatus.QUEUED,
+            requested_card_types=[t.value for t in requested_types],
+            callback_url=data.get('callback_url'),
+            extraction_backend=backend
         )
-        db.session.add(card)
-    
-    # Check for uncovered agenda items (placeholder)
-    if data.get('agenda_items'):
-        uncovered = extraction_service.find_uncovered_agenda_items(
-            agenda_items=data['agenda_items'],
-            transcript=data['transcript']
+        db.session.add(job)
+        db.session.commit()
+        job_queue.enqueue(job.id)
+        
+        response = jsonify({
+            'meeting_id': meeting.id,
+            'canvas_id': canvas.id,
+            'job': job_schema.dump(job),
+            'status_url': f"/api/jobs/{job.id}"
+        })
+        response.headers['Location'] = f"/api/jobs/{job.id}"
+        return response, 202
+    
+    # Extract before writing anything so no database transaction (and, on
+    # SQLite, no write lock) is held while waiting on the LLM
+    try:
+        extracted_cards, uncovered = extraction_service.analyze_meeting(
+            transcript=data['transcript'],
+            agenda_items=data.get('agenda_items'),
+            requested_types=requested_types,
+            backend=backend
         )
-        meeting.uncovered_agenda_items = uncovered
+    except UpstreamUnavailableError as e:
+        return _upstream_unavailable(e)
+    except TokenBudgetExceeded as e:
+        return _token_budget_exceeded(e)
+    
+    meeting, canvas = _create_meeting_with_canvas(data)
+    get_extraction_telemetry().attribute(meeting.id)
+    apply_extraction(meeting, canvas, extracted_cards, uncovered)
+    db.session.commit()
+    
+    return jsonify(meeting_detail_schema.dump(_load_meeting_detail(meeting.id))), 201
+
+def _upstream_unavailable(error):
+    """503 response for an LLM outage; nothing from the request is saved"""
+    db.session.rollback()
+    response = jsonify({
+        'error': 'LLM service unavailable',
+        'message': str(error)
+    })
+    if error.retry_after:
+        response.headers['Retry-After'] = str(max(1, int(error.retry_after)))
+    return response, 503
+
+def _token_budget_exceeded(error):
+    """413 response for a transcript over the token budget; nothing is saved"""
+    db.session.rollback()
+    return jsonify({
+        'error': 'Transcript too large',
+        'message': str(error),
+        'tokens': error.tokens,
+        'token_budget': error.budget
+    }), 413
+
+def _sse(event, payload):
+    """Format a Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+@bp.route('/stream', methods=['POST'])
+def create_meeting_stream():
+    """
+    Create a meeting and stream extracted cards back as Server-Sent Events.
+    
+    Accepts the same body as POST /api/meetings/. The meeting and canvas
+    are committed up front; each card is persisted as soon as Gemini has
+    produced it and is pushed to the client immediately.
+    
+    Events:
+    - meeting: the created meeting (without cards)
+    - card: one persisted card
+    - agenda: uncovered agenda items (only when agenda_items were given)
+    - error: extraction failed; cards already sent remain saved
+    - done: extraction finished
+    """
+    data, error_response = _prepare_meeting_payload(request.get_json())
+    if error_response:
+        return error_response
+    
+    try:
+        extraction_service = get_extraction_service()
+        backend = extraction_service.check_backend(data.get('extraction_backend'))
+    except ValueError as e:
+        logger.error(f"Failed to initialize extraction service: {e}")
+        return jsonify({
+            'error': 'LLM service not configured',
+            'message': str(e)
+        }), 500
+    
+    if backend == 'llm':
+        try:
+            extraction_service.preprocessor.process(data['transcript'], record_stats=False)
+        except TokenBudgetExceeded as e:
+            return _token_budget_exceeded(e)
     
+    meeting, canvas = _create_meeting_with_canvas(data)
     db.session.commit()
+    get_extraction_telemetry().attribute(meeting.id)
     
-    return jsonify(meeting_detail_schema.dump(meeting)), 201
+    requested_types = [CardType(t) for t in data.get('requested_card_types', [CardType.TLDR.value, CardType.TODO.value])]
+    
+    def generate():
+        yield _sse('meeting', meeting_schema.dump(meeting))
+        
+        card_count = 0
+        try:
+            for card_data in extraction_service.stream_cards(
+                transcript=meeting.transcript,
+                agenda_items=meeting.agenda_items,
+                requested_types=requested_types,
+                backend=backend
+            ):
+                card = add_generated_cards(meeting, canvas, [card_data])[0]
+                db.session.commit()
+                card_count += 1
+                yield _sse('card', card_schema.dump(card))
+        except Exception as e:
+            logger.error(f"Streaming extraction failed: {e}")
+            db.session.rollback()
+            yield _sse('error', {'error': 'Card extraction failed', 'message': str(e)})
+        
+        if meeting.agenda_items:
+            try:
+                meeting.uncovered_agenda_items = extraction_service.find_uncovered_agenda_items(
+                    agenda_items=meeting.agenda_items,
+                    transcript=meeting.transcript,
+                    backend=backend
+                )
+                db.session.commit()
+                yield _sse('agenda', {'uncovered_agenda_items': meeting.uncovered_agenda_items})
+            except UpstreamUnavailableError as e:
+                yield _sse('error', {'error': 'LLM service unavailable', 'message': str(e)})
+        
+        yield _sse('done', {'meeting_id': meeting.id, 'canvas_id': canvas.id, 'cards': card_count})
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@bp.route('/batch', methods=['POST'])
+def create_meetings_batch():
+    """
+    Create many meetings in one request and extract cards for each.
+    
+    Request body:
+    - meetings: List of meeting payloads, each as for POST /api/meetings/
+    - concurrency: Extractions to run at once (default and maximum:
+      BATCH_EXTRACTION_CONCURRENCY)
+    - async: Queue the extractions and return immediately (also ?async=1)
+    
+    Valid meetings are created together in one transaction, each with an
+    extraction job; invalid items are reported and skipped. Extractions then
+    run through the job worker logic with bounded concurrency, and an item
+    whose extraction fails keeps its meeting (re-extract it later). The
+    response lists per-item results and a throughput report; the status is
+    201 when every item succeeded, 207 when some failed and 400 when none
+    could be created.
+    """
+    started = time.perf_counter()
+    data = request.get_json() or {}
+    payloads = data.get('meetings')
+    max_batch = int(os.getenv('BATCH_MAX_MEETINGS', '100'))
+    if not isinstance(payloads, list) or not payloads:
+        return jsonify({"error": "meetings must be a non-empty list"}), 400
+    if len(payloads) > max_batch:
+        return jsonify({
+            "error": "Batch too large",
+            "message": f"At most {max_batch} meetings per batch"
+        }), 400
+    
+    try:
+        extraction_service = get_extraction_service()
+    except ValueError as e:
+        logger.error(f"Failed to initialize extraction service: {e}")
+        return jsonify({
+            'error': 'LLM service not configured',
+            'message': str(e)
+        }), 500
+    
+    max_concurrency = int(os.getenv('BATCH_EXTRACTION_CONCURRENCY', str(job_queue.max_workers)))
+    concurrency = data.get('concurrency') or max_concurrency
+    if not isinstance(concurrency, int) or concurrency < 1:
+        return jsonify({"error": "concurrency must be a positive integer"}), 400
+    concurrency = min(concurrency, max_concurrency)
+    run_async = data.get('async') is True or request.args.get('async') in ('1', 'true')
+    
+    results = [None] * len(payloads)
+    valid = []
+    for index, payload in enumerate(payloads):
+        if not isinstance(payload, dict):
+            results[index] = {'index': index, 'status': 'invalid', 'error': 'Meeting payload must be an object'}
+            continue
+        item, error_response = _prepare_meeting_payload(payload)
+        if error_response is None:
+            try:
+                item['extraction_backend'] = extraction_service.check_backend(item.get('extraction_backend'))
+            except ValueError as e:
+                error_response = jsonify({'error': 'LLM service not configured', 'message': str(e)}), 500
+        if error_response is None and item['extraction_backend'] == 'llm':
+            try:
+                extraction_service.preprocessor.process(item['transcript'], record_stats=False)
+            except TokenBudgetExceeded as e:
+                error_response = _token_budget_exceeded(e)
+        if error_response:
+            response, code = error_response
+            results[index] = {'index': index, 'status': 'invalid', 'http_status': code, 'error': response.get_json()}
+            continue
+        valid.append((index, item))
+    
+    # Create every valid meeting, canvas and job in one transaction
+    meetings = [
+        Meeting(
+            title=item['title'],
+            description=item.get('description'),
+            transcript=item['transcript'],
+            agenda_items=item.get('agenda_items'),
+            meeting_date=item['meeting_date']
+        )
+        for _, item in valid
+    ]
+    db.session.add_all(meetings)
+    db.session.flush()
+    canvases = [
+        Canvas(meeting_id=meeting.id, title=f"{meeting.title} - Canvas", description="Main canvas for meeting cards")
+        for meeting in meetings
+    ]
+    db.session.add_all(canvases)
+    db.session.flush()
+    jobs = [
+        ExtractionJob(
+            meeting_id=meeting.id,
+            canvas_id=canvas.id,
+            status=JobStatus.QUEUED,
+            requested_card_types=item.get('requested_card_types', [CardType.TLDR.value, CardType.TODO.value]),
+            callback_url=item.get('callback_url'),
+            extraction_backend=item['extraction_backend']
+        )
+        for meeting, canvas, (_, item) in zip(meetings, canvases, valid)
+    ]
+    db.session.add_all(jobs)
+    db.session.commit()
+    created_seconds = time.perf_counter() - started
+    
+    job_ids = [job.id for job in jobs]
+    if run_async:
+        for job_id in job_ids:
+            job_queue.enqueue(job_id)
+    else:
+        job_queue.run_batch(job_ids, max_workers=concurrency)
+        db.session.expire_all()
+    
+    jobs_by_id = {job.id: job for job in ExtractionJob.query.filter(ExtractionJob.id.in_(job_ids)).all()} if job_ids else {}
+    for (index, _), meeting, job_id in zip(valid, meetings, job_ids):
+        job = jobs_by_id[job_id]
+        result = {
+            'index': index,
+            'meeting_id': meeting.id,
+            'canvas_id': job.canvas_id,
+            'job_id': job_id,
+            'status_url': f"/api/jobs/{job_id}",
+        }
+        if run_async:
+            result['status'] = 'queued'
+        elif job.status == JobStatus.SUCCEEDED:
+            result.update(status='created', cards_created=job.cards_created)
+        else:
+            result.update(status='extraction_failed', error=job.error)
+        results[index] = result
+    
+    elapsed = time.perf_counter() - started
+    counts = {
+        status: sum(1 for r in results if r['status'] == status)
+        for status in ('created', 'queued', 'extraction_failed', 'invalid')
+    }
+    report = dict(
+        counts,
+        total=len(payloads),
+        concurrency=concurrency,
+        cards_created=sum(r.get('cards_created') or 0 for r in results),
+        create_seconds=round(created_seconds, 3),
+        elapsed_seconds=round(elapsed, 3),
+        meetings_per_second=round(len(valid) / elapsed, 2) if elapsed > 0 else None,
+    )
+    logger.info(f"Batch of {len(payloads)} meetings: {counts} in {elapsed:.2f}s")
+    
+    if not valid:
+        status_code = 400
+    elif run_async:
+        status_code = 202
+    elif counts['created'] == len(payloads):
+        status_code = 201
+    else:
+        status_code = 207
+    return jsonify({'items': results, 'report': report}), status_code
 
 @bp.route('/', methods=['GET'])
 def list_meetings():
-    """List all meetings"""
-    skip = request.args.get('skip', 0, type=int)
-    limit = request.args.get('limit', 100, type=int)
+    """
+    List all meetings (skip/limit, or cursor for keyset pages).
     
-    meetings = Meeting.query.offset(skip).limit(limit).all()
-    return jsonify(meetings_schema.dump(meetings))
+    Transcripts are summarized (length, word count, hash and a preview cut
+    in SQL), so the full text is never loaded for a page of meetings.
+    """
+    selection, error = select_fields(meeting_list_projection)
+    if error:
+        return error
+    
+    query = Meeting.query.options(*selection.options())
+    return paginated_response(query, Meeting, selection.schema(many=True))
 
 @bp.route('/<int:meeting_id>', methods=['GET'])
 def get_meeting(meeting_id):
-    """Get a specific meeting with all cards and canvases"""
+    """Get a specific meeting with all cards and canvases (narrowed by ?fields= / ?include=)"""
+    selection, error = select_fields(meeting_detail_projection)
+    if error:
+        return error
+    
+    meeting = _load_meeting_detail(meeting_id, selection)
+    if not meeting:
+        return jsonify({"error": "Meeting not found"}), 404
+    
+    return jsonify(selection.schema().dump(meeting))
+
+@bp.route('/<int:meeting_id>/transcript', methods=['GET'])
+def get_transcript(meeting_id):
+    """
+    The meeting transcript as UTF-8 text/plain.
+    
+    The ETag is the transcript hash, so If-None-Match gives 304 when
+    unchanged. Range requests (bytes) return 206 with the requested slice;
+    If-Range with the ETag keeps a resumed download consistent.
+    """
+    row = db.session.query(Meeting.transcript, Meeting.transcript_hash).filter_by(id=meeting_id).first()
+    if not row:
+        return jsonify({"error": "Meeting not found"}), 404
+    
+    transcript_hash = row.transcript_hash
+    if transcript_hash is None:
+        # Live appends clear the hash; store it unless another append has
+        # changed the transcript since it was read
+        transcript_hash = transcript_stats(row.transcript)[2]
+        Meeting.query.filter(
+            Meeting.id == meeting_id,
+            Meeting.transcript_hash.is_(None),
+            Meeting.transcript_length == len(row.transcript),
+        ).update(
+            # Keep updated_at: the transcript itself has not changed
+            {Meeting.transcript_hash: transcript_hash, Meeting.updated_at: Meeting.updated_at},
+            synchronize_session=False,
+        )
+        db.session.commit()
+    
+    data = row.transcript.encode('utf-8')
+    response = Response(data, mimetype='text/plain')
+    response.set_etag(transcript_hash)
+    try:
+        return response.make_conditional(request, accept_ranges=True, complete_length=len(data))
+    except RequestedRangeNotSatisfiable:
+        response = jsonify({"error": "Requested range not satisfiable", "length": len(data)})
+        response.status_code = 416
+        response.headers['Content-Range'] = f"bytes */{len(data)}"
+        return response
+
+@bp.route('/<int:meeting_id>/agenda-coverage', methods=['GET'])
+def get_agenda_coverage(meeting_id):
+    """
+    Score how well each agenda item is covered by the transcript.
+    
+    Computed locally (TF-IDF over transcript windows, no LLM call). Each item
+    has a 0-1 score, a status (covered, uncovered, or ambiguous when the
+    score falls between the thresholds) and the best-matching span.
+    """
     meeting = Meeting.query.get(meeting_id)
     if not meeting:
         return jsonify({"error": "Meeting not found"}), 404
     
-    return jsonify(meeting_detail_schema.dump(meeting))
+    coverage = AgendaCoverage.from_env()
+    return jsonify({
+        'meeting_id': meeting.id,
+        'covered_threshold': coverage.covered_threshold,
+        'uncovered_threshold': coverage.uncovered_threshold,
+        'items': coverage.score(meeting.agenda_items or [], meeting.transcript)
+    })
 
 @bp.route('/<int:meeting_id>', methods=['PUT'])
 def update_meeting(meeting_id):
@@ -223,28 +663,46 @@ def reextract_cards(meeting_id):
     """
     Re-extract cards from meeting transcript.
     Useful when user wants to extract different card types.
+    
+    Request body:
+    - requested_card_types: Card types to extract
+    - incremental: Merge with existing generated cards instead of
+      replacing them all (keeps ids, positions and edits)
+    - only_missing: With incremental, skip requested types that already
+      have generated cards
+    - extraction_backend: llm, heuristic or auto (default: server setting)
     """
     meeting = Meeting.query.get(meeting_id)
     if not meeting:
         return jsonify({"error": "Meeting not found"}), 404
+    get_extraction_telemetry().attribute(meeting.id)
     
     data = request.get_json()
+    backend = data.get('extraction_backend')
+    if backend is not None and backend not in EXTRACTION_BACKENDS:
+        return jsonify({
+            "error": "Invalid extraction_backend",
+            "message": f"Must be one of: {', '.join(EXTRACTION_BACKENDS)}"
+        }), 400
     requested_card_types = [CardType(t) for t in data.get('requested_card_types', [])]
+    incremental = bool(data.get('incremental') or data.get('only_missing'))
     
-    # Get or create canvas
-    canvas = Canvas.query.filter_by(meeting_id=meeting_id).first()
-    if not canvas:
-        canvas = Canvas(
-            meeting_id=meeting.id,
-            title=f"{meeting.title} - Canvas",
-            description="Main canvas for meeting cards"
-        )
-        db.session.add(canvas)
-        db.session.flush()
+    if data.get('only_missing'):
+        present = set(existing_generated_types(meeting))
+        requested_card_types = [t for t in requested_card_types if t not in present]
+    
+    canvas = _get_or_create_canvas(meeting)
+    
+    if incremental and not requested_card_types:
+        db.session.commit()
+        result = meeting_detail_schema.dump(_load_meeting_detail(meeting_id))
+        result['reextract_summary'] = {'created': 0, 'unchanged': 0, 'removed': 0, 'kept_modified': 0}
+        return jsonify(result)
     
     # Extract new cards using Gemini LLM
     try:
         extraction_service = get_extraction_service()
+        extraction_service.check_backend(backend)
     except ValueError as e:
         logger.error(f"Failed to initialize extraction service: {e}")
         return jsonify({
@@ -252,30 +710,97 @@ def reextract_cards(meeting_id):
             'message': str(e)
         }), 500
     
-    extracted_cards = extraction_service.extract_cards(
-        transcript=meeting.transcript,
-        agenda_items=meeting.agenda_items,
-        requested_types=requested_card_types
-    )
+    # Commit a newly created canvas so no transaction is open during the LLM call
+    transcript, agenda_items = meeting.transcript, meeting.agenda_items
+    db.session.commit()
+    try:
+        extracted_cards = extraction_service.extract_cards(
+            transcript=transcript,
+            agenda_items=agenda_items,
+            requested_types=requested_card_types,
+            backend=backend
+        )
+    except UpstreamUnavailableError as e:
+        return _upstream_unavailable(e)
+    except TokenBudgetExceeded as e:
+        return _token_budget_exceeded(e)
+    
+    if incremental:
+        summary = upsert_generated_cards(meeting, canvas, extracted_cards, requested_card_types)
+        db.session.commit()
+        
+        result = meeting_detail_schema.dump(_load_meeting_detail(meeting_id))
+        result['reextract_summary'] = summary
+        return jsonify(result)
     
     # Delete old generated cards
     Card.query.filter_by(meeting_id=meeting_id, is_generated=True).delete()
     
     # Create new card records
-    for card_data in extracted_cards:
-        card = Card(
-            meeting_id=meeting.id,
-            canvas_id=canvas.id,
-            card_type=card_data["type"],
-            title=card_data["title"],
-            content=card_data["content"],
-            is_generated=True,
-            transcript_segment=card_data.get("segment"),
-            position_x=card_data.get("position_x", 0),
-            position_y=card_data.get("position_y", 0)
-        )
-        db.session.add(card)
+    add_generated_cards(meeting, canvas, extracted_cards)
     
     db.session.commit()
     
-    return jsonify(meeting_detail_schema.dump(meeting))
+    return jsonify(meeting_detail_schema.dump(_load_meeting_detail(meeting_id)))
+
+@bp.route('/<int:meeting_id>/transcript/append', methods=['POST'])
+def append_transcript(meeting_id):
+    """
+    Append live transcript text to a meeting and extract cards from it.
+    
+    The text is committed before extraction runs, so it is never lost to an
+    LLM failure; chunks that could not be extracted are retried with the
+    next append. Extraction waits until enough new text has accumulated.
+    
+    Request body:
+    - text: Transcript text to append (required)
+    - sequence: Optional client sequence number; re-sending one is a no-op
+    - extract: Run delta extraction (default true)
+    - requested_card_types: Card types to extract
+      (default todo, action_item, decision, question)
+    """
+    meeting = Meeting.query.get(meeting_id)
+    if not meeting:
+        return jsonify({"error": "Meeting not found"}), 404
+    get_extraction_telemetry().attribute(meeting.id)
+    
+    data = request.get_json() or {}
+    text = data.get('text')
+    if not isinstance(text, str) or not text.strip():
+        return jsonify({"error": "text is required"}), 400
+    
+    sequence = data.get('sequence')
+    if sequence is not None and (not isinstance(sequence, int) or isinstance(sequence, bool)):
+        return jsonify({"error": "sequence must be an integer"}), 400
+    
+    try:
+        requested_types = [CardType(t) for t in data.get('requested_card_types') or []] or LIVE_DEFAULT_TYPES
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    chunk, created = append_transcript_chunk(meeting, text.strip(), sequence)
+    db.session.commit()
+    
+    result = {'chunk': chunk_schema.dump(chunk), 'extraction': {'status': 'skipped', 'cards': []}}
+    if not created:
+        return jsonify(result), 200
+    
+    if data.get('extract', True):
+        canvas = _get_or_create_canvas(meeting)
+        try:
+            extraction_service = get_extraction_service()
+            extraction_service.check_backend('llm')
+            outcome = extract_pending_chunks(meeting, canvas, requested_types, extraction_service)
+            result['extraction'] = {
+                'status': outcome['status'],
+                'pending_chars': outcome['pending_chars'],
+                'cards': [card_schema.dump(card) for card in outcome['cards']]
+            }
+        except (ValueError, UpstreamUnavailableError) as e:
+            # Includes a missing API key and TokenBudgetExceeded
+            logger.error(f"Live extraction failed for meeting {meeting_id}: {e}")
+            db.session.rollback()
+            result['extraction'] = {'status': 'failed', 'error': str(e), 'cards': []}
+        result['chunk'] = chunk_schema.dump(chunk)
+    
+    return jsonify(result), 201
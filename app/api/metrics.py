@@ -0,0 +1,67 @@
+"""
+Metrics endpoints for the extraction pipeline
+"""
+
+from datetime import datetime, timedelta
+from flask import Blueprint, jsonify, request
+from app.services.extraction_service import get_existing_extraction_service
+from app.services.extraction_cache import get_extraction_cache
+from app.services.telemetry import get_extraction_telemetry
+
+bp = Blueprint('metrics', __name__)
+
+@bp.route('/gemini', methods=['GET'])
+def gemini_metrics():
+    """
+    Gemini client statistics.
+    
+    Connection pool usage (connections opened, idle, peak in-flight requests)
+    is reported so the pool can be sized against the number of workers,
+    alongside rate limiter, adaptive concurrency and circuit breaker state,
+    the prompt tokens saved by transcript preprocessing, how many
+    duplicate extractions were coalesced, how often the heuristic
+    extractor ran instead of Gemini, how many agenda items were scored
+    locally rather than sent to Gemini and how often each model route was
+    chosen, with its call count, errors and latency.
+    """
+    service = get_existing_extraction_service()
+    
+    return jsonify({
+        'configured': service is not None,
+        'pool': service.client.pool_stats() if service and service.client else None,
+        'resilience': service.client.resilience_stats() if service and service.client else None,
+        'preprocessing': service.preprocessor.stats() if service else None,
+        'single_flight': service.single_flight.stats() if service and service.single_flight else None,
+        'backends': service.backend_stats() if service else None,
+        'routes': service.router.stats() if service else None,
+        'cache': get_extraction_cache().stats()
+    })
+
+
+@bp.route('/extraction', methods=['GET'])
+def extraction_metrics():
+    """
+    Recorded LLM calls aggregated per prompt kind.
+    
+    Query params:
+    - hours: Window to aggregate over (default 24)
+    - kind: Only this prompt kind (e.g. cards, uncovered_agenda)
+    
+    Latency percentiles, token totals, retries, outcomes and estimated cost
+    per kind, plus the meetings that used the most tokens.
+    """
+    try:
+        hours = float(request.args.get('hours', 24))
+    except ValueError:
+        return jsonify({"error": "hours must be a number"}), 400
+    if hours <= 0:
+        return jsonify({"error": "hours must be positive"}), 400
+    
+    telemetry = get_extraction_telemetry()
+    summary = telemetry.summary(
+        since=datetime.utcnow() - timedelta(hours=hours),
+        kind=request.args.get('kind')
+    )
+    summary['hours'] = hours
+    summary['recorder'] = telemetry.stats()
+    return jsonify(summary)
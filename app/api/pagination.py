@@ -0,0 +1,88 @@
+"""
+Pagination for list endpoints.
+
+Lists are ordered by (created_at, id) so pages are stable. Passing cursor
+switches to keyset pagination: the next page starts after the last row of
+the previous one instead of skipping rows, so every page costs the same no
+matter how deep it is and concurrent inserts do not shift rows between
+pages. The response becomes {"items": [...], "next_cursor": ...}; an empty
+cursor requests the first page and next_cursor is null on the last page.
+
+Without cursor, skip/limit behave as before and a plain list is returned.
+"""
+
+import json
+import base64
+import binascii
+from datetime import datetime
+
+from flask import request, jsonify
+from sqlalchemy import and_, or_
+
+DEFAULT_LIMIT = 100
+MAX_CURSOR_LIMIT = 1000
+
+
+class InvalidCursor(ValueError):
+    """Raised for a cursor that was not issued by encode_cursor"""
+
+
+def encode_cursor(created_at, row_id):
+    """Opaque token for the position after a row."""
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """(created_at, id) position from a cursor token."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+
+def keyset_page(query, model, cursor, limit):
+    """
+    One page of query after cursor, ordered by (created_at, id).
+
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        # The leading >= gives the planner an index range to seek into;
+        # a bare OR of the two cases makes SQLite scan the whole index.
+        query = query.filter(and_(
+            model.created_at >= created_at,
+            or_(model.created_at > created_at, model.id > row_id),
+        ))
+
+    rows = query.order_by(model.created_at, model.id).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+def paginated_response(query, model, schema):
+    """
+    JSON response for a list endpoint.
+
+    Uses keyset pagination when the request has a cursor parameter and
+    skip/limit otherwise; both are ordered by (created_at, id).
+    """
+    limit = request.args.get('limit', DEFAULT_LIMIT, type=int)
+    cursor = request.args.get('cursor')
+
+    if cursor is None:
+        skip = request.args.get('skip', 0, type=int)
+        rows = query.order_by(model.created_at, model.id).offset(skip).limit(limit).all()
+        return jsonify(schema.dump(rows))
+
+    limit = max(1, min(limit, MAX_CURSOR_LIMIT))
+    try:
+        rows, next_cursor = keyset_page(query, model, cursor, limit)
+    except InvalidCursor as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"items": schema.dump(rows), "next_cursor": next_cursor})
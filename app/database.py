@@ -5,3 +5,26 @@ from dotenv import load_dotenv
 load_dotenv()
 
 db = SQLAlchemy()
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+
+def upgrade_database():
+    """
+    Apply pending Alembic migrations; call inside an app context.
+    
+    An empty database is built from the migrations. A database created by
+    db.create_all() (tables but no alembic_version) is upgraded the same way:
+    the baseline revision only creates the tables it is missing, in their
+    baseline shape, so later revisions apply cleanly. When already at head
+    this is a single version lookup.
+    """
+    from alembic import command
+    from alembic.config import Config
+    
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    
+    with db.engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
@@ -1,11 +1,15 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
 import os
-from app.database import db
+from app.database import db, upgrade_database
 from app.api.meetings import bp as meetings_bp
 from app.api.cards import bp as cards_bp
 from app.api.canvas import bp as canvas_bp
 from app.api.google import bp as google_bp
+from app.api.metrics import bp as metrics_bp
+from app.api.jobs import bp as jobs_bp
+from app.services.job_queue import job_queue
+from app.services.telemetry import get_extraction_telemetry
 
 def create_app():
     """Application factory pattern"""
@@ -33,6 +37,12 @@ def create_app():
     # Initialize database
     db.init_app(app)
     
+    # Background extraction workers
+    job_queue.init_app(app)
+    
+    # Per-call LLM telemetry, written once per request or job
+    get_extraction_telemetry().init_app(app)
+    
     # CORS for frontend integration - allow Vercel domains
     cors_origins = ["*"]  # Allow all origins for now
     if os.getenv('VERCEL_URL'):
@@ -46,6 +56,8 @@ def create_app():
         app.register_blueprint(cards_bp, url_prefix='/api/cards')
         app.register_blueprint(canvas_bp, url_prefix='/api/canvas')
         app.register_blueprint(google_bp)  # Registers at /api/google
+        app.register_blueprint(metrics_bp, url_prefix='/api/metrics')
+        app.register_blueprint(jobs_bp, url_prefix='/api/jobs')
     except Exception as e:
         app.logger.error(f"Error registering blueprints: {e}")
     
@@ -84,11 +96,17 @@ def create_app():
             "vercel": bool(os.getenv('VERCEL'))
         })
     
-    # Create tables - but only if not on Vercel serverless
-    # Vercel has read-only filesystem, so skip table creation
+    # Apply schema migrations - but only if not on Vercel serverless
+    # (run setup_vercel_db.py there). DB_AUTO_MIGRATE=0 leaves it to
+    # `alembic upgrade head` when several workers boot at once.
     if not os.getenv('VERCEL'):
         with app.app_context():
-            db.create_all()
+            if os.getenv('DB_AUTO_MIGRATE', '1') == '1':
+                upgrade_database()
+            
+            # Resume extraction jobs queued or interrupted before a restart
+            if os.getenv('EXTRACTION_JOBS_RECOVER', '1') == '1':
+                job_queue.recover()
     
     return app
 
@@ -1,5 +1,7 @@
 from datetime import datetime
 import enum
+import hashlib
+from sqlalchemy import event
 from app.database import db
 
 class CardType(str, enum.Enum):
@@ -20,6 +22,13 @@ class CardStatus(str, enum.Enum):
     COMPLETED = "completed"
     ARCHIVED = "archived"
 
+class JobStatus(str, enum.Enum):
+    """Status of background extraction jobs"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
 class Meeting(db.Model):
     """Meeting model - stores meeting metadata and transcript"""
     __tablename__ = "meetings"
@@ -27,7 +36,13 @@ class Meeting(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text, nullable=True)
-    transcript = db.Column(db.Text, nullable=False)
+    # Deferred: loaded on first access, not with every meeting row
+    transcript = db.deferred(db.Column(db.Text, nullable=False))
+    transcript_length = db.Column(db.Integer, nullable=True)  # Characters
+    transcript_word_count = db.Column(db.Integer, nullable=True)
+    transcript_hash = db.Column(db.String(64), nullable=True)  # SHA-256 of the UTF-8 text
+    # First characters of the transcript, selected only by queries that ask for it
+    transcript_preview = db.query_expression()
     agenda_items = db.Column(db.JSON, nullable=True)  # List of agenda items
     uncovered_agenda_items = db.Column(db.JSON, nullable=True)  # Items not covered
     meeting_date = db.Column(db.DateTime, nullable=False)
@@ -37,6 +52,23 @@ class Meeting(db.Model):
     # Relationships
     cards = db.relationship("Card", back_populates="meeting", cascade="all, delete-orphan")
     canvases = db.relationship("Canvas", back_populates="meeting", cascade="all, delete-orphan")
+    
+    # List endpoints page in (created_at, id) order
+    __table_args__ = (db.Index("ix_meetings_created_at_id", "created_at", "id"),)
+    
+    def update_transcript_stats(self):
+        """Recompute the transcript summary columns, e.g. after an in-SQL update"""
+        self.transcript_length, self.transcript_word_count, self.transcript_hash = transcript_stats(self.transcript)
+
+def transcript_stats(transcript):
+    """(length, word count, SHA-256 hex) of a transcript"""
+    if transcript is None:
+        return None, None, None
+    return len(transcript), len(transcript.split()), hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+
+@event.listens_for(Meeting.transcript, "set")
+def _transcript_set(meeting, value, oldvalue, initiator):
+    meeting.transcript_length, meeting.transcript_word_count, meeting.transcript_hash = transcript_stats(value)
 
 class Card(db.Model):
     """Card model - extracted or manually created items"""
@@ -73,6 +105,13 @@ class Card(db.Model):
     canvas = db.relationship("Canvas", back_populates="cards")
     parent_card = db.relationship("Card", remote_side=[id], backref="child_cards")
     updates = db.relationship("CardUpdate", back_populates="card", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        db.Index("ix_cards_created_at_id", "created_at", "id"),
+        db.Index("ix_cards_meeting_id_is_generated", "meeting_id", "is_generated"),  # Re-extraction filters
+        db.Index("ix_cards_canvas_id", "canvas_id"),
+        db.Index("ix_cards_parent_card_id", "parent_card_id"),
+    )
 
 class Canvas(db.Model):
     """Canvas model - workspace for organizing cards"""
@@ -90,6 +129,11 @@ class Canvas(db.Model):
     # Relationships
     meeting = db.relationship("Meeting", back_populates="canvases")
     cards = db.relationship("Card", back_populates="canvas", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        db.Index("ix_canvases_created_at_id", "created_at", "id"),
+        db.Index("ix_canvases_meeting_id", "meeting_id"),
+    )
 
 class CardUpdate(db.Model):
     """Card update model - tracks updates and pings between users"""
@@ -107,3 +151,83 @@ class CardUpdate(db.Model):
     
     # Relationships
     card = db.relationship("Card", back_populates="updates")
+    
+    # Updates are listed per card, newest first
+    __table_args__ = (db.Index("ix_card_updates_card_id_created_at", "card_id", "created_at"),)
+
+class ExtractionCacheEntry(db.Model):
+    """Extraction cache entry - persisted LLM results keyed by input hash"""
+    __tablename__ = "extraction_cache"
+    
+    key = db.Column(db.String(64), primary_key=True)  # SHA-256 of the extraction input
+    kind = db.Column(db.String(50), nullable=False)  # e.g. "cards", "uncovered_agenda"
+    payload = db.Column(db.JSON, nullable=False)
+    hits = db.Column(db.Integer, default=0)
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+class ExtractionJob(db.Model):
+    """Extraction job model - card extraction queued for background workers"""
+    __tablename__ = "extraction_jobs"
+    
+    id = db.Column(db.Integer, primary_key=True)
+    meeting_id = db.Column(db.Integer, db.ForeignKey("meetings.id"), nullable=False, index=True)
+    canvas_id = db.Column(db.Integer, db.ForeignKey("canvases.id"), nullable=True)
+    
+    status = db.Column(db.Enum(JobStatus), default=JobStatus.QUEUED, nullable=False, index=True)
+    requested_card_types = db.Column(db.JSON, nullable=True)  # List of card type values
+    callback_url = db.Column(db.String(2048), nullable=True)  # Optional webhook
+    extraction_backend = db.Column(db.String(16), nullable=True)  # llm, heuristic or auto; None: server default
+    
+    attempts = db.Column(db.Integer, default=0)
+    cards_created = db.Column(db.Integer, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    callback_status = db.Column(db.Integer, nullable=True)  # HTTP status of the webhook call
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    
+    # Relationships
+    meeting = db.relationship("Meeting", backref=db.backref("extraction_jobs", cascade="all, delete-orphan"))
+
+class TranscriptChunk(db.Model):
+    """Transcript chunk model - text appended to a live meeting's transcript"""
+    __tablename__ = "transcript_chunks"
+    __table_args__ = (db.UniqueConstraint("meeting_id", "sequence"),)
+    
+    id = db.Column(db.Integer, primary_key=True)
+    meeting_id = db.Column(db.Integer, db.ForeignKey("meetings.id"), nullable=False, index=True)
+    
+    sequence = db.Column(db.Integer, nullable=False)  # Order within the meeting
+    text = db.Column(db.Text, nullable=False)
+    start_offset = db.Column(db.Integer, nullable=False)  # Character offset in Meeting.transcript
+    extracted = db.Column(db.Boolean, default=False, nullable=False)  # Sent to delta extraction
+    cards_created = db.Column(db.Integer, default=0)
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Relationships
+    meeting = db.relationship(
+        "Meeting",
+        backref=db.backref("transcript_chunks", cascade="all, delete-orphan", order_by="TranscriptChunk.sequence")
+    )
+
+class ExtractionCall(db.Model):
+    """Extraction call model - telemetry for one LLM call or cache hit"""
+    __tablename__ = "extraction_calls"
+    
+    id = db.Column(db.Integer, primary_key=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    kind = db.Column(db.String(32), nullable=False, index=True)  # Prompt kind, e.g. "cards"
+    model = db.Column(db.String(64), nullable=True)
+    meeting_id = db.Column(db.Integer, nullable=True, index=True)  # No FK: kept after a meeting is deleted
+    
+    latency_ms = db.Column(db.Integer, nullable=False)
+    input_tokens = db.Column(db.Integer, nullable=True)  # From usageMetadata when the API reports it
+    output_tokens = db.Column(db.Integer, nullable=True)
+    retries = db.Column(db.SmallInteger, default=0, nullable=False)
+    cache_hit = db.Column(db.Boolean, default=False, nullable=False)
+    outcome = db.Column(db.String(16), nullable=False)  # success, cache_hit, unavailable, error or cancelled
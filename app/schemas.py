@@ -1,5 +1,14 @@
-from marshmallow import Schema, fields, validate, EXCLUDE, post_dump
+from marshmallow import Schema, fields, validate, EXCLUDE, post_dump, ValidationError
 from app.models import CardType, CardStatus
+from app.services.extraction_service import EXTRACTION_BACKENDS
+from app.services.webhooks import validate_callback_url
+
+def _validate_callback_url(value):
+    """Reject webhook URLs that are not https or resolve to internal addresses"""
+    try:
+        validate_callback_url(value)
+    except ValueError as e:
+        raise ValidationError(str(e))
 
 # Meeting Schemas
 class MeetingSchema(Schema):
@@ -8,6 +17,9 @@ class MeetingSchema(Schema):
     title = fields.Str(required=True)
     description = fields.Str(allow_none=True)
     transcript = fields.Str(required=True)
+    transcript_length = fields.Int(allow_none=True, dump_only=True)
+    transcript_word_count = fields.Int(allow_none=True, dump_only=True)
+    transcript_hash = fields.Str(allow_none=True, dump_only=True)
     agenda_items = fields.List(fields.Str(), allow_none=True)
     uncovered_agenda_items = fields.List(fields.Str(), allow_none=True, dump_only=True)
     meeting_date = fields.DateTime(required=True)
@@ -17,6 +29,14 @@ class MeetingSchema(Schema):
     class Meta:
         unknown = EXCLUDE
 
+class MeetingSummarySchema(MeetingSchema):
+    """Meeting in a list: transcript summarized, full text via GET /api/meetings/<id>/transcript"""
+    transcript_preview = fields.Str(allow_none=True, dump_only=True)
+    
+    class Meta:
+        unknown = EXCLUDE
+        exclude = ("transcript",)
+
 class MeetingCreateSchema(Schema):
     """Schema for creating a new meeting"""
     title = fields.Str(required=True)
@@ -28,6 +48,8 @@ class MeetingCreateSchema(Schema):
         fields.Str(validate=validate.OneOf([t.value for t in CardType])),
         load_default=[CardType.TLDR.value, CardType.TODO.value, CardType.ACTION_ITEM.value]
     )
+    callback_url = fields.Url(allow_none=True, require_tld=False, validate=_validate_callback_url)
+    extraction_backend = fields.Str(validate=validate.OneOf(EXTRACTION_BACKENDS), allow_none=True)
     
     class Meta:
         unknown = EXCLUDE
@@ -115,7 +137,52 @@ class CardDetailSchema(CardSchema):
     updates = fields.List(fields.Nested(CardUpdateSchema), dump_only=True)
     child_cards = fields.List(fields.Nested(CardSchema), dump_only=True)
 
+class MeetingCanvasSchema(CanvasSchema):
+    """Canvas inside a meeting detail; its cards are referenced by id, not repeated"""
+    card_ids = fields.Method("get_card_ids", dump_only=True)
+    
+    def get_card_ids(self, obj):
+        return [card.id for card in obj.cards]
+    
+    class Meta:
+        unknown = EXCLUDE
+        exclude = ("cards",)
+
 class MeetingDetailSchema(MeetingSchema):
     """Extended meeting schema with cards"""
     cards = fields.List(fields.Nested(CardSchema), dump_only=True)
-    canvases = fields.List(fields.Nested(CanvasSchema), dump_only=True)
+    canvases = fields.List(fields.Nested(MeetingCanvasSchema), dump_only=True)
+
+# Extraction Job Schemas
+class ExtractionJobSchema(Schema):
+    """Schema for background extraction job serialization"""
+    id = fields.Int(dump_only=True)
+    meeting_id = fields.Int(dump_only=True)
+    canvas_id = fields.Int(dump_only=True)
+    status = fields.Method("serialize_status", dump_only=True)
+    requested_card_types = fields.List(fields.Str(), dump_only=True)
+    callback_url = fields.Str(allow_none=True, dump_only=True)
+    extraction_backend = fields.Str(allow_none=True, dump_only=True)
+    attempts = fields.Int(dump_only=True)
+    cards_created = fields.Int(allow_none=True, dump_only=True)
+    error = fields.Str(allow_none=True, dump_only=True)
+    callback_status = fields.Int(allow_none=True, dump_only=True)
+    created_at = fields.DateTime(dump_only=True)
+    started_at = fields.DateTime(allow_none=True, dump_only=True)
+    finished_at = fields.DateTime(allow_none=True, dump_only=True)
+    
+    def serialize_status(self, obj):
+        """Serialize status enum to string value"""
+        return obj.status.value if hasattr(obj.status, 'value') else obj.status
+
+# Live Transcript Schemas
+class TranscriptChunkSchema(Schema):
+    """Schema for appended transcript chunks"""
+    id = fields.Int(dump_only=True)
+    meeting_id = fields.Int(dump_only=True)
+    sequence = fields.Int(dump_only=True)
+    text = fields.Str(dump_only=True)
+    start_offset = fields.Int(dump_only=True)
+    extracted = fields.Bool(dump_only=True)
+    cards_created = fields.Int(dump_only=True)
+    created_at = fields.DateTime(dump_only=True)
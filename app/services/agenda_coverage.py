@@ -0,0 +1,203 @@
+"""
+Agenda Coverage - local TF-IDF scoring of agenda items against a transcript.
+
+Whether an agenda item was discussed is mostly a lexical question, so the
+transcript is split into short overlapping windows of speaker turns and
+each agenda item is scored by its best cosine similarity to a window under
+TF-IDF weighting (stemmed words plus word bigrams). Scores above
+covered_threshold count as covered, scores below uncovered_threshold as not
+covered; only the ambiguous items in between need an LLM call.
+
+Only the agenda terms become matrix columns: window norms are taken over
+all of a window's terms, so the cosine is exact while the matrix stays
+windows x agenda-vocabulary instead of windows x transcript-vocabulary.
+"""
+
+import os
+import re
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+_SUFFIXES = ("ations", "ation", "ments", "ment", "ings", "ing", "ies", "ied", "ed", "es", "ly", "s")
+
+_STOPWORDS = {
+    "a", "an", "the", "and", "or", "but", "if", "of", "to", "in", "on", "at", "by", "for", "with",
+    "from", "as", "is", "are", "was", "were", "be", "been", "it", "its", "this", "that", "these",
+    "those", "we", "i", "you", "he", "she", "they", "our", "your", "their", "me", "us", "them",
+    "do", "does", "did", "have", "has", "had", "will", "would", "can", "could", "should", "so",
+    "not", "no", "yes", "ok", "okay", "yeah", "um", "uh", "just", "about", "what", "which", "who",
+    "there", "here", "then", "also", "all", "any", "some", "let's", "i'm", "i'll", "we'll", "it's",
+}
+
+COVERED = "covered"
+UNCOVERED = "uncovered"
+AMBIGUOUS = "ambiguous"
+
+
+def _stem(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[: -len(suffix)]
+            if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "aeiouls":
+                word = word[:-1]  # planned -> plan, shipping -> ship
+            break
+    return word[:8]
+
+
+def _terms(text: str) -> List[str]:
+    """Stemmed content words followed by adjacent-word bigrams."""
+    stems = [_stem(w) for w in _WORD.findall(text.lower()) if w not in _STOPWORDS]
+    return stems + [f"{a} {b}" for a, b in zip(stems, stems[1:])]
+
+
+class AgendaCoverage:
+    """
+    Scores agenda items against transcript windows with NumPy.
+    """
+
+    def __init__(
+        self,
+        covered_threshold: float = 0.3,
+        uncovered_threshold: float = 0.1,
+        window_turns: int = 2,
+        max_turn_chars: int = 400,
+    ):
+        self.covered_threshold = covered_threshold
+        self.uncovered_threshold = uncovered_threshold
+        self.window_turns = max(1, window_turns)
+        self.max_turn_chars = max_turn_chars
+
+    @classmethod
+    def from_env(cls) -> "AgendaCoverage":
+        return cls(
+            covered_threshold=float(os.getenv("AGENDA_COVERED_THRESHOLD", "0.3")),
+            uncovered_threshold=float(os.getenv("AGENDA_UNCOVERED_THRESHOLD", "0.1")),
+            window_turns=int(os.getenv("AGENDA_WINDOW_TURNS", "2")),
+        )
+
+    def score(self, agenda_items: List[str], transcript: str) -> List[Dict]:
+        """
+        Score each agenda item against the transcript.
+
+        Returns one dict per item, in order, with item, score (0-1), status
+        (covered, uncovered or ambiguous) and span (start, end and text of
+        the best-matching window, or None when nothing matched).
+        """
+        if not agenda_items:
+            return []
+
+        turns = self._turns(transcript)
+        item_terms = [_terms(item) for item in agenda_items]
+        if not turns or not any(item_terms):
+            return [self._result(item, 0.0, None, transcript) for item in agenda_items]
+
+        # Term ids: agenda terms first, so agenda columns are 0..n_agenda-1
+        ids: Dict[str, int] = {}
+        for terms in item_terms:
+            for term in terms:
+                ids.setdefault(term, len(ids))
+        n_agenda = len(ids)
+
+        occurrence_turns = []
+        occurrence_terms = []
+        for index, (start, end) in enumerate(turns):
+            for term in _terms(transcript[start:end]):
+                occurrence_turns.append(index)
+                occurrence_terms.append(ids.setdefault(term, len(ids)))
+        occurrence_turns = np.asarray(occurrence_turns, dtype=np.int64)
+        occurrence_terms = np.asarray(occurrence_terms, dtype=np.int64)
+
+        # Each turn belongs to up to window_turns consecutive windows
+        window_size = min(self.window_turns, len(turns))
+        n_windows = len(turns) - window_size + 1
+        window_ids = np.concatenate([occurrence_turns - k for k in range(window_size)])
+        term_ids = np.tile(occurrence_terms, window_size)
+        valid = (window_ids >= 0) & (window_ids < n_windows)
+        window_ids, term_ids = window_ids[valid], term_ids[valid]
+
+        # Term frequency per (window, term) pair
+        pairs, tf = np.unique(window_ids * len(ids) + term_ids, return_counts=True)
+        pair_windows, pair_terms = pairs // len(ids), pairs % len(ids)
+
+        document_frequency = np.bincount(pair_terms, minlength=len(ids))
+        idf = np.log((1 + n_windows) / (1 + document_frequency)) + 1.0
+        weights = tf * idf[pair_terms]
+
+        window_norms = np.sqrt(np.bincount(pair_windows, weights=weights ** 2, minlength=n_windows))
+        window_norms[window_norms == 0] = 1.0
+
+        # Window matrix over agenda terms only, scaled by each window's full norm
+        agenda_pairs = pair_terms < n_agenda
+        window_matrix = np.zeros((n_windows, n_agenda), dtype=np.float64)
+        window_matrix[pair_windows[agenda_pairs], pair_terms[agenda_pairs]] = weights[agenda_pairs]
+        window_matrix /= window_norms[:, None]
+
+        item_matrix = np.zeros((len(agenda_items), n_agenda), dtype=np.float64)
+        for row, terms in enumerate(item_terms):
+            for term in terms:
+                item_matrix[row, ids[term]] += 1
+        item_matrix *= idf[:n_agenda]
+        item_norms = np.linalg.norm(item_matrix, axis=1)
+        item_norms[item_norms == 0] = 1.0
+        item_matrix /= item_norms[:, None]
+
+        similarity = item_matrix @ window_matrix.T
+        best = similarity.argmax(axis=1)
+        scores = similarity[np.arange(len(agenda_items)), best]
+
+        results = []
+        for item, score, index in zip(agenda_items, scores, best):
+            window = (turns[index][0], turns[index + window_size - 1][1]) if score > 0 else None
+            results.append(self._result(item, float(score), window, transcript))
+        return results
+
+    def classify(self, agenda_items: List[str], transcript: str) -> Tuple[List[str], List[str]]:
+        """Split agenda items into (uncovered, ambiguous); the rest are covered."""
+        results = self.score(agenda_items, transcript)
+        uncovered = [r["item"] for r in results if r["status"] == UNCOVERED]
+        ambiguous = [r["item"] for r in results if r["status"] == AMBIGUOUS]
+        return uncovered, ambiguous
+
+    def _result(self, item: str, score: float, window: Optional[Tuple[int, int]], transcript: str) -> Dict:
+        if score >= self.covered_threshold:
+            status = COVERED
+        elif score < self.uncovered_threshold:
+            status = UNCOVERED
+        else:
+            status = AMBIGUOUS
+        span = None
+        if window is not None:
+            start, end = window
+            span = {"start": start, "end": end, "text": transcript[start:end]}
+        return {"item": item, "score": round(score, 4), "status": status, "span": span}
+
+    def _turns(self, transcript: str) -> List[Tuple[int, int]]:
+        """Non-empty lines, with long lines split on sentence boundaries."""
+        turns = []
+        offset = 0
+        for line in transcript.splitlines(keepends=True):
+            stripped = line.strip()
+            if stripped:
+                start = offset + line.index(stripped)
+                if len(stripped) <= self.max_turn_chars:
+                    turns.append((start, start + len(stripped)))
+                else:
+                    turns.extend(self._split_long(stripped, start))
+            offset += len(line)
+        return turns
+
+    def _split_long(self, text: str, base: int) -> List[Tuple[int, int]]:
+        pieces = []
+        piece_start = 0
+        for boundary in _SENTENCE_BOUNDARY.finditer(text):
+            if boundary.start() - piece_start >= self.max_turn_chars // 2:
+                pieces.append((base + piece_start, base + boundary.start()))
+                piece_start = boundary.end()
+        pieces.append((base + piece_start, base + len(text)))
+        return pieces
@@ -0,0 +1,232 @@
+"""
+Extraction Cache - content-addressed storage for LLM extraction results.
+
+Results are keyed by a SHA-256 hash of everything that influences the
+prompt (template version, model, transcript, agenda and requested types),
+so identical inputs never pay for a second Gemini round trip.
+
+Two tiers are used:
+- An in-process LRU for hot entries (re-extract, retries, double submits)
+- A database table shared by all workers, with TTL based eviction
+
+The database tier reads and writes on its own short-lived connections and
+commits its writes immediately; it never touches the request's session. A
+cache lookup therefore leaves no transaction open while the LLM is called,
+and cache writes hold the (SQLite) write lock only for their own
+statements. Database hit counts are kept in memory and added to their rows
+with the next cache write.
+"""
+
+import os
+import copy
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from flask import has_app_context
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from app.database import db
+from app.models import ExtractionCacheEntry
+
+logger = logging.getLogger(__name__)
+
+_table = ExtractionCacheEntry.__table__
+
+
+class ExtractionCache:
+    """
+    Two-tier (memory LRU + database) cache for extraction results.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: int = 7 * 24 * 3600,
+        max_db_entries: int = 5000,
+        use_db: bool = True,
+        prune_every: int = 50,
+    ):
+        self.max_entries = max_entries
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_db_entries = max_db_entries
+        self.use_db = use_db
+        self.prune_every = prune_every
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._pending_hits: Dict[str, int] = {}
+        self._stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "writes": 0}
+
+    @staticmethod
+    def make_key(
+        kind: str,
+        prompt_version: str,
+        model: str,
+        transcript: str,
+        agenda_items: Optional[Iterable[str]] = None,
+        requested_types: Optional[Iterable[Any]] = None,
+    ) -> str:
+        """Build a stable content hash for an extraction request."""
+        types = sorted(getattr(t, "value", t) for t in (requested_types or []))
+        material = json.dumps(
+            {
+                "kind": kind,
+                "prompt_version": prompt_version,
+                "model": model,
+                "transcript": transcript,
+                "agenda_items": list(agenda_items or []),
+                "requested_types": types,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None on a miss."""
+        now = datetime.utcnow()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return copy.deepcopy(value)
+                del self._entries[key]
+
+        value = self._db_get(key, now)
+        if value is not None:
+            self._remember(key, value, now + self.ttl)
+            with self._lock:
+                self._stats["db_hits"] += 1
+            return copy.deepcopy(value)
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def set(self, key: str, kind: str, value: Any) -> None:
+        """Store a value in both tiers."""
+        now = datetime.utcnow()
+        expires_at = now + self.ttl
+        self._remember(key, copy.deepcopy(value), expires_at)
+        self._db_set(key, kind, value, now, expires_at)
+
+        with self._lock:
+            self._stats["writes"] += 1
+
+    def clear(self) -> None:
+        """Drop the in-process tier (the database tier expires on its own)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, memory_entries=len(self._entries))
+
+    def _remember(self, key: str, value: Any, expires_at: datetime) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _db_available(self) -> bool:
+        return self.use_db and has_app_context()
+
+    def _db_get(self, key: str, now: datetime) -> Optional[Any]:
+        if not self._db_available():
+            return None
+        try:
+            with db.engine.connect() as connection:
+                row = connection.execute(
+                    select(_table.c.payload, _table.c.expires_at).where(_table.c.key == key)
+                ).first()
+            if row is None or row.expires_at <= now:
+                return None
+            with self._lock:
+                self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+            return row.payload
+        except SQLAlchemyError as e:
+            logger.warning(f"Extraction cache lookup failed: {e}")
+            return None
+
+    def _db_set(
+        self,
+        key: str,
+        kind: str,
+        value: Any,
+        now: datetime,
+        expires_at: datetime,
+    ) -> None:
+        if not self._db_available():
+            return
+        values = {"kind": kind, "payload": value, "created_at": now, "expires_at": expires_at, "hits": 0}
+        try:
+            with db.engine.begin() as connection:
+                # Write first so the transaction never upgrades a read lock
+                updated = connection.execute(_table.update().where(_table.c.key == key).values(**values))
+                if not updated.rowcount:
+                    connection.execute(_table.insert().values(key=key, **values))
+                self._flush_hits(connection)
+            with self._lock:
+                self._writes += 1
+                prune = self._writes % self.prune_every == 0
+            if prune:
+                with db.engine.begin() as connection:
+                    self._prune(connection, now)
+        except IntegrityError:
+            # A concurrent request stored the same key first
+            logger.debug(f"Extraction cache entry {key[:12]} was written concurrently")
+        except SQLAlchemyError as e:
+            logger.warning(f"Extraction cache write failed: {e}")
+
+    def _flush_hits(self, connection) -> None:
+        """Add the hit counts gathered since the last write to their rows."""
+        with self._lock:
+            pending, self._pending_hits = self._pending_hits, {}
+        for key, count in pending.items():
+            connection.execute(
+                _table.update()
+                .where(_table.c.key == key)
+                .values(hits=func.coalesce(_table.c.hits, 0) + count)
+            )
+
+    def _prune(self, connection, now: datetime) -> None:
+        """Evict expired rows, then the oldest rows beyond max_db_entries."""
+        connection.execute(_table.delete().where(_table.c.expires_at <= now))
+
+        overflow = connection.execute(select(func.count()).select_from(_table)).scalar() - self.max_db_entries
+        if overflow > 0:
+            oldest: List[str] = list(connection.execute(
+                select(_table.c.key).order_by(_table.c.expires_at.asc()).limit(overflow)
+            ).scalars())
+            connection.execute(_table.delete().where(_table.c.key.in_(oldest)))
+
+
+_cache: Optional[ExtractionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Process-wide cache configured from the environment."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ExtractionCache(
+                    max_entries=int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "256")),
+                    ttl_seconds=int(os.getenv("EXTRACTION_CACHE_TTL_SECONDS", str(7 * 24 * 3600))),
+                    max_db_entries=int(os.getenv("EXTRACTION_CACHE_MAX_DB_ENTRIES", "5000")),
+                    use_db=os.getenv("EXTRACTION_CACHE_DB", "1") != "0",
+                )
+    return _cache
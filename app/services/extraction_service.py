@@ -11,47 +11,666 @@ Uses Google Gemini API (REST) for intelligent extraction of:
 """
 
 import os
+import re
+import copy
 import json
 import logging
-import requests
-from typing import List, Dict, Optional
+import threading
+import time
+from typing import List, Dict, Iterator, Optional, Tuple
 
 from app.models import CardType
+from app.services.extraction_cache import ExtractionCache, get_extraction_cache
+from app.services.gemini_client import GeminiClient, GEMINI_MODEL, GEMINI_API_URL, estimate_tokens
+from app.services.model_router import ModelRouter, Route
+from app.services.resilience import UpstreamUnavailableError
+from app.services.parallel import run_concurrently
+from app.services.transcript_chunker import split_transcript
+from app.services.json_stream import JsonArrayStream, parse_json_response
+from app.services.segment_locator import SegmentLocator, get_segment_locator
+from app.services.transcript_preprocessor import TranscriptPreprocessor, TokenBudgetExceeded
+from app.services.heuristic_extractor import HeuristicExtractor
+from app.services.agenda_coverage import AgendaCoverage
+from app.services.single_flight import SingleFlight, get_single_flight
+from app.services.telemetry import OUTCOME_CACHE_HIT, get_extraction_telemetry
 
 logger = logging.getLogger(__name__)
 
-# Gemini API endpoint
-GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Bump whenever a prompt template or result post-processing changes so cached
+# results are not reused
+PROMPT_TEMPLATE_VERSION = "3"
+
+# Minimum locator score for an LLM-quoted segment to count as verified
+SEGMENT_MIN_SCORE = 0.6
+
+# "llm" calls Gemini, "heuristic" uses the rule-based extractor, "auto" calls
+# Gemini and falls back to the rules when it is unavailable or over budget
+EXTRACTION_BACKENDS = ("llm", "heuristic", "auto")
+
+CARD_FIELDS = ("type", "title", "content", "segment")
+
+
+class PartialExtractionError(Exception):
+    """
+    Some transcript chunks failed; cards holds what the others produced.
+
+    Raised rather than returned so a partial result is never cached or
+    handed to other processes as if it were complete.
+    """
+
+    def __init__(self, cards: List[Dict], failed_chunks: int, total_chunks: int):
+        super().__init__(f"Extraction failed for {failed_chunks} of {total_chunks} transcript chunks")
+        self.cards = cards
+        self.failed_chunks = failed_chunks
+        self.total_chunks = total_chunks
+
+
+def card_response_schema(requested_types: List[CardType]) -> Dict:
+    """
+    Gemini response schema for a JSON array of cards.
+
+    The type enum is limited to the requested card types, so the model
+    cannot return other types. Properties are ordered so type arrives
+    first when streaming.
+    """
+    return {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "type": {"type": "STRING", "enum": [ct.value for ct in requested_types or CardType]},
+                "title": {"type": "STRING", "description": "Short descriptive title (max 50 chars)"},
+                "content": {"type": "STRING", "description": "The extracted information"},
+                "segment": {
+                    "type": "STRING",
+                    "description": "Exact quote from the transcript supporting this card (empty for tldr)",
+                },
+            },
+            "required": list(CARD_FIELDS),
+            "propertyOrdering": list(CARD_FIELDS),
+        },
+    }
+
+
+def agenda_response_schema(agenda_items: List[str]) -> Dict:
+    """Gemini response schema for a JSON array of agenda items, verbatim."""
+    return {"type": "ARRAY", "items": {"type": "STRING", "enum": list(agenda_items)}}
 
 
 class ExtractionService:
     """
     Service for extracting cards from meeting transcripts using Google Gemini REST API.
+
+    Without a Gemini API key only the heuristic backend is available: "auto"
+    requests fall back to it and "llm" requests raise ValueError.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
-        if not self.api_key:
-            raise ValueError(
-                "Gemini API key is required. "
-                "Set GEMINI_API_KEY environment variable or pass api_key parameter."
-            )
-        logger.info("ExtractionService initialized with Gemini API")
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ExtractionCache] = None,
+        client: Optional[GeminiClient] = None,
+        preprocessor: Optional[TranscriptPreprocessor] = None,
+        single_flight: Optional[SingleFlight] = None,
+        heuristic: Optional[HeuristicExtractor] = None,
+        agenda_coverage: Optional[AgendaCoverage] = None,
+        router: Optional[ModelRouter] = None,
+    ):
+        self.api_key = api_key or os.getenv("GEMINI_API_KEY") or None
+        self.model = GEMINI_MODEL
+        self.cache = cache
+        self.client = client or (GeminiClient(self.api_key) if self.api_key else None)
+        self.telemetry = get_extraction_telemetry()
+        # Model and generation settings are picked per request
+        self.router = router or ModelRouter.from_env()
+        # Gemini's JSON mode with a response schema, instead of free-form JSON
+        self.structured_output = os.getenv("GEMINI_STRUCTURED_OUTPUT", "1") != "0"
+        self.preprocessor = preprocessor or TranscriptPreprocessor.from_env()
+        # Identical concurrent cache misses share one LLM call
+        if single_flight is None and os.getenv("EXTRACTION_SINGLE_FLIGHT", "1") != "0":
+            single_flight = get_single_flight()
+        self.single_flight = single_flight
+        self.heuristic = heuristic or HeuristicExtractor()
+        # Agenda items scored confidently by local TF-IDF never reach the LLM
+        self.agenda_coverage = agenda_coverage or AgendaCoverage.from_env()
+        self.default_backend = os.getenv("EXTRACTION_BACKEND", "llm")
+        self.resolve_backend(self.default_backend)
+        self._backend_lock = threading.Lock()
+        self._backend_stats = {"heuristic_runs": 0, "fallbacks": 0, "agenda_items_local": 0, "agenda_items_ambiguous": 0}
+
+        # Transcripts longer than chunk_chars are extracted chunk by chunk
+        self.chunk_chars = int(os.getenv("EXTRACTION_CHUNK_CHARS", "24000"))
+        self.chunk_overlap_chars = int(os.getenv("EXTRACTION_CHUNK_OVERLAP_CHARS", "1000"))
+        self.chunk_concurrency = int(os.getenv("EXTRACTION_CHUNK_CONCURRENCY", "4"))
+        if self.client is not None:
+            logger.info("ExtractionService initialized with Gemini API")
+        else:
+            logger.info("ExtractionService initialized without a Gemini API key (heuristic backend only)")
 
     def extract_cards(
         self,
         transcript: str,
         agenda_items: Optional[List[str]],
         requested_types: List[CardType],
+        backend: Optional[str] = None,
+    ) -> List[Dict]:
+        backend = self._select_backend(backend)
+        if backend == "heuristic":
+            return self._extract_cards_heuristic(transcript, agenda_items, requested_types)
+        try:
+            return self._extract_cards_llm(transcript, agenda_items, requested_types)
+        except (UpstreamUnavailableError, TokenBudgetExceeded) as e:
+            if backend != "auto":
+                raise
+            self._record_fallback(e)
+            return self._extract_cards_heuristic(transcript, agenda_items, requested_types)
+
+    def _extract_cards_llm(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+    ) -> List[Dict]:
+        prepared = self._preprocess(transcript)
+        route = self._route(prepared, requested_types)
+        cache_key = self._cache_key("cards", prepared, agenda_items, requested_types, model=route.model)
+        cached = self._cache_get(cache_key, "cards", route)
+        if cached is not None:
+            logger.info(f"Extraction cache hit: {len(cached)} cards")
+            return self._ground_segments(cached, transcript)
+
+        try:
+            valid_cards = self._coalesce(
+                cache_key, lambda: self._extract_cards_uncached(prepared, agenda_items, requested_types, route=route)
+            )
+            self._cache_set(cache_key, "cards", valid_cards)
+            return self._ground_segments(valid_cards, transcript)
+        except UpstreamUnavailableError:
+            raise
+        except PartialExtractionError as e:
+            logger.warning(f"{e}; returning {len(e.cards)} cards uncached")
+            return self._ground_segments(copy.deepcopy(e.cards), transcript)
+        except Exception as e:
+            logger.error(f"Card extraction failed: {e}")
+            return []
+
+    def stream_cards(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+        backend: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """
+        Yield extracted cards one at a time as Gemini streams them back.
+
+        Cached results are replayed immediately. Long transcripts that need
+        chunked extraction are yielded once the map-reduce pass finishes.
+        Errors are raised to the caller, which has already received any
+        cards yielded before the failure. With backend="auto" the heuristic
+        fallback is only used if Gemini fails before the first card.
+        """
+        backend = self._select_backend(backend)
+        if backend == "heuristic":
+            yield from self._extract_cards_heuristic(transcript, agenda_items, requested_types)
+            return
+
+        yielded = 0
+        try:
+            for card in self._stream_cards_llm(transcript, agenda_items, requested_types):
+                yielded += 1
+                yield card
+        except (UpstreamUnavailableError, TokenBudgetExceeded) as e:
+            if backend != "auto" or yielded:
+                raise
+            self._record_fallback(e)
+            yield from self._extract_cards_heuristic(transcript, agenda_items, requested_types)
+
+    def _stream_cards_llm(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+    ) -> Iterator[Dict]:
+        prepared = self._preprocess(transcript)
+        route = self._route(prepared, requested_types)
+        cache_key = self._cache_key("cards", prepared, agenda_items, requested_types, model=route.model)
+        cached = self._cache_get(cache_key, "cards", route)
+        if cached is not None:
+            yield from self._ground_segments(cached, transcript)
+            return
+
+        if len(prepared) > self.chunk_chars:
+            try:
+                cards = self._coalesce(
+                    cache_key, lambda: self._extract_cards_uncached(prepared, agenda_items, requested_types, route=route)
+                )
+                self._cache_set(cache_key, "cards", cards)
+            except PartialExtractionError as e:
+                logger.warning(f"{e}; returning {len(e.cards)} cards uncached")
+                cards = copy.deepcopy(e.cards)
+            yield from self._ground_segments(cards, transcript)
+            return
+
+        prompt = self._build_cards_prompt(prepared, agenda_items, requested_types)
+        generation_config = route.generation_config(
+            card_response_schema(requested_types) if self.structured_output else None
+        )
+        parser = JsonArrayStream()
+        locator = get_segment_locator(transcript)
+        cards = []
+
+        started = time.perf_counter()
+        failed = True
+        try:
+            for text in self.client.stream_generate(
+                prompt, generation_config=generation_config, kind="cards_stream", model=route.model
+            ):
+                for card in parser.feed(text):
+                    if not (isinstance(card, dict) and all(k in card for k in ["type", "title", "content"])):
+                        continue
+                    card.setdefault("segment", "")
+                    self._assign_position(card, len(cards))
+                    cards.append(dict(card))
+                    self._ground_segment(card, locator)
+                    yield card
+            failed = False
+        except GeneratorExit:
+            failed = False  # The client stopped reading; not a model failure
+            raise
+        finally:
+            self.router.record(route, time.perf_counter() - started, failed=failed)
+
+        logger.info(f"Streamed {len(cards)} cards from transcript")
+        if parser.finished:
+            self._cache_set(cache_key, "cards", cards)
+
+    def find_uncovered_agenda_items(
+        self,
+        agenda_items: List[str],
+        transcript: str,
+        backend: Optional[str] = None,
+    ) -> List[str]:
+        if not agenda_items:
+            return []
+
+        backend = self._select_backend(backend)
+        if backend == "heuristic":
+            return self.heuristic.find_uncovered_agenda_items(agenda_items, transcript)
+        try:
+            return self._find_uncovered_llm(agenda_items, transcript)
+        except (UpstreamUnavailableError, TokenBudgetExceeded) as e:
+            if backend != "auto":
+                raise
+            self._record_fallback(e)
+            return self.heuristic.find_uncovered_agenda_items(agenda_items, transcript)
+
+    def _find_uncovered_llm(self, agenda_items: List[str], transcript: str) -> List[str]:
+        local_uncovered, ambiguous = self._score_agenda(agenda_items, transcript)
+        if not ambiguous:
+            return local_uncovered
+
+        prepared = self._preprocess(transcript)
+        route = self._route(prepared)
+        cache_key = self._cache_key("uncovered_agenda", prepared, ambiguous, model=route.model)
+        cached = self._cache_get(cache_key, "uncovered_agenda", route)
+        if cached is not None:
+            return self._merge_uncovered(agenda_items, local_uncovered, cached)
+
+        try:
+            valid_uncovered = self._coalesce(
+                cache_key, lambda: self._find_uncovered_uncached(ambiguous, prepared, route=route)
+            )
+            self._cache_set(cache_key, "uncovered_agenda", valid_uncovered)
+            return self._merge_uncovered(agenda_items, local_uncovered, valid_uncovered)
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            logger.error(f"Agenda analysis failed: {e}")
+            return local_uncovered
+
+    def analyze_meeting(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+        deadline_seconds: Optional[float] = None,
+        backend: Optional[str] = None,
+    ) -> Tuple[List[Dict], List[str]]:
+        """
+        Extract cards and find uncovered agenda items concurrently.
+
+        Both prompts run in parallel under one shared deadline. Cache lookups
+        and writes happen on the calling thread, so only the Gemini calls run
+        on worker threads. Returns (cards, uncovered_agenda_items); a task that
+        fails or misses the deadline contributes an empty list, except that
+        UpstreamUnavailableError is raised so callers can report the outage
+        instead of saving a meeting with no cards. TokenBudgetExceeded is
+        raised before any prompt is sent. With backend="auto" both errors
+        fall back to the heuristic extractor instead.
+        """
+        backend = self._select_backend(backend)
+        if backend == "heuristic":
+            return self._analyze_meeting_heuristic(transcript, agenda_items, requested_types)
+        try:
+            return self._analyze_meeting_llm(transcript, agenda_items, requested_types, deadline_seconds)
+        except (UpstreamUnavailableError, TokenBudgetExceeded) as e:
+            if backend != "auto":
+                raise
+            self._record_fallback(e)
+            return self._analyze_meeting_heuristic(transcript, agenda_items, requested_types)
+
+    def _analyze_meeting_llm(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+        deadline_seconds: Optional[float] = None,
+    ) -> Tuple[List[Dict], List[str]]:
+        if deadline_seconds is None:
+            deadline_seconds = float(os.getenv("EXTRACTION_DEADLINE_SECONDS", "90"))
+
+        prepared = self._preprocess(transcript)
+        route = self._route(prepared, requested_types, deadline_seconds)
+        cards_key = self._cache_key("cards", prepared, agenda_items, requested_types, model=route.model)
+        cards = self._cache_get(cards_key, "cards", route)
+
+        # Only agenda items the local scorer is unsure about are sent to Gemini
+        local_uncovered, ambiguous = self._score_agenda(agenda_items or [], transcript)
+        uncovered: Optional[List[str]] = local_uncovered
+        uncovered_key = None
+        if ambiguous:
+            uncovered_key = self._cache_key("uncovered_agenda", prepared, ambiguous, model=route.model)
+            cached = self._cache_get(uncovered_key, "uncovered_agenda", route)
+            uncovered = None if cached is None else self._merge_uncovered(agenda_items, local_uncovered, cached)
+
+        tasks = {}
+        if cards is None:
+            tasks["cards"] = lambda: self._coalesce(
+                cards_key,
+                lambda: self._extract_cards_uncached(
+                    prepared, agenda_items, requested_types, timeout=deadline_seconds, route=route
+                ),
+                timeout=deadline_seconds,
+            )
+        if uncovered is None:
+            tasks["uncovered_agenda"] = lambda: self._coalesce(
+                uncovered_key,
+                lambda: self._find_uncovered_uncached(ambiguous, prepared, timeout=deadline_seconds, route=route),
+                timeout=deadline_seconds,
+            )
+
+        results = run_concurrently(tasks, timeout=deadline_seconds)
+
+        if "cards" in results:
+            cards = self._collect(results["cards"], cards_key, "cards", "Card extraction failed")
+        if "uncovered_agenda" in results:
+            llm_uncovered = self._collect(
+                results["uncovered_agenda"], uncovered_key, "uncovered_agenda", "Agenda analysis failed"
+            )
+            uncovered = self._merge_uncovered(agenda_items, local_uncovered, llm_uncovered)
+
+        return self._ground_segments(cards, transcript), uncovered
+
+    def _extract_cards_heuristic(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
     ) -> List[Dict]:
+        """Rule-based extraction; same card shape as the LLM path, never cached."""
+        cards = self._assign_positions(self.heuristic.extract_cards(transcript, agenda_items, requested_types))
+        with self._backend_lock:
+            self._backend_stats["heuristic_runs"] += 1
+        logger.info(f"Heuristic extraction found {len(cards)} cards")
+        return self._ground_segments(cards, transcript)
+
+    def _analyze_meeting_heuristic(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+    ) -> Tuple[List[Dict], List[str]]:
+        cards = self._extract_cards_heuristic(transcript, agenda_items, requested_types)
+        return cards, self.heuristic.find_uncovered_agenda_items(agenda_items or [], transcript)
+
+    def _score_agenda(self, agenda_items: List[str], transcript: str) -> Tuple[List[str], List[str]]:
+        """Local coverage pass; returns (uncovered, ambiguous) agenda items."""
+        if not agenda_items:
+            return [], []
+        uncovered, ambiguous = self.agenda_coverage.classify(agenda_items, transcript)
+        with self._backend_lock:
+            self._backend_stats["agenda_items_local"] += len(agenda_items) - len(ambiguous)
+            self._backend_stats["agenda_items_ambiguous"] += len(ambiguous)
+        logger.info(
+            f"Agenda coverage: {len(agenda_items) - len(ambiguous)} of {len(agenda_items)} items scored locally"
+        )
+        return uncovered, ambiguous
+
+    @staticmethod
+    def _merge_uncovered(agenda_items: List[str], *uncovered_lists: List[str]) -> List[str]:
+        """Union of uncovered items, in agenda order."""
+        uncovered = set().union(*uncovered_lists)
+        return [item for item in agenda_items if item in uncovered]
+
+    def resolve_backend(self, backend: Optional[str]) -> str:
+        backend = backend or self.default_backend
+        if backend not in EXTRACTION_BACKENDS:
+            raise ValueError(f"Unknown extraction backend '{backend}' (expected one of {', '.join(EXTRACTION_BACKENDS)})")
+        return backend
+
+    def check_backend(self, backend: Optional[str]) -> str:
+        """
+        Resolve backend; raise ValueError if it is "llm" and no API key is set.
+        """
+        backend = self.resolve_backend(backend)
+        if backend == "llm" and self.client is None:
+            raise ValueError("GEMINI_API_KEY environment variable is not set")
+        return backend
+
+    def _select_backend(self, backend: Optional[str]) -> str:
+        """Backend to run: like check_backend, but "auto" without a key runs the heuristic."""
+        backend = self.check_backend(backend)
+        if backend == "auto" and self.client is None:
+            self._record_fallback(ValueError("GEMINI_API_KEY is not set"))
+            return "heuristic"
+        return backend
+
+    def _record_fallback(self, error: Exception) -> None:
+        with self._backend_lock:
+            self._backend_stats["fallbacks"] += 1
+        logger.warning(f"LLM extraction unavailable ({error}); falling back to heuristic extraction")
+
+    def backend_stats(self) -> Dict:
+        with self._backend_lock:
+            return dict(self._backend_stats, default_backend=self.default_backend)
+
+    def extract_delta(
+        self,
+        context: str,
+        delta: str,
+        existing_cards: List[Dict],
+        requested_types: List[CardType],
+        timeout: Optional[float] = None,
+    ) -> List[Dict]:
+        """
+        Extract cards from newly appended transcript text of a live meeting.
+
+        Only delta is mined for cards; context (the transcript just before it)
+        and the existing cards are included so the model can resolve
+        references and avoid repeating cards. Returns new cards only, with
+        segments grounded against context + delta. Results are not cached.
+
+        Raises UpstreamUnavailableError when the LLM is unavailable and
+        ValueError when its response cannot be parsed, so the caller can
+        release the chunks it claimed and retry them later.
+        """
+        if not delta.strip() or not requested_types:
+            return []
+        self.check_backend("llm")
+
+        prepared_delta = self._preprocess(delta)
+        prepared_context = self.preprocessor.process(context, record_stats=False)["text"] if context else ""
+        prompt = self._build_delta_prompt(prepared_context, prepared_delta, existing_cards, requested_types)
+        route = self._route(prepared_delta, requested_types, timeout)
+
+        try:
+            response_text = self._call_gemini(
+                prompt, timeout=timeout, kind="delta", response_schema=card_response_schema(requested_types),
+                route=route,
+            )
+            allowed = {t.value for t in requested_types}
+            cards = [c for c in self._parse_cards(response_text) if c["type"] in allowed]
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            logger.error(f"Delta extraction failed: {e}")
+            raise ValueError(f"Delta extraction failed: {e}") from e
+
+        logger.info(f"Extracted {len(cards)} cards from {len(delta)} new transcript characters")
+        return self._ground_segments(cards, f"{context}\n{delta}" if context else delta)
+
+    def _build_delta_prompt(
+        self,
+        context: str,
+        delta: str,
+        existing_cards: List[Dict],
+        requested_types: List[CardType],
+    ) -> str:
+        type_instructions = "\n".join(f"- {ct.value}" for ct in requested_types)
+        existing = "\n".join(
+            f"- [{c['type']}] {c['title']}: {c['content']}" for c in existing_cards
+        ) or "(none yet)"
+        context_section = f'Earlier transcript (context only, already processed):\n"""{context}"""\n' if context else ""
+
+        return f"""You are an AI assistant that extracts structured information from a meeting while it is in progress.
+
+You MUST extract ONLY the following card types:
+{type_instructions}
+
+Card type definitions:
+- todo: General tasks that need to be done
+- action_item: Specific tasks assigned to someone with clear deliverables
+- decision: Decisions that were made during the meeting
+- question: Questions raised that may need answers
+- discussion_point: Important topics that were discussed
+- follow_up: Items that need follow-up in future meetings
+
+Cards already on the board (do NOT repeat these or restate them with new wording):
+{existing}
+
+{context_section}
+New transcript (extract cards from this part only):
+\"\"\"{delta}\"\"\"
+
+For each NEW card, return a JSON object with:
+- type: the card type (MUST match one of the requested types above)
+- title: short descriptive title (max 50 chars)
+- content: the extracted information
+- segment: exact quote from the new transcript supporting this
+
+{self._format_instruction("Return a JSON array of the new cards (an empty array if there is nothing new).")}"""
+
+    def _extract_cards_uncached(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+        timeout: Optional[float] = None,
+        route: Optional[Route] = None,
+    ) -> List[Dict]:
+        if len(transcript) > self.chunk_chars:
+            valid_cards = self._extract_cards_chunked(transcript, agenda_items, requested_types, timeout, route)
+        else:
+            prompt = self._build_cards_prompt(transcript, agenda_items, requested_types)
+            response_text = self._call_gemini(
+                prompt, timeout=timeout, kind="cards", response_schema=card_response_schema(requested_types),
+                route=route,
+            )
+            valid_cards = self._assign_positions(self._parse_cards(response_text))
+            logger.info(f"Extracted {len(valid_cards)} cards from transcript")
+        return valid_cards
+
+    def _extract_cards_chunked(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+        timeout: Optional[float] = None,
+        route: Optional[Route] = None,
+    ) -> List[Dict]:
+        """
+        Map-reduce extraction for transcripts longer than chunk_chars.
+
+        Each chunk is extracted in parallel (up to chunk_concurrency at once),
+        duplicate cards from overlapping chunks are merged, and per-chunk
+        TL;DRs are reduced into a single meeting summary. If only some chunks
+        fail, PartialExtractionError carries the cards from the rest.
+        """
+        chunks = split_transcript(transcript, self.chunk_chars, self.chunk_overlap_chars)
+        logger.info(f"Extracting cards from {len(chunks)} transcript chunks")
+
+        tasks = {}
+        for i, chunk in enumerate(chunks):
+            prompt = self._build_cards_prompt(chunk, agenda_items, requested_types, part=(i + 1, len(chunks)))
+            tasks[i] = lambda prompt=prompt: self._parse_cards(
+                self._call_gemini(
+                    prompt, timeout=timeout, kind="cards_chunk", response_schema=card_response_schema(requested_types),
+                    route=route,
+                )
+            )
+
+        results = run_concurrently(tasks, max_workers=self.chunk_concurrency, timeout=timeout)
+
+        chunk_cards = []
+        failed_chunks = 0
+        for i in sorted(results):
+            if isinstance(results[i], BaseException):
+                logger.error(f"Chunk {i + 1}/{len(chunks)} extraction failed: {results[i]}")
+                failed_chunks += 1
+                continue
+            chunk_cards.extend(results[i])
+        if all(isinstance(r, BaseException) for r in results.values()):
+            for result in results.values():
+                if isinstance(result, UpstreamUnavailableError):
+                    raise result
+            raise ValueError("Extraction failed for every transcript chunk")
+
+        summaries = [c for c in chunk_cards if c["type"] == CardType.TLDR.value]
+        cards = self._merge_cards([c for c in chunk_cards if c["type"] != CardType.TLDR.value])
+
+        if summaries:
+            cards.insert(0, self._reduce_summaries(summaries, timeout, route))
+
+        logger.info(f"Extracted {len(cards)} cards from {len(chunks)} chunks")
+        cards = self._assign_positions(cards)
+        if failed_chunks:
+            raise PartialExtractionError(cards, failed_chunks, len(chunks))
+        return cards
+
+    def _build_cards_prompt(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+        part: Optional[Tuple[int, int]] = None,
+    ) -> str:
         type_instructions = "\n".join(f"- {ct.value}" for ct in requested_types)
         agenda_section = (
             "\nAgenda Items:\n" + "\n".join(f"- {a}" for a in agenda_items)
             if agenda_items else ""
         )
 
-        prompt = f"""You are an AI assistant that extracts structured information from meeting transcripts.
+        part_note = (
+            f"\nThis is part {part[0]} of {part[1]} of a longer transcript. "
+            "Extract only what appears in this part; for tldr, summarize this part only.\n"
+            if part else ""
+        )
 
+        return f"""You are an AI assistant that extracts structured information from meeting transcripts.
+{part_note}
 You MUST extract ONLY the following card types:
 {type_instructions}
 
@@ -74,39 +693,112 @@ Transcript:
 \"\"\"{transcript}\"\"\"
 {agenda_section}
 
-Return ONLY a valid JSON array with the requested card types. No markdown code blocks, no explanation."""
+{self._format_instruction("Return a JSON array with the requested card types.")}"""
+
+    def _format_instruction(self, instruction: str) -> str:
+        """Closing output instruction; JSON mode needs no reminder about fences or commentary."""
+        if self.structured_output:
+            return instruction
+        return f"{instruction} Return ONLY valid JSON. No markdown code blocks, no explanation."
+
+    def _decode_json(self, response_text: str):
+        """
+        Decode a JSON response.
+
+        In JSON mode the response is exactly the JSON value, so json.loads is
+        enough; the tolerant parser is only used in text mode, or when a
+        response was cut off at the output token limit.
+        """
+        if self.structured_output:
+            try:
+                return json.loads(response_text)
+            except ValueError:
+                logger.warning("JSON-mode response did not decode; trying to recover a truncated array")
+        return parse_json_response(response_text)
+
+    def _parse_cards(self, response_text: str) -> List[Dict]:
+        cards = self._decode_json(response_text)
+        
+        if not isinstance(cards, list):
+            raise ValueError(f"Expected list, got {type(cards)}")
+        
+        valid_cards = []
+        for card in cards:
+            if isinstance(card, dict) and all(k in card for k in ["type", "title", "content"]):
+                card.setdefault("segment", "")
+                valid_cards.append(card)
+        return valid_cards
+
+    @classmethod
+    def _assign_positions(cls, cards: List[Dict]) -> List[Dict]:
+        for i, card in enumerate(cards):
+            cls._assign_position(card, i)
+        return cards
+
+    @staticmethod
+    def _assign_position(card: Dict, index: int) -> None:
+        card["position_x"] = (index % 3) * 300
+        card["position_y"] = (index // 3) * 200
+
+    @staticmethod
+    def _merge_cards(cards: List[Dict]) -> List[Dict]:
+        """Drop cards that repeat an earlier card of the same type."""
+        merged: List[Dict] = []
+        seen: List[Tuple[str, set]] = []
+        for card in cards:
+            tokens = set(_WORD_PATTERN.findall(card["content"].lower()))
+            duplicate = False
+            for card_type, other in seen:
+                if card_type != card["type"]:
+                    continue
+                union = tokens | other
+                if union and len(tokens & other) / len(union) >= 0.8:
+                    duplicate = True
+                    break
+            if not duplicate:
+                seen.append((card["type"], tokens))
+                merged.append(card)
+        return merged
+
+    def _reduce_summaries(
+        self,
+        summaries: List[Dict],
+        timeout: Optional[float] = None,
+        route: Optional[Route] = None,
+    ) -> Dict:
+        """Combine per-chunk TL;DR cards into one meeting summary."""
+        if len(summaries) == 1:
+            return summaries[0]
+
+        parts = "\n".join(f"{i + 1}. {s['content']}" for i, s in enumerate(summaries))
+        prompt = f"""The following are summaries of consecutive parts of one meeting transcript.
+
+{parts}
+
+Write a brief summary of the entire meeting (1-3 sentences capturing key points).
+Return ONLY the summary as plain text. No JSON, no markdown, no explanation."""
 
         try:
-            response_text = self._call_gemini(prompt)
-            cards = self._parse_json_response(response_text)
-            
-            if not isinstance(cards, list):
-                logger.error(f"Expected list, got {type(cards)}")
-                return []
-            
-            valid_cards = []
-            for i, card in enumerate(cards):
-                if isinstance(card, dict) and all(k in card for k in ["type", "title", "content"]):
-                    card["position_x"] = (i % 3) * 300
-                    card["position_y"] = (i // 3) * 200
-                    card.setdefault("segment", "")
-                    valid_cards.append(card)
-            
-            logger.info(f"Extracted {len(valid_cards)} cards from transcript")
-            return valid_cards
-            
+            content = self._call_gemini(prompt, timeout=timeout, kind="tldr_reduce", route=route).strip()
         except Exception as e:
-            logger.error(f"Card extraction failed: {e}")
-            return []
+            # Fall back to the chunk summaries rather than losing the cards
+            logger.error(f"TL;DR reduce failed: {e}")
+            content = " ".join(s["content"] for s in summaries)
 
-    def find_uncovered_agenda_items(
+        return {
+            "type": CardType.TLDR.value,
+            "title": summaries[0].get("title") or "Meeting Summary",
+            "content": content,
+            "segment": "",
+        }
+
+    def _find_uncovered_uncached(
         self,
         agenda_items: List[str],
-        transcript: str
+        transcript: str,
+        timeout: Optional[float] = None,
+        route: Optional[Route] = None,
     ) -> List[str]:
-        if not agenda_items:
-            return []
-
         prompt = f"""Analyze the meeting transcript and identify which agenda items were NOT discussed or covered.
 
 Agenda Items:
@@ -115,30 +807,40 @@ Agenda Items:
 Transcript:
 \"\"\"{transcript}\"\"\"
 
-Return ONLY a JSON array of the agenda item strings that were NOT covered in the meeting.
+Return a JSON array of the agenda item strings that were NOT covered in the meeting.
 If all items were covered, return an empty array [].
-No markdown, no explanation, just the JSON array."""
+{self._format_instruction("Copy the agenda item strings exactly.")}"""
 
-        try:
-            response_text = self._call_gemini(prompt)
-            uncovered = self._parse_json_response(response_text)
-            
-            if not isinstance(uncovered, list):
-                return []
-            
-            valid_uncovered = [item for item in uncovered if item in agenda_items]
-            logger.info(f"Found {len(valid_uncovered)} uncovered agenda items")
-            return valid_uncovered
-            
-        except Exception as e:
-            logger.error(f"Agenda analysis failed: {e}")
-            return []
+        response_text = self._call_gemini(
+            prompt, timeout=timeout, kind="uncovered_agenda", response_schema=agenda_response_schema(agenda_items),
+            route=route,
+        )
+        uncovered = self._decode_json(response_text)
+        
+        if not isinstance(uncovered, list):
+            raise ValueError(f"Expected list, got {type(uncovered)}")
+        
+        valid_uncovered = [item for item in uncovered if item in agenda_items]
+        logger.info(f"Found {len(valid_uncovered)} uncovered agenda items")
+        return valid_uncovered
 
     def extract_segment_for_card(
         self,
         transcript: str,
         card_content: str
     ) -> Optional[str]:
+        """
+        Find the transcript snippet supporting a card.
+
+        The local segment locator is tried first; Gemini is only asked when
+        nothing in the transcript matches, and its answer is verified
+        against the transcript before being returned.
+        """
+        locator = get_segment_locator(transcript)
+        match = locator.locate(card_content)
+        if match:
+            return match["text"]
+
         prompt = f"""Find the exact snippet in the transcript that best supports or relates to the following card content.
 
 Card Content:
@@ -152,80 +854,147 @@ If no relevant snippet is found, return an empty string.
 No JSON, no quotes, no explanation."""
 
         try:
-            response_text = self._call_gemini(prompt)
-            segment = response_text.strip()
-            return segment if segment else None
+            response_text = self._call_gemini(prompt, kind="segment", route=self._route(transcript))
+            match = locator.locate(response_text, min_score=SEGMENT_MIN_SCORE)
+            return match["text"] if match else None
         except Exception as e:
             logger.error(f"Segment extraction failed: {e}")
             return None
 
-    def _call_gemini(self, prompt: str) -> str:
-        url = f"{GEMINI_API_URL}?key={self.api_key}"
-        
-        payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {
-                "temperature": 0.2,
-                "topP": 0.8,
-                "topK": 40,
-                "maxOutputTokens": 8192,
-            }
-        }
-        
-        response = requests.post(url, json=payload, headers={"Content-Type": "application/json"}, timeout=60)
-        response.raise_for_status()
-        
-        result = response.json()
-        
-        if "candidates" in result and len(result["candidates"]) > 0:
-            candidate = result["candidates"][0]
-            if "content" in candidate and "parts" in candidate["content"]:
-                parts = candidate["content"]["parts"]
-                if len(parts) > 0 and "text" in parts[0]:
-                    return parts[0]["text"]
-        
-        raise ValueError("Unexpected Gemini API response format")
+    def _preprocess(self, transcript: str) -> str:
+        """Normalize a transcript for prompting; raises TokenBudgetExceeded."""
+        result = self.preprocessor.process(transcript)
+        if result["tokens_saved"]:
+            logger.info(
+                f"Preprocessing saved ~{result['tokens_saved']} of {result['original_tokens']} transcript tokens"
+            )
+        return result["text"]
 
-    def _parse_json_response(self, text: str) -> any:
-        cleaned = text.strip()
-        
-        if cleaned.startswith("```"):
-            lines = cleaned.split("\n")
-            lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            cleaned = "\n".join(lines)
-        
-        cleaned = cleaned.strip()
-        
-        if not cleaned.startswith('[') and not cleaned.startswith('{'):
-            arr_start = cleaned.find('[')
-            obj_start = cleaned.find('{')
-            
-            if arr_start >= 0 and (obj_start < 0 or arr_start < obj_start):
-                cleaned = cleaned[arr_start:]
-            elif obj_start >= 0:
-                cleaned = cleaned[obj_start:]
-        
-        if cleaned.startswith('['):
-            bracket_count = 0
-            for i, char in enumerate(cleaned):
-                if char == '[':
-                    bracket_count += 1
-                elif char == ']':
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        cleaned = cleaned[:i+1]
-                        break
-        elif cleaned.startswith('{'):
-            brace_count = 0
-            for i, char in enumerate(cleaned):
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        cleaned = cleaned[:i+1]
-                        break
-        
-        return json.loads(cleaned)
+    def _ground_segments(self, cards: List[Dict], transcript: str) -> List[Dict]:
+        """
+        Replace LLM-quoted segments with verified spans of the transcript.
+
+        Always given the original transcript, so segments quote what was
+        stored rather than the preprocessed prompt text.
+        """
+        locator = get_segment_locator(transcript)
+        for card in cards:
+            self._ground_segment(card, locator)
+        return cards
+
+    @staticmethod
+    def _ground_segment(card: Dict, locator: SegmentLocator) -> None:
+        if card["type"] == CardType.TLDR.value:
+            return
+        match = None
+        if card.get("segment"):
+            match = locator.locate(card["segment"], min_score=SEGMENT_MIN_SCORE)
+        if match is None:
+            match = locator.locate(card["content"])
+        card["segment"] = match["text"] if match else ""
+
+    def _collect(self, result, cache_key: str, kind: str, error_message: str) -> List:
+        """Unwrap a run_concurrently result, caching complete successes."""
+        if isinstance(result, UpstreamUnavailableError):
+            raise result
+        if isinstance(result, PartialExtractionError):
+            logger.warning(f"{result}; returning {len(result.cards)} cards uncached")
+            return copy.deepcopy(result.cards)
+        if isinstance(result, BaseException):
+            logger.error(f"{error_message}: {result}")
+            return []
+        self._cache_set(cache_key, kind, result)
+        return result
+
+    def _cache_key(
+        self,
+        kind: str,
+        transcript: str,
+        agenda_items: Optional[List[str]] = None,
+        requested_types: Optional[List[CardType]] = None,
+        model: Optional[str] = None,
+    ) -> str:
+        return ExtractionCache.make_key(
+            kind, PROMPT_TEMPLATE_VERSION, model or self.model,
+            transcript, agenda_items, requested_types,
+        )
+
+    def _coalesce(self, key: str, fn, timeout: Optional[float] = None):
+        """Run an uncached extraction, sharing it with identical concurrent requests."""
+        if self.single_flight is None:
+            return fn()
+        return self.single_flight.do(key, fn, timeout=timeout)
+
+    def _cache_get(self, key: str, kind: str, route: Optional[Route] = None):
+        """Cache lookup; hits are recorded in telemetry under the prompt kind."""
+        if self.cache is None:
+            return None
+        started = time.perf_counter()
+        value = self.cache.get(key)
+        if value is not None:
+            model = route.model if route else self.model
+            self.telemetry.record(kind, model, time.perf_counter() - started, OUTCOME_CACHE_HIT)
+        return value
+
+    def _route(
+        self,
+        transcript: str,
+        requested_types: Optional[List[CardType]] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> Route:
+        return self.router.select(estimate_tokens(transcript), requested_types, deadline_seconds)
+
+    def _cache_set(self, key: str, kind: str, value) -> None:
+        if self.cache is not None:
+            self.cache.set(key, kind, value)
+
+    def _call_gemini(
+        self,
+        prompt: str,
+        timeout: Optional[float] = None,
+        kind: str = "generate",
+        response_schema: Optional[Dict] = None,
+        route: Optional[Route] = None,
+    ) -> str:
+        route = route or self.router.default_route
+        generation_config = route.generation_config(response_schema if self.structured_output else None)
+        started = time.perf_counter()
+        try:
+            text = self.client.generate(
+                prompt, generation_config=generation_config, timeout=timeout, kind=kind, model=route.model
+            )
+        except Exception:
+            self.router.record(route, time.perf_counter() - started, failed=True)
+            raise
+        self.router.record(route, time.perf_counter() - started)
+        return text
+
+
+_service: Optional[ExtractionService] = None
+_service_lock = threading.Lock()
+
+
+def get_extraction_service() -> ExtractionService:
+    """
+    Process-wide ExtractionService (and its pooled Gemini client).
+
+    Rebuilt only if GEMINI_API_KEY changes. Without the key the service runs
+    the heuristic backend only; use check_backend() to reject "llm" requests.
+    """
+    global _service
+    api_key = os.getenv("GEMINI_API_KEY") or None
+
+    service = _service
+    if service is None or service.api_key != api_key:
+        with _service_lock:
+            if _service is None or _service.api_key != api_key:
+                if _service is not None and _service.client is not None:
+                    _service.client.close()
+                _service = ExtractionService(api_key=api_key, cache=get_extraction_cache())
+            service = _service
+    return service
+
+
+def get_existing_extraction_service() -> Optional[ExtractionService]:
+    """Return the singleton if it has been created, without creating it."""
+    return _service
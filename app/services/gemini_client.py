@@ -0,0 +1,408 @@
+"""
+Gemini Client - pooled, keep-alive HTTP access to the Gemini REST API.
+
+A single requests.Session is shared by every extraction in the process so
+TCP and TLS handshakes are paid once per pooled connection instead of once
+per call. The urllib3 pool behind the session is thread-safe.
+
+Every call goes through the circuit breaker, the request/token rate limits
+and the adaptive concurrency limit, and transient failures (429, 5xx,
+connection errors) are retried with jittered exponential backoff.
+
+Each call is recorded in extraction telemetry with its prompt kind, latency,
+retries, outcome and the token counts Gemini reports in usageMetadata.
+"""
+
+import os
+import json
+import time
+import re
+import logging
+import threading
+from typing import Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.services.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    RateLimitTimeout,
+    RetryPolicy,
+    TokenBucket,
+    UpstreamUnavailableError,
+)
+from app.services.telemetry import (
+    OUTCOME_CANCELLED,
+    OUTCOME_ERROR,
+    OUTCOME_SUCCESS,
+    OUTCOME_UNAVAILABLE,
+    ExtractionTelemetry,
+    get_extraction_telemetry,
+)
+
+logger = logging.getLogger(__name__)
+
+# Gemini model and API endpoint. GEMINI_API_URL can point at a stand-in such
+# as mock_gemini_server.py for local benchmarking.
+GEMINI_MODEL = "gemini-2.0-flash"
+GEMINI_API_URL = os.getenv(
+    "GEMINI_API_URL",
+    f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}:generateContent",
+)
+
+# 429 and transient server errors are retried with backoff
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+DEFAULT_GENERATION_CONFIG = {
+    "temperature": 0.2,
+    "topP": 0.8,
+    "topK": 40,
+    "maxOutputTokens": 8192,
+}
+
+
+def structured_generation_config(response_schema: Dict, base: Optional[Dict] = None) -> Dict:
+    """Generation config for JSON mode, with output constrained to response_schema."""
+    return dict(
+        base or DEFAULT_GENERATION_CONFIG,
+        responseMimeType="application/json",
+        responseSchema=response_schema,
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+class GeminiClient:
+    """
+    Thread-safe Gemini REST client backed by a sized connection pool.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = GEMINI_API_URL,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        timeout: float = 60,
+        model: str = GEMINI_MODEL,
+        telemetry: Optional[ExtractionTelemetry] = None,
+    ):
+        self.api_key = api_key
+        self.api_url = api_url
+        self.model = model
+        self.telemetry = telemetry or get_extraction_telemetry()
+        self.timeout = timeout
+        self.pool_connections = pool_connections or int(os.getenv("GEMINI_POOL_CONNECTIONS", "4"))
+        self.pool_maxsize = pool_maxsize or int(os.getenv("GEMINI_POOL_MAXSIZE", "16"))
+        if pool_block is None:
+            pool_block = os.getenv("GEMINI_POOL_BLOCK", "0") == "1"
+        self.pool_block = pool_block
+
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+        self.request_bucket = TokenBucket(float(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "1000")))
+        self.token_bucket = TokenBucket(float(os.getenv("GEMINI_TOKENS_PER_MINUTE", "1000000")))
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            initial=int(os.getenv("GEMINI_MAX_CONCURRENCY", str(self.pool_maxsize))),
+            minimum=int(os.getenv("GEMINI_MIN_CONCURRENCY", "1")),
+            maximum=int(os.getenv("GEMINI_MAX_CONCURRENCY", str(self.pool_maxsize))),
+        )
+        self.retry_policy = RetryPolicy(
+            max_retries=int(os.getenv("GEMINI_MAX_RETRIES", "3")),
+            base_delay=float(os.getenv("GEMINI_RETRY_BASE_DELAY", "1.0")),
+            max_delay=float(os.getenv("GEMINI_RETRY_MAX_DELAY", "30")),
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=int(os.getenv("GEMINI_BREAKER_FAILURES", "5")),
+            reset_timeout=float(os.getenv("GEMINI_BREAKER_RESET_SECONDS", "30")),
+        )
+
+        self._lock = threading.Lock()
+        self._retries_total = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._requests_total = 0
+        self._errors_total = 0
+
+    def generate(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        kind: str = "generate",
+        model: Optional[str] = None,
+    ) -> str:
+        """Send a generateContent request and return the first candidate's text."""
+        payload = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": generation_config or DEFAULT_GENERATION_CONFIG,
+        }
+
+        started = time.perf_counter()
+        call = {"model": model or self.model, "retries": 0, "usage": {}, "outcome": OUTCOME_ERROR}
+        try:
+            response = self._request(
+                self.model_url(call["model"]), {"key": self.api_key}, payload, prompt, timeout, call=call
+            )
+            try:
+                result = response.json()
+            finally:
+                self._finish(response)
+
+            call["usage"] = result.get("usageMetadata") or {}
+            text = self.extract_text(result)
+            call["outcome"] = OUTCOME_SUCCESS
+            return text
+        except UpstreamUnavailableError:
+            call["outcome"] = OUTCOME_UNAVAILABLE
+            raise
+        finally:
+            self._record(kind, started, call)
+
+    def stream_generate(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        kind: str = "stream",
+        model: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Call streamGenerateContent over SSE and yield text pieces as they arrive.
+
+        Retries only happen before the first piece has been received. Usage
+        is taken from the last event carrying usageMetadata.
+        """
+        payload = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": generation_config or DEFAULT_GENERATION_CONFIG,
+        }
+        call = {"model": model or self.model, "retries": 0, "usage": {}, "outcome": OUTCOME_ERROR}
+        stream_url = self.model_url(call["model"]).replace(":generateContent", ":streamGenerateContent")
+
+        started = time.perf_counter()
+        try:
+            response = self._request(
+                stream_url, {"key": self.api_key, "alt": "sse"}, payload, prompt, timeout, stream=True, call=call
+            )
+        except UpstreamUnavailableError:
+            call["outcome"] = OUTCOME_UNAVAILABLE
+            self._record(kind, started, call)
+            raise
+        except Exception:
+            self._record(kind, started, call)
+            raise
+
+        failed = False
+        try:
+            with response:
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    event = json.loads(line[len("data:"):].strip())
+                    if event.get("usageMetadata"):
+                        call["usage"] = event["usageMetadata"]
+                    try:
+                        text = self.extract_text(event)
+                    except ValueError:
+                        continue  # e.g. a final event carrying only usage metadata
+                    if text:
+                        yield text
+            call["outcome"] = OUTCOME_SUCCESS
+        except GeneratorExit:
+            call["outcome"] = OUTCOME_CANCELLED  # The consumer stopped reading
+            raise
+        except Exception:
+            failed = True  # The stream broke off partway
+            raise
+        finally:
+            if failed:
+                response.close()
+                self._release(overloaded=True, failed=True)
+            else:
+                self._finish(response)
+            self._record(kind, started, call)
+
+    def _request(
+        self,
+        url: str,
+        params: Dict,
+        payload: Dict,
+        prompt: str,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+        call: Optional[Dict] = None,
+    ) -> requests.Response:
+        """
+        POST with circuit breaking, rate limiting, adaptive concurrency and retries.
+
+        On success the concurrency slot stays held; the caller must pass the
+        response to _finish() once it has been consumed. The retry count is
+        written to call["retries"] when a call dict is given.
+        """
+        timeout = min(timeout, self.timeout) if timeout else self.timeout
+        deadline = time.monotonic() + timeout
+
+        self.request_bucket.acquire(1, timeout=timeout)
+        self.token_bucket.acquire(estimate_tokens(prompt), timeout=deadline - time.monotonic())
+        self.breaker.before_call()
+
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                self.concurrency.acquire(timeout=max(remaining, 0))
+            except RateLimitTimeout:
+                self.breaker.release_trial()
+                raise
+            self._enter()
+
+            retry_after = None
+            error: Optional[Exception] = None
+            try:
+                response = self._session.post(
+                    url, params=params, json=payload, timeout=max(remaining, 1), stream=stream
+                )
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()  # Other client errors are not retried
+                    return response
+                retry_after = RetryPolicy.parse_retry_after(response.headers.get("Retry-After"))
+                error = requests.HTTPError(f"{response.status_code} from Gemini API", response=response)
+                response.close()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except Exception:
+                # The upstream answered (e.g. 400/403), so it is not down
+                self._release(overloaded=False, failed=False)
+                self.breaker.record_success()
+                raise
+
+            self._release(overloaded=True, failed=True)
+            delay = self.retry_policy.delay(attempt, retry_after)
+            out_of_attempts = attempt >= self.retry_policy.max_retries
+            too_long = delay > self.retry_policy.max_delay or time.monotonic() + delay >= deadline
+            if out_of_attempts or too_long or self.breaker.state == CircuitBreaker.OPEN:
+                raise UpstreamUnavailableError(
+                    f"Gemini API unavailable after {attempt + 1} attempts: {error}",
+                    retry_after=retry_after,
+                ) from error
+
+            attempt += 1
+            if call is not None:
+                call["retries"] = attempt
+            with self._lock:
+                self._retries_total += 1
+            logger.warning(f"Gemini call failed ({error}); retry {attempt} in {delay:.1f}s")
+            time.sleep(delay)
+
+    def _finish(self, response: requests.Response) -> None:
+        response.close()
+        self._release(overloaded=False, failed=False)
+        self.breaker.record_success()
+
+    def _release(self, overloaded: bool, failed: bool) -> None:
+        self._exit()
+        self.concurrency.release(overloaded=overloaded)
+        if failed:
+            with self._lock:
+                self._errors_total += 1
+            self.breaker.record_failure()
+
+    def model_url(self, model: str) -> str:
+        """generateContent URL for a model, keeping the configured host (e.g. a mock server)."""
+        if model == self.model:
+            return self.api_url
+        return re.sub(r"/models/[^/:]+:", f"/models/{model}:", self.api_url, count=1)
+
+    def _record(self, kind: str, started: float, call: Dict) -> None:
+        usage = call["usage"]
+        self.telemetry.record(
+            kind,
+            call["model"],
+            time.perf_counter() - started,
+            call["outcome"],
+            input_tokens=usage.get("promptTokenCount"),
+            output_tokens=usage.get("candidatesTokenCount"),
+            retries=call["retries"],
+        )
+
+    @staticmethod
+    def extract_text(result: Dict) -> str:
+        if "candidates" in result and len(result["candidates"]) > 0:
+            candidate = result["candidates"][0]
+            if "content" in candidate and "parts" in candidate["content"]:
+                parts = candidate["content"]["parts"]
+                if len(parts) > 0 and "text" in parts[0]:
+                    return parts[0]["text"]
+
+        raise ValueError("Unexpected Gemini API response format")
+
+    def pool_stats(self) -> Dict:
+        """Client and connection pool statistics, for sizing against worker count."""
+        pools = []
+        manager = self._adapter.poolmanager
+        for pool_key in list(manager.pools.keys()):
+            pool = manager.pools.get(pool_key)
+            if pool is None:
+                continue
+            pools.append({
+                "host": pool.host,
+                "port": pool.port,
+                "connections_opened": pool.num_connections,
+                "requests_sent": pool.num_requests,
+                # The pool queue is pre-filled with None placeholders
+                "idle_connections": sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0,
+                "maxsize": pool.pool.maxsize if pool.pool else self.pool_maxsize,
+            })
+
+        with self._lock:
+            return {
+                "retries_total": self._retries_total,
+                "pool_connections": self.pool_connections,
+                "pool_maxsize": self.pool_maxsize,
+                "pool_block": self.pool_block,
+                "requests_total": self._requests_total,
+                "errors_total": self._errors_total,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "pools": pools,
+            }
+
+    def resilience_stats(self) -> Dict:
+        """Rate limiter, concurrency limiter and circuit breaker state."""
+        return {
+            "requests_per_minute": self.request_bucket.stats(),
+            "tokens_per_minute": self.token_bucket.stats(),
+            "concurrency": self.concurrency.stats(),
+            "circuit_breaker": self.breaker.stats(),
+            "retry_policy": {
+                "max_retries": self.retry_policy.max_retries,
+                "base_delay": self.retry_policy.base_delay,
+                "max_delay": self.retry_policy.max_delay,
+            },
+        }
+
+    def close(self) -> None:
+        self._session.close()
+
+    def _enter(self) -> None:
+        with self._lock:
+            self._requests_total += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
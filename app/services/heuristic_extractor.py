@@ -0,0 +1,261 @@
+"""
+Heuristic Extractor - rule-based card extraction without an LLM call.
+
+Short stand-ups rarely need a multi-second Gemini round trip: commitments
+("Bob will ...", "I'll ..."), requests ("Can you ...?"), decisions ("we
+decided ..."), explicit TODO lines and questions are caught by simple
+patterns over speaker turns. Cards have the same shape as the LLM output
+(type, title, content, segment) and are produced in milliseconds.
+
+Used directly with extraction_backend="heuristic", or as the fallback when
+the LLM is unavailable or a transcript is over the token budget.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from app.models import CardType
+
+_SPEAKER = re.compile(r"^\s*([A-Z][\w .'-]{0,40}?):\s*(.*)$")
+_SENTENCE = re.compile(r"[^.!?]+(?:[.!?]+|$)")
+_WORD = re.compile(r"[a-z0-9']+")
+
+_TODO_PREFIX = re.compile(r"^\s*(?:todo|to-do|to do|action(?: item)?|task)\s*[:\-]\s*(?P<what>.+)", re.IGNORECASE)
+_DECISION = re.compile(
+    r"\b(?:we(?:'ve| have)? decided|decided to|we(?:'ve| have)? agreed|agreed (?:to|on|that)|"
+    r"decision(?: is)?:|let'?s go with|we'?ll go with|we(?:'re| are) going with|settled on|final decision)\b",
+    re.IGNORECASE,
+)
+_REQUEST = re.compile(r"\b(?:can|could|would) you (?:please )?(?P<what>[^?]+)\?", re.IGNORECASE)
+_COMMITMENT = re.compile(
+    r"\b(?P<who>I|[A-Z][a-z]+)(?:'ll|\s+will|\s+(?:is|am) going to|\s+can take care of)\s+(?P<what>[^.?!]+)"
+)
+_TEAM_TODO = re.compile(
+    r"\b(?:we|I)\s+(?:really\s+)?(?:need to|have to|should|must|ought to)\s+(?P<what>[^.?!]+)|"
+    r"\blet'?s\s+(?!go with|start|begin|move on|get started|talk|discuss|do that|do it)(?P<what2>[^.?!]+)",
+    re.IGNORECASE,
+)
+_DISCUSSION = re.compile(
+    r"\b(?:let'?s (?:talk|discuss)(?: about)?|moving on to|next (?:topic|item) is|"
+    r"(?:we|I) (?:need|want) to discuss|update on|what about)\b",
+    re.IGNORECASE,
+)
+_FOLLOW_UP = re.compile(
+    r"\b(?:follow[ -]?up|circle back|revisit|check back|next meeting|"
+    r"schedule (?:a|another) (?:separate |follow-up )?(?:meeting|call|session))\b",
+    re.IGNORECASE,
+)
+
+# Capitalized words that start sentences but never name an assignee
+_NOT_NAMES = {
+    "It", "That", "This", "There", "These", "Those", "They", "He", "She", "You", "We",
+    "What", "Which", "Who", "Where", "When", "How", "Everything", "Nothing", "Something",
+    "Everyone", "Nobody", "Someone", "Anyone", "Here", "Today", "Tomorrow", "Then",
+}
+
+_STOPWORDS = {
+    "the", "and", "for", "that", "this", "with", "from", "have", "will", "about", "what",
+    "your", "they", "them", "then", "there", "were", "been", "just", "also", "some", "into",
+    "okay", "yeah", "sure", "right", "great", "thanks", "good", "that's", "let's", "we're",
+    "i've", "i'll", "i'm", "should", "would", "could", "need", "more", "make", "next",
+}
+
+# Agenda words too generic to show that an item was discussed
+_GENERIC_AGENDA_WORDS = {
+    "team", "review", "update", "updates", "status", "discussion", "meeting", "preparation",
+    "plan", "planning", "item", "items", "issue", "issues", "topic", "topics", "project", "sync", "general",
+}
+
+# (rule, card types in order of preference)
+_RULES = ["todo_prefix", "decision", "request", "commitment", "discussion", "follow_up", "team_todo", "question"]
+_RULE_TYPES = {
+    "todo_prefix": [CardType.TODO, CardType.ACTION_ITEM],
+    "decision": [CardType.DECISION],
+    "request": [CardType.ACTION_ITEM, CardType.TODO],
+    "commitment": [CardType.ACTION_ITEM, CardType.TODO],
+    "discussion": [CardType.DISCUSSION_POINT],
+    "team_todo": [CardType.TODO, CardType.ACTION_ITEM],
+    "follow_up": [CardType.FOLLOW_UP],
+    "question": [CardType.QUESTION],
+}
+
+
+class HeuristicExtractor:
+    """
+    Pattern-based extractor over speaker turns.
+    """
+
+    def __init__(self, min_question_words: int = 4):
+        self.min_question_words = min_question_words
+
+    def extract_cards(
+        self,
+        transcript: str,
+        agenda_items: Optional[List[str]],
+        requested_types: List[CardType],
+    ) -> List[Dict]:
+        """Extract cards in the same shape as ExtractionService.extract_cards (without positions)."""
+        requested = set(requested_types)
+        turns = self._turns(transcript)
+        cards: List[Dict] = []
+        seen = set()
+
+        for index, (speaker, sentence) in enumerate(turns):
+            card = self._match(sentence, speaker, self._next_speaker(turns, index, speaker), requested)
+            if card is None:
+                continue
+            key = (card["type"], card["content"].lower())
+            if key in seen:
+                continue
+            seen.add(key)
+            cards.append(card)
+
+        if CardType.TLDR in requested and turns:
+            cards.insert(0, self._summary(turns, cards, agenda_items))
+        return cards
+
+    def find_uncovered_agenda_items(self, agenda_items: List[str], transcript: str) -> List[str]:
+        """Agenda items whose distinctive words never appear in the transcript."""
+        if not agenda_items:
+            return []
+        prefixes = {word[:5] for word in _WORD.findall(transcript.lower())}
+
+        uncovered = []
+        for item in agenda_items:
+            words = [w for w in _WORD.findall(item.lower()) if len(w) > 2 and w not in _STOPWORDS]
+            specific = [w for w in words if w not in _GENERIC_AGENDA_WORDS]
+            if specific:
+                covered = all(w[:5] in prefixes for w in specific)
+            else:
+                covered = not words or any(w[:5] in prefixes for w in words)
+            if not covered:
+                uncovered.append(item)
+        return uncovered
+
+    def _match(
+        self,
+        sentence: str,
+        speaker: Optional[str],
+        next_speaker: Optional[str],
+        requested: set,
+    ) -> Optional[Dict]:
+        for rule in _RULES:
+            card_type = next((t for t in _RULE_TYPES[rule] if t in requested), None)
+            if card_type is None:
+                continue
+            content = self._apply(rule, sentence, speaker, next_speaker)
+            if content:
+                return {
+                    "type": card_type.value,
+                    "title": self._title(content),
+                    "content": content,
+                    "segment": sentence,
+                }
+        return None
+
+    def _apply(self, rule: str, sentence: str, speaker: Optional[str], next_speaker: Optional[str]) -> Optional[str]:
+        if rule == "todo_prefix":
+            match = _TODO_PREFIX.match(sentence)
+            return _capitalize(_clean(match.group("what"))) if match else None
+        if rule == "decision":
+            return sentence if _DECISION.search(sentence) else None
+        if rule == "request":
+            match = _REQUEST.search(sentence)
+            if not match:
+                return None
+            what = _clean(match.group("what"))
+            if speaker:
+                what = re.sub(r"\bme\b", speaker, what)
+            return f"{next_speaker or 'Someone'} to {what}"
+        if rule == "commitment":
+            for match in _COMMITMENT.finditer(sentence):
+                who = match.group("who")
+                if who in _NOT_NAMES:
+                    continue
+                if who == "I":
+                    who = speaker or "Speaker"
+                what = _clean(match.group("what"))
+                if len(what.split()) >= 2:
+                    return f"{who} will {what}"
+            return None
+        if rule == "discussion":
+            return sentence if _DISCUSSION.search(sentence) else None
+        if rule == "team_todo":
+            match = _TEAM_TODO.search(sentence)
+            if not match:
+                return None
+            what = _clean(match.group("what") or match.group("what2"))
+            return _capitalize(what) if len(what.split()) >= 3 else None
+        if rule == "follow_up":
+            return sentence if _FOLLOW_UP.search(sentence) else None
+        if rule == "question":
+            if sentence.endswith("?") and len(sentence.split()) >= self.min_question_words:
+                return sentence
+            return None
+        return None
+
+    @staticmethod
+    def _turns(transcript: str) -> List[Tuple[Optional[str], str]]:
+        """(speaker, sentence) pairs; sentences are verbatim substrings of the transcript."""
+        turns = []
+        for line in transcript.splitlines():
+            match = _SPEAKER.match(line)
+            if match and not _TODO_PREFIX.match(line):
+                speaker, text = match.group(1).strip(), match.group(2)
+            else:
+                speaker, text = None, line
+            for sentence in _SENTENCE.findall(text):
+                sentence = sentence.strip()
+                if sentence:
+                    turns.append((speaker, sentence))
+        return turns
+
+    @staticmethod
+    def _next_speaker(turns: List[Tuple[Optional[str], str]], index: int, speaker: Optional[str]) -> Optional[str]:
+        for other, _ in turns[index + 1:]:
+            if other and other != speaker:
+                return other
+        return None
+
+    @staticmethod
+    def _summary(turns: List[Tuple[Optional[str], str]], cards: List[Dict], agenda_items: Optional[List[str]]) -> Dict:
+        speakers = sorted({s for s, _ in turns if s})
+        if agenda_items:
+            topics = ", ".join(agenda_items[:3])
+        else:
+            counts = Counter(
+                w for _, sentence in turns for w in _WORD.findall(sentence.lower())
+                if len(w) > 3 and w not in _STOPWORDS
+            )
+            topics = ", ".join(w for w, _ in counts.most_common(3)) or "general updates"
+
+        by_type = Counter(card["type"] for card in cards)
+        tallies = [
+            f"{count} {label}{'s' if count != 1 else ''}" for label, count in (
+                ("action item", by_type[CardType.ACTION_ITEM.value] + by_type[CardType.TODO.value]),
+                ("decision", by_type[CardType.DECISION.value]),
+                ("open question", by_type[CardType.QUESTION.value]),
+            ) if count
+        ]
+        who = f"{', '.join(speakers)} discussed" if speakers else "The meeting covered"
+        content = f"{who} {topics}."
+        if tallies:
+            content += f" Recorded {', '.join(tallies)}."
+        return {"type": CardType.TLDR.value, "title": "Meeting Summary", "content": content, "segment": ""}
+
+    @staticmethod
+    def _title(content: str, limit: int = 50) -> str:
+        title = content.rstrip(".?! ")
+        if len(title) <= limit:
+            return title
+        return title[:limit].rsplit(" ", 1)[0].rstrip(",;:") + "..."
+
+
+def _clean(text: str) -> str:
+    text = text.strip().rstrip(".?!,;: ")
+    return re.sub(r"^(?:also|then|just|please)\s+", "", text, flags=re.IGNORECASE)
+
+
+def _capitalize(text: str) -> str:
+    return text[:1].upper() + text[1:]
@@ -0,0 +1,177 @@
+"""
+Extraction Job Queue - background card extraction backed by a job table.
+
+Jobs are persisted in `extraction_jobs` before being handed to an in-process
+worker pool, so a restarted process can pick up work that was queued or
+interrupted. Jobs are claimed with a conditional UPDATE, which keeps several
+processes from running the same job twice.
+"""
+
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import requests
+
+from app.database import db
+from app.models import ExtractionJob, JobStatus, Meeting, Canvas, CardType
+from app.schemas import ExtractionJobSchema
+from app.services.extraction_service import get_extraction_service
+from app.services.meeting_extraction import apply_extraction
+from app.services.telemetry import get_extraction_telemetry
+from app.services.webhooks import post_callback
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionJobQueue:
+    """
+    Worker pool that processes ExtractionJob rows.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, stale_after_seconds: int = 600):
+        self.max_workers = max_workers or int(os.getenv("EXTRACTION_JOB_WORKERS", "4"))
+        self.stale_after = timedelta(seconds=stale_after_seconds)
+        self.app = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.app = app
+        app.extensions["extraction_jobs"] = self
+
+    def enqueue(self, job_id: int) -> None:
+        """Hand a committed job to the worker pool."""
+        self._get_executor().submit(self._run, job_id)
+
+    def run_batch(self, job_ids: List[int], max_workers: Optional[int] = None) -> None:
+        """
+        Run committed jobs to completion and return when all have finished.
+
+        Uses its own pool of at most max_workers threads (default: the
+        queue's worker count), so a large batch cannot starve queued jobs.
+        Each job runs in its own application context, exactly as a queued
+        job would.
+        """
+        workers = max(1, min(max_workers or self.max_workers, len(job_ids) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extraction-batch") as pool:
+            list(pool.map(self._run, job_ids))
+
+    def recover(self) -> int:
+        """
+        Re-enqueue queued jobs and jobs whose worker died mid-run.
+
+        Must be called inside an application context.
+        """
+        stale_before = datetime.utcnow() - self.stale_after
+        ExtractionJob.query.filter(
+            ExtractionJob.status == JobStatus.RUNNING,
+            ExtractionJob.started_at < stale_before
+        ).update({"status": JobStatus.QUEUED}, synchronize_session=False)
+        db.session.commit()
+
+        job_ids = [
+            row.id for row in ExtractionJob.query
+            .with_entities(ExtractionJob.id)
+            .filter(ExtractionJob.status == JobStatus.QUEUED)
+            .order_by(ExtractionJob.created_at.asc())
+        ]
+        for job_id in job_ids:
+            self.enqueue(job_id)
+
+        if job_ids:
+            logger.info(f"Recovered {len(job_ids)} extraction jobs")
+        return len(job_ids)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="extraction-job",
+                )
+            return self._executor
+
+    def _claim(self, job_id: int) -> bool:
+        claimed = ExtractionJob.query.filter_by(
+            id=job_id, status=JobStatus.QUEUED
+        ).update({
+            "status": JobStatus.RUNNING,
+            "started_at": datetime.utcnow(),
+            "attempts": ExtractionJob.attempts + 1,
+        }, synchronize_session=False)
+        db.session.commit()
+        return claimed == 1
+
+    def _run(self, job_id: int) -> None:
+        with self.app.app_context():
+            try:
+                if not self._claim(job_id):
+                    return
+
+                job = db.session.get(ExtractionJob, job_id)
+                # LLM calls are recorded against the meeting and flushed on teardown
+                get_extraction_telemetry().begin(job.meeting_id)
+                meeting = db.session.get(Meeting, job.meeting_id)
+                canvas = db.session.get(Canvas, job.canvas_id) if job.canvas_id else None
+                if meeting is None or canvas is None:
+                    raise ValueError("Meeting or canvas no longer exists")
+
+                requested_types = [CardType(t) for t in job.requested_card_types or []]
+                transcript, agenda_items = meeting.transcript, meeting.agenda_items
+                db.session.commit()
+                extracted_cards, uncovered = get_extraction_service().analyze_meeting(
+                    transcript=transcript,
+                    agenda_items=agenda_items,
+                    requested_types=requested_types,
+                    backend=job.extraction_backend
+                )
+                cards = apply_extraction(meeting, canvas, extracted_cards, uncovered)
+
+                job.status = JobStatus.SUCCEEDED
+                job.cards_created = len(cards)
+                job.finished_at = datetime.utcnow()
+                db.session.commit()
+                logger.info(f"Extraction job {job_id} created {len(cards)} cards")
+
+            except Exception as e:
+                logger.error(f"Extraction job {job_id} failed: {e}")
+                db.session.rollback()
+                job = db.session.get(ExtractionJob, job_id)
+                if job is None:
+                    return
+                job.status = JobStatus.FAILED
+                job.error = str(e)
+                job.finished_at = datetime.utcnow()
+                db.session.commit()
+
+            job = db.session.get(ExtractionJob, job_id)
+            if job is not None and job.callback_url and job.status in (JobStatus.SUCCEEDED, JobStatus.FAILED):
+                self._notify(job)
+
+    def _notify(self, job: ExtractionJob) -> None:
+        """POST the final job state to the job's webhook."""
+        try:
+            # Re-checked at send time: the host may resolve differently than
+            # at creation. The POST goes to the address checked here.
+            response = post_callback(job.callback_url, ExtractionJobSchema().dump(job), timeout=10)
+            job.callback_status = response.status_code
+        except ValueError as e:
+            logger.warning(f"Webhook for extraction job {job.id} not sent: {e}")
+            job.callback_status = 0
+        except requests.RequestException as e:
+            logger.warning(f"Webhook for extraction job {job.id} failed: {e}")
+            job.callback_status = 0
+        db.session.commit()
+
+
+job_queue = ExtractionJobQueue()
@@ -0,0 +1,169 @@
+"""
+Incremental parsing of JSON arrays arriving in pieces from a streaming LLM,
+and tolerant parsing of complete LLM responses.
+"""
+
+import re
+import json
+import logging
+from typing import Any, List
+
+logger = logging.getLogger(__name__)
+
+_DECODER = json.JSONDecoder()
+
+_VALUE_START = re.compile(r"[\[{]")
+_ELEMENT_START = re.compile(r"[^\s,]")
+_SCALAR_END = re.compile(r"[\s,\]]")
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class JsonArrayStream:
+    """
+    Emits the elements of a top-level JSON array as soon as each one is complete.
+
+    Text before the opening bracket (markdown fences, preamble) is skipped.
+    String literals and escapes are tracked so brackets and braces inside
+    card content do not confuse the parser. Elements may be objects, arrays,
+    strings or other scalars; an element that is not valid JSON is skipped.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._element_start = None
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def feed(self, text: str) -> List[Any]:
+        """Consume more text and return the elements completed by it."""
+        if self._finished:
+            return []
+
+        self._buffer += text
+        buffer = self._buffer
+        completed = []
+
+        while self._pos < len(buffer):
+            if not self._started:
+                start = buffer.find("[", self._pos)
+                if start < 0:
+                    self._pos = len(buffer)
+                    break
+                self._started = True
+                self._pos = start + 1
+                continue
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, self._pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        self._pos = match.start()  # Wait for the escaped character
+                        break
+                    self._pos = match.end() + 1
+                    continue
+                self._in_string = False
+                self._pos = match.end()
+                if self._depth == 0:
+                    self._emit(completed)
+                continue
+
+            if self._element_start is None:
+                match = _ELEMENT_START.search(buffer, self._pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    break
+                char, start = match.group(), match.start()
+                if char == "]":
+                    self._finished = True
+                    self._pos = start + 1
+                    break
+                self._element_start = start
+                self._pos = start + 1
+                if char in "[{":
+                    self._depth = 1
+                elif char == '"':
+                    self._in_string = True
+                else:
+                    end = _SCALAR_END.search(buffer, start)
+                    if end is None:
+                        # Numbers and literals are only complete once a delimiter follows
+                        self._element_start = None
+                        self._pos = start
+                        break
+                    self._pos = end.start()
+                    self._emit(completed)
+                continue
+
+            match = _STRUCTURAL.search(buffer, self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                break
+            char = match.group()
+            self._pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(completed)
+
+        self._compact()
+        return completed
+
+    def _emit(self, completed: List[Any]) -> None:
+        element = self._buffer[self._element_start:self._pos]
+        self._element_start = None
+        try:
+            completed.append(json.loads(element))
+        except ValueError:
+            logger.warning(f"Skipping malformed JSON array element: {element[:80]!r}")
+
+    def _compact(self) -> None:
+        """Drop consumed text that no pending element still needs."""
+        keep_from = self._element_start if self._element_start is not None else self._pos
+        if keep_from > 0:
+            self._buffer = self._buffer[keep_from:]
+            self._pos -= keep_from
+            if self._element_start is not None:
+                self._element_start = 0
+
+
+def parse_json_response(text: str) -> Any:
+    """
+    Parse the JSON value in a complete LLM response.
+
+    Markdown fences, preamble and trailing commentary around the value are
+    ignored. When a top-level array is cut short (e.g. the output token limit
+    was hit), the elements completed before the cut are returned instead of
+    failing the whole response. Raises ValueError when nothing can be parsed.
+    """
+    match = _VALUE_START.search(text)
+    if match is None:
+        raise ValueError("No JSON value found in response")
+
+    try:
+        value, _ = _DECODER.raw_decode(text, match.start())
+        return value
+    except ValueError:
+        if match.group() != "[":
+            raise
+
+    stream = JsonArrayStream()
+    elements = stream.feed(text[match.start():])
+    if not elements and not stream.finished:
+        raise ValueError("Truncated JSON array with no complete elements")
+    logger.warning(f"Recovered {len(elements)} elements from a malformed or truncated JSON array")
+    return elements
@@ -0,0 +1,189 @@
+"""
+Live Extraction - incremental transcript appends and delta card extraction.
+
+Live captioning feeds append text to a meeting while it is in progress. Each
+append is stored as a TranscriptChunk and concatenated onto
+Meeting.transcript. Once enough unextracted text has accumulated, only that
+text is sent to the LLM, together with a short window of the preceding
+transcript and the cards already on the board, so cards appear during the
+meeting without re-processing the full transcript on every append.
+"""
+
+import os
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func
+from sqlalchemy.exc import IntegrityError
+
+from app.database import db
+from app.models import Meeting, Canvas, Card, CardType, TranscriptChunk
+from app.services.extraction_service import ExtractionService
+from app.services.meeting_extraction import add_generated_cards, card_identity, place_after_existing
+
+logger = logging.getLogger(__name__)
+
+# TL;DR needs the whole meeting; refresh it with /reextract once the meeting ends
+LIVE_DEFAULT_TYPES = [CardType.TODO, CardType.ACTION_ITEM, CardType.DECISION, CardType.QUESTION]
+
+# Attempts at allocating the next sequence when concurrent appends collide
+SEQUENCE_ATTEMPTS = 5
+
+
+def append_transcript_chunk(
+    meeting: Meeting,
+    text: str,
+    sequence: Optional[int] = None,
+) -> Tuple[TranscriptChunk, bool]:
+    """
+    Append text to a meeting's transcript and record it as a chunk.
+
+    A client-supplied sequence makes retries idempotent: if a chunk with that
+    sequence already exists it is returned unchanged. Without one the next
+    sequence is allocated; the append runs in a savepoint so a concurrent
+    append that took the same sequence rolls back only this attempt, which
+    is retried with a fresh sequence. Returns (chunk, created). Records are
+    added to the session; committing is left to the caller.
+    """
+    for attempt in range(SEQUENCE_ATTEMPTS):
+        chunk_sequence = sequence
+        if chunk_sequence is not None:
+            existing = TranscriptChunk.query.filter_by(meeting_id=meeting.id, sequence=chunk_sequence).first()
+            if existing:
+                return existing, False
+        else:
+            last = db.session.query(func.max(TranscriptChunk.sequence)).filter_by(meeting_id=meeting.id).scalar()
+            chunk_sequence = (last or 0) + 1
+
+        try:
+            with db.session.begin_nested():
+                chunk = _insert_chunk(meeting, text, chunk_sequence)
+            return chunk, True
+        except IntegrityError:
+            # Another append took the sequence first. A client-supplied
+            # sequence is then found as existing on the next attempt.
+            logger.info(f"Transcript chunk {chunk_sequence} of meeting {meeting.id} was taken concurrently")
+            if attempt + 1 == SEQUENCE_ATTEMPTS:
+                raise
+
+
+def _insert_chunk(meeting: Meeting, text: str, sequence: int) -> TranscriptChunk:
+    """Concatenate text onto the transcript and add its chunk (flushed)."""
+    # Concatenate and update the summary columns in one SQL statement, so
+    # concurrent appends cannot overwrite each other and an append costs the
+    # same however long the transcript is. The hash would need the whole
+    # text; it is cleared and recomputed when the transcript is next read.
+    length = func.coalesce(Meeting.transcript_length, func.length(Meeting.transcript))
+    has_text = length > 0
+    Meeting.query.filter_by(id=meeting.id).update(
+        {
+            Meeting.transcript: Meeting.transcript + case((has_text, "\n"), else_="") + text,
+            Meeting.transcript_length: length + case((has_text, 1), else_=0) + len(text),
+            Meeting.transcript_word_count: func.coalesce(Meeting.transcript_word_count, 0) + len(text.split()),
+            Meeting.transcript_hash: None,
+            Meeting.updated_at: datetime.utcnow(),
+        },
+        synchronize_session=False,
+    )
+    db.session.expire(meeting, [
+        "transcript", "transcript_length", "transcript_word_count", "transcript_hash", "updated_at",
+    ])
+
+    chunk = TranscriptChunk(
+        meeting_id=meeting.id,
+        sequence=sequence,
+        text=text,
+        start_offset=meeting.transcript_length - len(text),
+    )
+    db.session.add(chunk)
+    db.session.flush()
+    return chunk
+
+
+def extract_pending_chunks(
+    meeting: Meeting,
+    canvas: Canvas,
+    requested_types: List[CardType],
+    extraction_service: ExtractionService,
+    min_chars: Optional[int] = None,
+    context_chars: Optional[int] = None,
+) -> Dict:
+    """
+    Run delta extraction over the meeting's unextracted chunks.
+
+    Nothing is sent until at least min_chars of new text is pending. Pending
+    chunks are claimed (and the claim committed) before the LLM call, so a
+    concurrent append does not extract the same text twice; on failure the
+    claim is released and the chunks are retried with the next append.
+
+    Returns a dict with status ("extracted", "buffering" or "in_progress"),
+    pending_chars and the created Card records under cards. Commits.
+    """
+    if min_chars is None:
+        min_chars = int(os.getenv("LIVE_EXTRACTION_MIN_CHARS", "300"))
+    if context_chars is None:
+        context_chars = int(os.getenv("LIVE_CONTEXT_CHARS", "2000"))
+    max_existing = int(os.getenv("LIVE_MAX_EXISTING_CARDS", "50"))
+
+    pending = TranscriptChunk.query.filter_by(
+        meeting_id=meeting.id, extracted=False
+    ).order_by(TranscriptChunk.sequence).all()
+    pending_chars = sum(len(chunk.text) for chunk in pending)
+
+    if not pending or pending_chars < min_chars:
+        db.session.commit()
+        return {"status": "buffering", "pending_chars": pending_chars, "cards": []}
+
+    ids = [chunk.id for chunk in pending]
+    claimed = TranscriptChunk.query.filter(
+        TranscriptChunk.id.in_(ids), TranscriptChunk.extracted.is_(False)
+    ).update({TranscriptChunk.extracted: True}, synchronize_session=False)
+    if claimed != len(ids):
+        db.session.rollback()
+        return {"status": "in_progress", "pending_chars": pending_chars, "cards": []}
+    db.session.commit()
+
+    delta = "\n".join(chunk.text for chunk in pending)
+    context = _context_window(meeting.transcript, pending[0].start_offset, context_chars)
+    generated = Card.query.filter_by(meeting_id=meeting.id, is_generated=True).order_by(Card.id).all()
+    existing_cards = [
+        {"type": card.card_type.value, "title": card.title, "content": card.content}
+        for card in generated[-max_existing:]
+    ]
+
+    try:
+        extracted = extraction_service.extract_delta(context, delta, existing_cards, requested_types)
+    except Exception:
+        db.session.rollback()
+        TranscriptChunk.query.filter(TranscriptChunk.id.in_(ids)).update(
+            {TranscriptChunk.extracted: False}, synchronize_session=False
+        )
+        db.session.commit()
+        raise
+
+    known = {card_identity(card.card_type, card.content) for card in generated}
+    new_cards = []
+    for card_data in extracted:
+        identity = card_identity(card_data["type"], card_data["content"])
+        if identity not in known:
+            known.add(identity)
+            new_cards.append(card_data)
+
+    cards = add_generated_cards(meeting, canvas, place_after_existing(canvas, new_cards))
+    pending[-1].cards_created = len(cards)
+    db.session.commit()
+
+    logger.info(f"Live extraction for meeting {meeting.id}: {len(cards)} new cards from {len(pending)} chunks")
+    return {"status": "extracted", "pending_chars": 0, "cards": cards}
+
+
+def _context_window(transcript: str, start: int, context_chars: int) -> str:
+    """Up to context_chars of transcript before start, beginning on a line boundary."""
+    if context_chars <= 0 or start <= 0:
+        return ""
+    window_start = max(0, start - context_chars)
+    window = transcript[window_start:start]
+    if window_start > 0 and "\n" in window:
+        window = window[window.index("\n") + 1:]
+    return window.strip()
@@ -0,0 +1,147 @@
+"""
+Meeting Extraction - turns extraction results into database records.
+
+Shared by the synchronous meeting endpoints and the background job workers.
+Records are added to the current session; committing is left to the caller.
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+from sqlalchemy.orm import selectinload
+
+from app.database import db
+from app.models import Meeting, Canvas, Card, CardType, CardStatus
+
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def card_identity(card_type, content: str) -> Tuple[str, str]:
+    """(type, normalized content) key used to match regenerated cards to existing ones."""
+    type_value = card_type.value if hasattr(card_type, 'value') else card_type
+    return type_value, _NON_WORD.sub(" ", (content or "").lower()).strip()
+
+
+def add_generated_cards(meeting: Meeting, canvas: Canvas, extracted_cards: List[Dict]) -> List[Card]:
+    """Create Card records for extracted card dicts."""
+    cards = []
+    for card_data in extracted_cards:
+        card = Card(
+            meeting_id=meeting.id,
+            canvas_id=canvas.id,
+            card_type=card_data["type"],
+            title=card_data["title"],
+            content=card_data["content"],
+            is_generated=True,
+            transcript_segment=card_data.get("segment"),
+            position_x=card_data.get("position_x", 0),
+            position_y=card_data.get("position_y", 0)
+        )
+        db.session.add(card)
+        cards.append(card)
+    return cards
+
+
+def place_after_existing(canvas: Canvas, extracted_cards: List[Dict]) -> List[Dict]:
+    """Position new card dicts on the canvas grid after the cards already there."""
+    offset = Card.query.filter_by(canvas_id=canvas.id).count()
+    for i, card_data in enumerate(extracted_cards):
+        card_data["position_x"] = ((offset + i) % 3) * 300
+        card_data["position_y"] = ((offset + i) // 3) * 200
+    return extracted_cards
+
+
+def apply_extraction(
+    meeting: Meeting,
+    canvas: Canvas,
+    extracted_cards: List[Dict],
+    uncovered: List[str],
+) -> List[Card]:
+    """Add the result of ExtractionService.analyze_meeting to a meeting."""
+    cards = add_generated_cards(meeting, canvas, extracted_cards)
+
+    if meeting.agenda_items:
+        meeting.uncovered_agenda_items = uncovered
+
+    return cards
+
+
+def _is_user_modified(card: Card) -> bool:
+    """True if a user has touched a generated card since it was extracted."""
+    if card.status not in (None, CardStatus.DRAFT):
+        return True
+    if card.updates or card.child_cards:
+        return True
+    if card.created_at and card.updated_at:
+        return (card.updated_at - card.created_at).total_seconds() > 1
+    return False
+
+
+def existing_generated_types(meeting: Meeting) -> List[CardType]:
+    """Card types that already have generated cards on the meeting."""
+    rows = Card.query.with_entities(Card.card_type).filter_by(
+        meeting_id=meeting.id, is_generated=True
+    ).distinct()
+    return [row.card_type for row in rows]
+
+
+def upsert_generated_cards(
+    meeting: Meeting,
+    canvas: Canvas,
+    extracted_cards: List[Dict],
+    requested_types: List[CardType],
+) -> Dict[str, int]:
+    """
+    Merge regenerated cards into the meeting instead of replacing them all.
+
+    Cards are matched by type and normalized content. Matches keep their
+    id, position and edits. Unmatched new cards are appended after the
+    canvas's existing cards. Stale generated cards of the requested types
+    are deleted unless a user has modified them. Other types are untouched.
+    """
+    # Load what _is_user_modified checks and what deleting a card touches
+    # up front, not one lazy load per card or canvas
+    existing = Card.query.options(
+        selectinload(Card.updates),
+        selectinload(Card.child_cards),
+        selectinload(Card.canvas),
+    ).filter(
+        Card.meeting_id == meeting.id,
+        Card.is_generated.is_(True),
+        Card.card_type.in_(requested_types)
+    ).all()
+    by_identity = {card_identity(c.card_type, c.content): c for c in existing}
+
+    matched = set()
+    new_cards = []
+    for card_data in extracted_cards:
+        identity = card_identity(card_data["type"], card_data["content"])
+        card = by_identity.get(identity)
+        if card is None:
+            new_cards.append(card_data)
+            continue
+        matched.add(card.id)
+        if not card.transcript_segment and card_data.get("segment"):
+            card.transcript_segment = card_data["segment"]
+
+    removed = 0
+    kept_modified = 0
+    for card in existing:
+        if card.id in matched:
+            continue
+        if _is_user_modified(card):
+            kept_modified += 1
+            continue
+        db.session.delete(card)
+        removed += 1
+    db.session.flush()
+
+    add_generated_cards(meeting, canvas, place_after_existing(canvas, new_cards))
+
+    return {
+        "created": len(new_cards),
+        "unchanged": len(matched),
+        "removed": removed,
+        "kept_modified": kept_modified,
+    }
@@ -0,0 +1,190 @@
+"""
+Model Router - picks the Gemini model and generation settings per request.
+
+A 200-word stand-up does not need the same model as a three-hour workshop.
+Routes are checked in order and the first one whose conditions all hold is
+used; a route without conditions matches everything. Conditions are:
+
+- max_transcript_tokens / min_transcript_tokens: estimated tokens of the
+  preprocessed transcript
+- card_types: the route only handles requests whose card types are all in
+  this list
+- max_deadline_seconds: the route only handles requests with a latency
+  deadline at or below this (tight SLOs go to fast tiers)
+
+Each route names a model and may override generation settings such as
+maxOutputTokens or temperature. Routes come from EXTRACTION_ROUTES (a JSON
+list); by default short transcripts go to gemini-2.0-flash-lite and
+everything else to gemini-2.0-flash.
+"""
+
+import os
+import json
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from app.models import CardType
+from app.services.gemini_client import DEFAULT_GENERATION_CONFIG, GEMINI_MODEL, structured_generation_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTES = [
+    {"name": "fast", "model": "gemini-2.0-flash-lite", "max_transcript_tokens": 3000},
+    {"name": "standard", "model": GEMINI_MODEL},
+]
+
+_ROUTE_FIELDS = {
+    "name", "model", "max_transcript_tokens", "min_transcript_tokens",
+    "card_types", "max_deadline_seconds", "generation_config",
+}
+
+
+class Route:
+    """
+    One routing rule: match conditions plus the model and settings to use.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        max_transcript_tokens: Optional[int] = None,
+        min_transcript_tokens: Optional[int] = None,
+        card_types: Optional[List[str]] = None,
+        max_deadline_seconds: Optional[float] = None,
+        generation_config: Optional[Dict] = None,
+    ):
+        self.name = name
+        self.model = model
+        self.max_transcript_tokens = max_transcript_tokens
+        self.min_transcript_tokens = min_transcript_tokens
+        self.card_types = {CardType(t) for t in card_types} if card_types is not None else None
+        self.max_deadline_seconds = max_deadline_seconds
+        self.generation_config_overrides = generation_config or {}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Route":
+        unknown = set(data) - _ROUTE_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown route fields: {', '.join(sorted(unknown))}")
+        if not data.get("name") or not data.get("model"):
+            raise ValueError("Each route needs a name and a model")
+        return cls(**data)
+
+    @property
+    def unconditional(self) -> bool:
+        return (
+            self.max_transcript_tokens is None and self.min_transcript_tokens is None
+            and self.card_types is None and self.max_deadline_seconds is None
+        )
+
+    def matches(
+        self,
+        transcript_tokens: int,
+        requested_types: List[CardType],
+        deadline_seconds: Optional[float] = None,
+    ) -> bool:
+        if self.max_transcript_tokens is not None and transcript_tokens > self.max_transcript_tokens:
+            return False
+        if self.min_transcript_tokens is not None and transcript_tokens < self.min_transcript_tokens:
+            return False
+        if self.card_types is not None and not set(requested_types) <= self.card_types:
+            return False
+        if self.max_deadline_seconds is not None and (
+            deadline_seconds is None or deadline_seconds > self.max_deadline_seconds
+        ):
+            return False
+        return True
+
+    def generation_config(self, response_schema: Optional[Dict] = None) -> Dict:
+        """Default generation config with this route's overrides, in JSON mode if a schema is given."""
+        config = dict(DEFAULT_GENERATION_CONFIG, **self.generation_config_overrides)
+        if response_schema is not None:
+            return structured_generation_config(response_schema, base=config)
+        return config
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "model": self.model,
+            "max_transcript_tokens": self.max_transcript_tokens,
+            "min_transcript_tokens": self.min_transcript_tokens,
+            "card_types": sorted(t.value for t in self.card_types) if self.card_types is not None else None,
+            "max_deadline_seconds": self.max_deadline_seconds,
+            "generation_config": self.generation_config_overrides,
+        }
+
+
+class ModelRouter:
+    """
+    Ordered routing rules with per-route call metrics.
+    """
+
+    def __init__(self, routes: List[Route], default_model: str = GEMINI_MODEL):
+        routes = list(routes)
+        names = [route.name for route in routes]
+        if len(set(names)) != len(names):
+            raise ValueError("Route names must be unique")
+        if not routes or not routes[-1].unconditional:
+            routes.append(Route("default", default_model))
+        self.routes = routes
+        self.default_route = routes[-1]
+
+        self._lock = threading.Lock()
+        self._stats = {
+            route.name: {"selected": 0, "calls": 0, "errors": 0, "latency_ms_total": 0.0, "latency_ms_max": 0.0}
+            for route in routes
+        }
+
+    @classmethod
+    def from_env(cls) -> "ModelRouter":
+        """Routes from EXTRACTION_ROUTES (JSON list), or the default fast/standard tiers."""
+        raw = os.getenv("EXTRACTION_ROUTES")
+        try:
+            rules = json.loads(raw) if raw else DEFAULT_ROUTES
+            if not isinstance(rules, list):
+                raise ValueError("expected a JSON list of routes")
+            return cls([Route.from_dict(rule) for rule in rules])
+        except ValueError as e:
+            raise ValueError(f"Invalid EXTRACTION_ROUTES: {e}") from e
+
+    def select(
+        self,
+        transcript_tokens: int,
+        requested_types: Optional[List[CardType]] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> Route:
+        """First route matching the request."""
+        route = next(
+            r for r in self.routes if r.matches(transcript_tokens, requested_types or [], deadline_seconds)
+        )
+        with self._lock:
+            self._stats[route.name]["selected"] += 1
+        logger.debug(f"Routed {transcript_tokens}-token request to {route.name} ({route.model})")
+        return route
+
+    def record(self, route: Route, latency_seconds: float, failed: bool = False) -> None:
+        latency_ms = latency_seconds * 1000
+        with self._lock:
+            stats = self._stats[route.name]
+            stats["calls"] += 1
+            stats["errors"] += int(failed)
+            stats["latency_ms_total"] += latency_ms
+            stats["latency_ms_max"] = max(stats["latency_ms_max"], latency_ms)
+
+    def stats(self) -> List[Dict]:
+        """Each route's rule and its selection, call, error and latency counts."""
+        with self._lock:
+            result = []
+            for route in self.routes:
+                stats = self._stats[route.name]
+                result.append(dict(
+                    route.to_dict(),
+                    selected=stats["selected"],
+                    calls=stats["calls"],
+                    errors=stats["errors"],
+                    latency_ms_mean=round(stats["latency_ms_total"] / stats["calls"], 1) if stats["calls"] else None,
+                    latency_ms_max=round(stats["latency_ms_max"], 1),
+                ))
+            return result
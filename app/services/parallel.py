@@ -0,0 +1,58 @@
+"""
+Helpers for running independent LLM calls concurrently.
+"""
+
+import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from typing import Any, Callable, Dict, Optional
+
+
+def run_concurrently(
+    tasks: Dict[str, Callable[[], Any]],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Run independent callables in a thread pool under a shared deadline.
+
+    Returns a dict mapping each task name to its return value, or to the
+    exception it raised. Tasks still running when the deadline passes map to
+    a concurrent.futures.TimeoutError and their results are discarded.
+
+    Each task runs in a copy of the caller's context, so context variables
+    such as the telemetry scope carry over to the worker threads.
+    """
+    if not tasks:
+        return {}
+
+    if len(tasks) == 1:
+        name, task = next(iter(tasks.items()))
+        try:
+            return {name: task()}
+        except Exception as e:
+            return {name: e}
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers or len(tasks), len(tasks)),
+        thread_name_prefix="extraction",
+    )
+    futures = {name: executor.submit(contextvars.copy_context().run, task) for name, task in tasks.items()}
+    started = time.monotonic()
+
+    try:
+        wait(futures.values(), timeout=timeout)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    results = {}
+    for name, future in futures.items():
+        if future.cancelled() or not future.done():
+            future.cancel()
+            elapsed = time.monotonic() - started
+            results[name] = FutureTimeoutError(f"{name} did not finish within {elapsed:.1f}s")
+        elif future.exception() is not None:
+            results[name] = future.exception()
+        else:
+            results[name] = future.result()
+    return results
@@ -0,0 +1,254 @@
+"""
+Client-side protection for calls to the Gemini API.
+
+- TokenBucket: requests-per-minute and tokens-per-minute limits
+- AdaptiveConcurrencyLimiter: AIMD limit on in-flight calls
+- RetryPolicy: exponential backoff with full jitter, honouring Retry-After
+- CircuitBreaker: fails fast while the upstream keeps failing
+"""
+
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+class UpstreamUnavailableError(Exception):
+    """The LLM upstream could not serve the request (retries exhausted or circuit open)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """The circuit breaker is open; the call was not attempted."""
+
+
+class RateLimitTimeout(UpstreamUnavailableError):
+    """Waiting for rate limit capacity would exceed the caller's deadline."""
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at rate_per_minute.
+
+    A rate of 0 disables the bucket.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_minute = rate_per_minute
+        self.capacity = capacity or rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.throttled_total = 0
+        self.wait_seconds_total = 0.0
+
+    def acquire(self, amount: float = 1, timeout: Optional[float] = None) -> None:
+        """Block until amount tokens are available; raise RateLimitTimeout past timeout."""
+        if self.rate_per_minute <= 0:
+            return
+        amount = min(amount, self.capacity)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        throttled = False
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) * 60.0 / self.rate_per_minute
+                if not throttled:
+                    self.throttled_total += 1
+                    throttled = True
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise RateLimitTimeout("Client-side rate limit exceeded", retry_after=wait)
+            time.sleep(min(wait, 1.0))
+            with self._lock:
+                self.wait_seconds_total += min(wait, 1.0)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_minute / 60.0)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._refill()
+            return {
+                "rate_per_minute": self.rate_per_minute,
+                "available": round(self._tokens, 1) if self.rate_per_minute > 0 else None,
+                "throttled_total": self.throttled_total,
+                "wait_seconds_total": round(self.wait_seconds_total, 3),
+            }
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Additive-increase / multiplicative-decrease limit on concurrent calls.
+
+    Each success raises the limit by 1/limit; an overload signal (429, 5xx,
+    timeout) halves it.
+    """
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 32):
+        self.minimum = minimum
+        self.maximum = maximum
+        self._limit = float(max(minimum, min(initial, maximum)))
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self.overloads_total = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout=timeout):
+                raise RateLimitTimeout("Concurrency limit reached")
+            self._in_flight += 1
+
+    def release(self, overloaded: bool = False) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self.overloads_total += 1
+                self._limit = max(self.minimum, self._limit / 2)
+            else:
+                self._limit = min(self.maximum, self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+
+    def stats(self) -> Dict:
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "minimum": self.minimum,
+                "maximum": self.maximum,
+                "in_flight": self._in_flight,
+                "overloads_total": self.overloads_total,
+            }
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+    """
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before retry number attempt (0-based).
+
+        Retry-After is returned as given, even above max_delay: waiting less
+        would only earn another 429, so callers fail fast instead of waiting
+        longer than max_delay.
+        """
+        if retry_after is not None:
+            return max(retry_after, 0.0)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given in seconds or as an HTTP date."""
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures, then allows a single
+    trial call once reset_timeout seconds have passed (half-open).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self.opened_total = 0
+        self.rejected_total = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may proceed."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            self.rejected_total += 1
+            retry_after = max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+            raise CircuitOpenError("Gemini circuit breaker is open", retry_after=retry_after or self.reset_timeout)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self._state = self.CLOSED
+
+    def release_trial(self) -> None:
+        """Give up a half-open trial slot without recording an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            was_trial = self._trial_in_flight
+            self._trial_in_flight = False
+            if was_trial or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.opened_total += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+                "opened_total": self.opened_total,
+                "rejected_total": self.rejected_total,
+            }
@@ -0,0 +1,164 @@
+"""
+Segment Locator - finds supporting transcript spans without an LLM call.
+
+A locator is built once per transcript and answers lookups in milliseconds:
+1. Exact (case-insensitive) substring match
+2. Word-shingle alignment, for quotes that differ in punctuation/whitespace
+3. IDF-weighted word overlap against speaker turns, for paraphrased content
+
+Matches are returned with character offsets into the original transcript.
+"""
+
+import math
+import re
+import hashlib
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+SHINGLE_SIZE = 3
+
+
+class SegmentLocator:
+    """
+    Index over one transcript for locating the span that best supports a text.
+    """
+
+    def __init__(self, transcript: str):
+        self.transcript = transcript
+        self._lowered = transcript.lower()
+
+        self._tokens: List[Tuple[str, int, int]] = [
+            (m.group().lower(), m.start(), m.end())
+            for m in _WORD_PATTERN.finditer(transcript)
+        ]
+
+        self._shingles: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+        words = [t[0] for t in self._tokens]
+        for i in range(len(words) - SHINGLE_SIZE + 1):
+            self._shingles[tuple(words[i:i + SHINGLE_SIZE])].append(i)
+
+        # Speaker turns / lines with their word counts, for fuzzy lookups
+        self._lines: List[Tuple[int, int, Counter]] = []
+        offset = 0
+        for line in transcript.splitlines(keepends=True):
+            stripped = line.strip()
+            if stripped:
+                start = offset + line.index(stripped)
+                counts = Counter(w.lower() for w in _WORD_PATTERN.findall(stripped))
+                self._lines.append((start, start + len(stripped), counts))
+            offset += len(line)
+
+        document_frequency = Counter()
+        for _, _, counts in self._lines:
+            document_frequency.update(counts.keys())
+        total = max(len(self._lines), 1)
+        self._idf = {
+            word: math.log((total + 1) / (df + 0.5))
+            for word, df in document_frequency.items()
+        }
+
+    def locate(self, text: str, min_score: float = 0.3) -> Optional[Dict]:
+        """
+        Find the transcript span that best matches text.
+
+        Returns a dict with start, end, text, score (0-1) and method, or None
+        when nothing scores at least min_score.
+        """
+        query = (text or "").strip().strip('"').strip()
+        if not query:
+            return None
+
+        exact = self._lowered.find(query.lower())
+        if exact >= 0:
+            return self._match(exact, exact + len(query), 1.0, "exact")
+
+        query_words = [w.lower() for w in _WORD_PATTERN.findall(query)]
+        if not query_words:
+            return None
+
+        best = self._align_shingles(query_words)
+        if best is None or best["score"] < 0.5:
+            overlap = self._best_line(query_words)
+            if overlap is not None and (best is None or overlap["score"] > best["score"]):
+                best = overlap
+
+        if best is None or best["score"] < min_score:
+            return None
+        return best
+
+    def _align_shingles(self, query_words: List[str]) -> Optional[Dict]:
+        """Vote for the transcript alignment shared by most query shingles."""
+        query_shingles = [
+            tuple(query_words[i:i + SHINGLE_SIZE])
+            for i in range(len(query_words) - SHINGLE_SIZE + 1)
+        ]
+        if not query_shingles:
+            return None
+
+        votes: Dict[int, List[int]] = defaultdict(list)
+        for q, shingle in enumerate(query_shingles):
+            for position in self._shingles.get(shingle, ()):
+                votes[position - q].append(position)
+        if not votes:
+            return None
+
+        diagonal = max(votes, key=lambda d: len(votes[d]))
+        positions = votes[diagonal]
+        first = min(positions)
+        last = max(positions) + SHINGLE_SIZE - 1
+        score = len(positions) / len(query_shingles)
+
+        return self._match(self._tokens[first][1], self._tokens[last][2], min(score, 1.0), "shingle")
+
+    def _best_line(self, query_words: List[str]) -> Optional[Dict]:
+        """Score speaker turns by IDF-weighted overlap with the query words."""
+        query_counts = Counter(query_words)
+        weights = {w: self._idf.get(w, 0.0) for w in query_counts}
+        total_weight = sum(weights.values())
+        if total_weight <= 0:
+            return None
+
+        best_index, best_score = None, 0.0
+        for index, (_, _, counts) in enumerate(self._lines):
+            score = sum(weight for word, weight in weights.items() if word in counts)
+            if score > best_score:
+                best_index, best_score = index, score
+
+        if best_index is None:
+            return None
+        start, end, _ = self._lines[best_index]
+        return self._match(start, end, best_score / total_weight, "overlap")
+
+    def _match(self, start: int, end: int, score: float, method: str) -> Dict:
+        return {
+            "start": start,
+            "end": end,
+            "text": self.transcript[start:end],
+            "score": round(score, 3),
+            "method": method,
+        }
+
+
+_locators: "OrderedDict[str, SegmentLocator]" = OrderedDict()
+_locators_lock = threading.Lock()
+_MAX_LOCATORS = 32
+
+
+def get_segment_locator(transcript: str) -> SegmentLocator:
+    """Return a cached locator for a transcript, building it on first use."""
+    key = hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+    with _locators_lock:
+        locator = _locators.get(key)
+        if locator is not None:
+            _locators.move_to_end(key)
+            return locator
+
+    locator = SegmentLocator(transcript)
+    with _locators_lock:
+        _locators[key] = locator
+        while len(_locators) > _MAX_LOCATORS:
+            _locators.popitem(last=False)
+    return locator
@@ -0,0 +1,192 @@
+"""
+Single Flight - coalesces identical concurrent extractions into one LLM call.
+
+A double-clicked submit or several teammates importing the same Google Doc
+produce the same extraction cache key at the same time. The first caller
+for a key becomes the leader and runs the extraction; callers arriving while
+it is in flight wait for the leader and receive a copy of its result (or
+its exception).
+
+Coalescing always happens between threads of one process. When
+EXTRACTION_SINGLE_FLIGHT_DIR is set, leaders in different worker processes
+also serialize on a per-key file lock there, and the winner hands its
+result to the others through a short-lived JSON file next to the lock.
+"""
+
+import os
+import copy
+import json
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; coalescing stays in-process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Per-key in-flight call registry with optional cross-process file locks.
+    """
+
+    def __init__(
+        self,
+        lock_dir: Optional[str] = None,
+        handoff_ttl_seconds: float = 60,
+        wait_timeout: float = 300,
+    ):
+        self.lock_dir = lock_dir if fcntl is not None else None
+        self.handoff_ttl_seconds = handoff_ttl_seconds
+        self.wait_timeout = wait_timeout
+        if self.lock_dir:
+            os.makedirs(self.lock_dir, exist_ok=True)
+
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {"leaders": 0, "coalesced": 0, "cross_process_hits": 0, "wait_timeouts": 0}
+
+    def do(self, key: str, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        Waiting callers give up after timeout seconds (default wait_timeout)
+        and run fn themselves rather than failing.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self._stats["leaders"] += 1
+            else:
+                leader = False
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            if not call.done.wait(timeout if timeout is not None else self.wait_timeout):
+                with self._lock:
+                    self._stats["wait_timeouts"] += 1
+                logger.warning(f"Gave up waiting for in-flight extraction {key[:12]}")
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = self._run_leader(key, fn, timeout)
+            # Waiters copy from a snapshot so the leader's caller may mutate its result
+            call.result = copy.deepcopy(result)
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def _run_leader(self, key: str, fn: Callable[[], Any], timeout: Optional[float]) -> Any:
+        if not self.lock_dir:
+            return fn()
+
+        lock_path = os.path.join(self.lock_dir, f"{key}.lock")
+        result_path = os.path.join(self.lock_dir, f"{key}.json")
+
+        with open(lock_path, "a") as lock_file:
+            if not self._flock(lock_file, timeout if timeout is not None else self.wait_timeout):
+                with self._lock:
+                    self._stats["wait_timeouts"] += 1
+                return fn()
+            try:
+                handoff = self._read_handoff(result_path)
+                if handoff is not None:
+                    with self._lock:
+                        self._stats["cross_process_hits"] += 1
+                    return handoff
+
+                result = fn()
+                self._write_handoff(result_path, result)
+                return result
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _flock(lock_file, timeout: float) -> bool:
+        """Take an exclusive lock, polling so the wait can be bounded."""
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 2, 0.25)
+
+    def _read_handoff(self, path: str) -> Any:
+        try:
+            if time.time() - os.path.getmtime(path) > self.handoff_ttl_seconds:
+                return None
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_handoff(self, path: str, result: Any) -> None:
+        try:
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(result, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Single-flight handoff write failed: {e}")
+        self._prune_handoffs()
+
+    def _prune_handoffs(self) -> None:
+        """Remove handoff files well past their TTL (lock files are reused)."""
+        cutoff = time.time() - self.handoff_ttl_seconds * 10
+        try:
+            for entry in os.scandir(self.lock_dir):
+                if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+        except OSError:
+            pass
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(
+                self._stats,
+                in_flight=len(self._calls),
+                cross_process=bool(self.lock_dir),
+            )
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Process-wide single-flight registry configured from the environment."""
+    global _single_flight
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                _single_flight = SingleFlight(
+                    lock_dir=os.getenv("EXTRACTION_SINGLE_FLIGHT_DIR") or None,
+                    handoff_ttl_seconds=float(os.getenv("EXTRACTION_SINGLE_FLIGHT_TTL_SECONDS", "60")),
+                )
+    return _single_flight
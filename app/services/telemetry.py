@@ -0,0 +1,272 @@
+"""
+Extraction Telemetry - per-call latency, token usage and cost records.
+
+Every Gemini call (and every extraction cache hit) is recorded with its
+prompt kind, model, latency, input/output tokens from usageMetadata, retry
+count and outcome. Records are buffered in memory for the duration of an
+application context (a request or a background job) and written to the
+extraction_calls table in one insert when the context is torn down, so the
+LLM call path never waits on the database.
+
+Calls made in worker threads inherit the scope of the context that started
+them (parallel.run_concurrently copies context variables), so they are
+attributed to the same meeting.
+"""
+
+import os
+import logging
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from app.database import db
+from app.models import ExtractionCall
+
+logger = logging.getLogger(__name__)
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_CACHE_HIT = "cache_hit"
+OUTCOME_UNAVAILABLE = "unavailable"
+OUTCOME_ERROR = "error"
+OUTCOME_CANCELLED = "cancelled"
+
+_scope: ContextVar[Optional[Dict]] = ContextVar("extraction_telemetry_scope", default=None)
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    # Smallest value with at least pct% of the values at or below it
+    rank = math.ceil(pct / 100.0 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+class ExtractionTelemetry:
+    """
+    Buffers ExtractionCall rows per application context and flushes them in bulk.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_pending: int = 10000,
+        retention_days: float = 30,
+        input_cost_per_mtok: float = 0.10,
+        output_cost_per_mtok: float = 0.40,
+    ):
+        self.enabled = enabled
+        self.retention = timedelta(days=retention_days)
+        self.input_cost_per_mtok = input_cost_per_mtok
+        self.output_cost_per_mtok = output_cost_per_mtok
+
+        # Records made outside any scope (scripts, unscoped threads)
+        self._orphans = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        self._stats = {"recorded": 0, "flushed": 0, "flush_errors": 0}
+
+    @classmethod
+    def from_env(cls) -> "ExtractionTelemetry":
+        return cls(
+            enabled=os.getenv("EXTRACTION_TELEMETRY", "1") != "0",
+            retention_days=float(os.getenv("EXTRACTION_TELEMETRY_RETENTION_DAYS", "30")),
+            input_cost_per_mtok=float(os.getenv("GEMINI_INPUT_COST_PER_MTOK", "0.10")),
+            output_cost_per_mtok=float(os.getenv("GEMINI_OUTPUT_COST_PER_MTOK", "0.40")),
+        )
+
+    def init_app(self, app) -> None:
+        app.extensions["extraction_telemetry"] = self
+        app.before_request(self.begin)
+        app.teardown_appcontext(self._teardown)
+
+    def begin(self, meeting_id: Optional[int] = None) -> None:
+        """Start a scope for the current context; its records are flushed at teardown."""
+        _scope.set({"meeting_id": meeting_id, "records": []})
+
+    def attribute(self, meeting_id: int) -> None:
+        """Attribute the current scope (including calls already made) to a meeting."""
+        scope = _scope.get()
+        if scope is None:
+            return
+        scope["meeting_id"] = meeting_id
+        for row in scope["records"]:
+            if row["meeting_id"] is None:
+                row["meeting_id"] = meeting_id
+
+    def record(
+        self,
+        kind: str,
+        model: Optional[str],
+        latency_seconds: float,
+        outcome: str,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+        retries: int = 0,
+    ) -> None:
+        if not self.enabled:
+            return
+        scope = _scope.get()
+        row = {
+            "created_at": datetime.utcnow(),
+            "kind": kind,
+            "model": model,
+            "meeting_id": scope["meeting_id"] if scope else None,
+            "latency_ms": int(round(latency_seconds * 1000)),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "retries": retries,
+            "cache_hit": outcome == OUTCOME_CACHE_HIT,
+            "outcome": outcome,
+        }
+        with self._lock:
+            self._stats["recorded"] += 1
+            if scope is None:
+                self._orphans.append(row)
+            else:
+                scope["records"].append(row)
+
+    def flush(self) -> int:
+        """Write the current scope's records (and any unscoped ones) in one insert."""
+        scope = _scope.get()
+        with self._lock:
+            rows = list(self._orphans)
+            self._orphans.clear()
+            if scope is not None:
+                rows.extend(scope["records"])
+                scope["records"] = []
+        if not rows:
+            return 0
+
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(ExtractionCall.__table__.insert(), rows)
+                self._prune(connection)
+        except Exception as e:
+            with self._lock:
+                self._stats["flush_errors"] += 1
+            logger.warning(f"Extraction telemetry flush failed ({len(rows)} records dropped): {e}")
+            return 0
+
+        with self._lock:
+            self._stats["flushed"] += len(rows)
+        return len(rows)
+
+    def _teardown(self, exception=None) -> None:
+        if _scope.get() is not None or self._orphans:
+            self.flush()
+        _scope.set(None)
+
+    def _prune(self, connection) -> None:
+        """Delete records past the retention period, at most once an hour."""
+        now = time.monotonic()
+        if now - self._last_prune < 3600:
+            return
+        self._last_prune = now
+        table = ExtractionCall.__table__
+        connection.execute(table.delete().where(table.c.created_at < datetime.utcnow() - self.retention))
+
+    def cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Estimated USD cost of the given token counts."""
+        return (input_tokens * self.input_cost_per_mtok + output_tokens * self.output_cost_per_mtok) / 1_000_000
+
+    def summary(self, since: datetime, kind: Optional[str] = None, top_meetings: int = 10) -> Dict:
+        """
+        Aggregate recorded calls since a point in time.
+
+        Latency percentiles are over LLM calls only (cache hits are counted
+        separately), grouped by prompt kind.
+        """
+        query = db.session.query(
+            ExtractionCall.kind,
+            ExtractionCall.model,
+            ExtractionCall.meeting_id,
+            ExtractionCall.latency_ms,
+            ExtractionCall.input_tokens,
+            ExtractionCall.output_tokens,
+            ExtractionCall.retries,
+            ExtractionCall.outcome,
+        ).filter(ExtractionCall.created_at >= since)
+        if kind:
+            query = query.filter(ExtractionCall.kind == kind)
+
+        groups = defaultdict(list)
+        meetings = defaultdict(lambda: {"calls": 0, "input_tokens": 0, "output_tokens": 0, "latency_ms": 0})
+        for row in query:
+            groups[row.kind].append(row)
+            if row.meeting_id is not None and row.outcome != OUTCOME_CACHE_HIT:
+                totals = meetings[row.meeting_id]
+                totals["calls"] += 1
+                totals["input_tokens"] += row.input_tokens or 0
+                totals["output_tokens"] += row.output_tokens or 0
+                totals["latency_ms"] += row.latency_ms
+
+        kinds = {name: self._aggregate(rows) for name, rows in sorted(groups.items())}
+        overall = self._aggregate([row for rows in groups.values() for row in rows])
+
+        ranked = sorted(
+            meetings.items(), key=lambda item: item[1]["input_tokens"] + item[1]["output_tokens"], reverse=True
+        )[:top_meetings]
+        return {
+            "since": since.isoformat(),
+            "overall": overall,
+            "kinds": kinds,
+            "top_meetings": [
+                dict(totals, meeting_id=meeting_id,
+                     estimated_cost_usd=round(self.cost(totals["input_tokens"], totals["output_tokens"]), 6))
+                for meeting_id, totals in ranked
+            ],
+            "pricing_per_million_tokens": {"input": self.input_cost_per_mtok, "output": self.output_cost_per_mtok},
+        }
+
+    def _aggregate(self, rows: List) -> Dict:
+        calls = [row for row in rows if row.outcome != OUTCOME_CACHE_HIT]
+        latencies = sorted(row.latency_ms for row in calls)
+        outcomes = defaultdict(int)
+        for row in rows:
+            outcomes[row.outcome] += 1
+        input_tokens = sum(row.input_tokens or 0 for row in calls)
+        output_tokens = sum(row.output_tokens or 0 for row in calls)
+        return {
+            "calls": len(calls),
+            "cache_hits": outcomes.get(OUTCOME_CACHE_HIT, 0),
+            "outcomes": dict(outcomes),
+            "retries": sum(row.retries for row in calls),
+            "models": sorted({row.model for row in calls if row.model}),
+            "latency_ms": {
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "max": latencies[-1] if latencies else None,
+                "mean": round(sum(latencies) / len(latencies), 1) if latencies else None,
+            },
+            "tokens": {
+                "input": input_tokens,
+                "output": output_tokens,
+                "mean_input": round(input_tokens / len(calls), 1) if calls else None,
+                "mean_output": round(output_tokens / len(calls), 1) if calls else None,
+            },
+            "estimated_cost_usd": round(self.cost(input_tokens, output_tokens), 6),
+        }
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._stats, pending_unscoped=len(self._orphans), enabled=self.enabled)
+
+
+_telemetry: Optional[ExtractionTelemetry] = None
+_telemetry_lock = threading.Lock()
+
+
+def get_extraction_telemetry() -> ExtractionTelemetry:
+    """Process-wide telemetry recorder configured from the environment."""
+    global _telemetry
+    if _telemetry is None:
+        with _telemetry_lock:
+            if _telemetry is None:
+                _telemetry = ExtractionTelemetry.from_env()
+    return _telemetry
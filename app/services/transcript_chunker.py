@@ -0,0 +1,77 @@
+"""
+Transcript Chunker - splits long transcripts for map-reduce extraction.
+
+Chunks break on paragraph and speaker-turn (line) boundaries where possible,
+falling back to sentence boundaries and finally a hard cut for very long
+lines. Consecutive chunks share a tail of whole lines so items discussed
+across a boundary are seen in full by at least one chunk.
+"""
+
+import re
+from typing import List
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_transcript(transcript: str, max_chars: int = 24000, overlap_chars: int = 1000) -> List[str]:
+    """
+    Split a transcript into chunks of at most max_chars characters.
+
+    Returns the transcript unchanged (as a single chunk) when it already fits.
+    """
+    if len(transcript) <= max_chars:
+        return [transcript]
+
+    overlap_chars = min(overlap_chars, max_chars // 2)
+    units = _split_units(transcript, max_chars)
+
+    chunks = []
+    current: List[str] = []
+    current_len = 0
+    has_new_units = False
+
+    for unit in units:
+        if has_new_units and current_len + len(unit) > max_chars:
+            chunks.append("".join(current).strip())
+            current = _overlap_tail(current, min(overlap_chars, max_chars - len(unit)))
+            current_len = sum(len(u) for u in current)
+            has_new_units = False
+        current.append(unit)
+        current_len += len(unit)
+        has_new_units = True
+
+    if has_new_units:
+        chunks.append("".join(current).strip())
+
+    return [chunk for chunk in chunks if chunk]
+
+
+def _split_units(transcript: str, max_chars: int) -> List[str]:
+    """Break the transcript into lines, splitting any over-long line further."""
+    units = []
+    for line in transcript.splitlines(keepends=True):
+        if len(line) <= max_chars:
+            units.append(line)
+            continue
+
+        sentences = _SENTENCE_BOUNDARY.split(line)
+        for i, sentence in enumerate(sentences):
+            piece = sentence if i == len(sentences) - 1 else sentence + " "
+            while len(piece) > max_chars:
+                units.append(piece[:max_chars])
+                piece = piece[max_chars:]
+            if piece:
+                units.append(piece)
+    return units
+
+
+def _overlap_tail(units: List[str], overlap_chars: int) -> List[str]:
+    """Trailing whole units of the previous chunk, up to overlap_chars."""
+    tail: List[str] = []
+    total = 0
+    for unit in reversed(units):
+        if total + len(unit) > overlap_chars:
+            break
+        tail.insert(0, unit)
+        total += len(unit)
+    return tail
@@ -0,0 +1,175 @@
+"""
+Transcript Preprocessor - normalizes transcripts before they are prompted.
+
+Pasted and Google Docs transcripts often carry caption timestamps, filler
+words, a speaker label on every line and runs of blank lines. None of that
+helps extraction, but all of it costs prompt tokens and latency. Each step
+can be switched off individually, and an optional token budget rejects
+transcripts that are still too large after normalization.
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Optional
+
+from app.services.gemini_client import estimate_tokens
+from app.services.heuristic_extractor import _TODO_PREFIX
+
+# WEBVTT headers and "00:00:01.000 --> 00:00:04.000" cue timings
+_CAPTION_LINE = re.compile(
+    r"^\s*(WEBVTT.*|\d{1,2}:\d{2}(:\d{2})?([.,]\d+)?\s*-->\s*\d{1,2}:\d{2}(:\d{2})?([.,]\d+)?.*)\s*$"
+)
+# SRT/VTT cue numbers - only stripped when a cue timing follows, so spoken
+# numbers on their own line ("2024") are kept
+_CUE_NUMBER = re.compile(r"^\s*\d+\s*$")
+# [00:01:23] and (12:34) anywhere; a bare 00:01:23 at the start of a line
+# only before a speaker label or on its own, so spoken times ("10:30 works
+# for me") are kept
+_TIMESTAMP = re.compile(
+    r"[\[(]\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d+)?[\])]"
+    r"|^\s*\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d+)?\s*[-–]?\s*(?=[A-Z][\w .'-]{0,40}?:|$)",
+    re.MULTILINE,
+)
+_FILLER = re.compile(
+    r"(?<![\w'])(?:u+m+|u+h+|e+r+m+|e+r|h+m+|m+h+m+|uh-huh|you know(?=,)|i mean(?=,))(?![\w'])[,.]?\s*",
+    re.IGNORECASE,
+)
+_SPEAKER = re.compile(r"^([A-Z][\w .'-]{0,40}?):\s*(.*)$")
+# "TODO:", "Note:" and similar labels look like speakers but each line is
+# its own item and must not be merged with the next
+_LABEL = re.compile(r"^\s*(?:notes?|decision|question|follow[- ]up|next steps?|summary|tl;?dr)\s*:", re.IGNORECASE)
+_SPACES = re.compile(r"[ \t ]+")
+_SPACE_BEFORE_PUNCT = re.compile(r"\s+([,.!?;:])")
+
+
+class TokenBudgetExceeded(ValueError):
+    """The normalized transcript is larger than the per-request token budget."""
+
+    def __init__(self, tokens: int, budget: int):
+        super().__init__(
+            f"Transcript needs about {tokens} tokens after preprocessing; "
+            f"the per-request budget is {budget}"
+        )
+        self.tokens = tokens
+        self.budget = budget
+
+
+class TranscriptPreprocessor:
+    """
+    Configurable normalization pipeline with token accounting.
+    """
+
+    def __init__(
+        self,
+        strip_timestamps: bool = True,
+        remove_fillers: bool = True,
+        compact_speakers: bool = True,
+        collapse_whitespace: bool = True,
+        token_budget: Optional[int] = None,
+    ):
+        self.strip_timestamps = strip_timestamps
+        self.remove_fillers = remove_fillers
+        self.compact_speakers = compact_speakers
+        self.collapse_whitespace = collapse_whitespace
+        self.token_budget = token_budget or None
+
+        self._lock = threading.Lock()
+        self._stats = {"transcripts": 0, "original_tokens": 0, "tokens": 0, "tokens_saved": 0}
+
+    @classmethod
+    def from_env(cls) -> "TranscriptPreprocessor":
+        def enabled(name: str) -> bool:
+            return os.getenv(name, "1") != "0"
+
+        return cls(
+            strip_timestamps=enabled("TRANSCRIPT_STRIP_TIMESTAMPS"),
+            remove_fillers=enabled("TRANSCRIPT_REMOVE_FILLERS"),
+            compact_speakers=enabled("TRANSCRIPT_COMPACT_SPEAKERS"),
+            collapse_whitespace=enabled("TRANSCRIPT_COLLAPSE_WHITESPACE"),
+            token_budget=int(os.getenv("TRANSCRIPT_TOKEN_BUDGET", "0")),
+        )
+
+    def process(self, transcript: str, record_stats: bool = True) -> Dict:
+        """
+        Normalize a transcript and enforce the token budget.
+
+        Returns a dict with the normalized text, original_tokens, tokens and
+        tokens_saved. Raises TokenBudgetExceeded when over budget. Pass
+        record_stats=False for pre-flight checks of a transcript that will be
+        processed again for the actual prompt.
+        """
+        text = transcript or ""
+
+        if self.strip_timestamps:
+            text = _TIMESTAMP.sub("", self._strip_captions(text))
+        if self.remove_fillers:
+            text = _FILLER.sub("", text)
+        if self.collapse_whitespace:
+            text = self._collapse(text)
+        if self.compact_speakers:
+            text = self._compact(text)
+
+        original_tokens = estimate_tokens(transcript or "")
+        tokens = estimate_tokens(text)
+        result = {
+            "text": text,
+            "original_tokens": original_tokens,
+            "tokens": tokens,
+            "tokens_saved": max(0, original_tokens - tokens),
+        }
+
+        if record_stats:
+            with self._lock:
+                self._stats["transcripts"] += 1
+                self._stats["original_tokens"] += original_tokens
+                self._stats["tokens"] += tokens
+                self._stats["tokens_saved"] += result["tokens_saved"]
+
+        if self.token_budget and tokens > self.token_budget:
+            raise TokenBudgetExceeded(tokens, self.token_budget)
+        return result
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._stats, token_budget=self.token_budget)
+
+    @staticmethod
+    def _strip_captions(text: str) -> str:
+        """Drop caption headers, cue timings and the cue numbers right before them."""
+        lines = text.splitlines()
+        kept = []
+        for i, line in enumerate(lines):
+            if _CAPTION_LINE.match(line):
+                continue
+            if _CUE_NUMBER.match(line) and i + 1 < len(lines) and _CAPTION_LINE.match(lines[i + 1]):
+                continue
+            kept.append(line)
+        return "\n".join(kept)
+
+    @staticmethod
+    def _collapse(text: str) -> str:
+        lines = []
+        for line in text.splitlines():
+            line = _SPACE_BEFORE_PUNCT.sub(r"\1", _SPACES.sub(" ", line)).strip()
+            if line:
+                lines.append(line)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _compact(text: str) -> str:
+        """Merge consecutive lines from the same speaker under one label."""
+        turns = []
+        current_speaker = None
+        for line in text.splitlines():
+            stripped = line.strip()
+            match = None if _TODO_PREFIX.match(stripped) or _LABEL.match(stripped) else _SPEAKER.match(stripped)
+            if match and match.group(1) == current_speaker:
+                if match.group(2):
+                    turns[-1] = f"{turns[-1]} {match.group(2)}".rstrip()
+                continue
+            # Label and unlabelled lines end the turn, so the next line of the
+            # same speaker is not appended to them
+            current_speaker = match.group(1) if match else None
+            turns.append(line)
+        return "\n".join(turns)
@@ -0,0 +1,111 @@
+"""
+Webhook URL validation and delivery for extraction job callbacks.
+
+The server POSTs job results to a client-supplied URL, so the URL must not
+reach anything only the server can reach (loopback, private networks, cloud
+metadata at 169.254.169.254). Callback URLs must be https and every address
+the host resolves to must be globally routable. Hosts listed in
+WEBHOOK_ALLOWED_HOSTS (comma-separated) skip both checks, e.g. a local
+receiver during development.
+
+URLs are checked when the meeting is created and again before sending, and
+the callback is sent to the address that was just checked rather than
+resolving the host a second time, so a DNS change (or a rebinding DNS
+server answering differently on each lookup) cannot redirect the callback
+to an internal host.
+"""
+
+import os
+import socket
+import ipaddress
+import logging
+from typing import Dict, Optional, Set
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Overrides HTTPS_PROXY/ALL_PROXY from the environment for pinned callbacks
+NO_PROXIES = {"http": None, "https": None, "all": None}
+
+
+def allowed_hosts() -> Set[str]:
+    """Hosts from WEBHOOK_ALLOWED_HOSTS, lowercased."""
+    return {h.strip().lower() for h in os.getenv("WEBHOOK_ALLOWED_HOSTS", "").split(",") if h.strip()}
+
+
+def validate_callback_url(url: str) -> Optional[str]:
+    """
+    Raise ValueError unless url is safe to POST job results to.
+
+    Returns the checked address to connect to, or None for a host in
+    WEBHOOK_ALLOWED_HOSTS.
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if not host:
+        raise ValueError("Callback URL must include a host")
+    if host in allowed_hosts():
+        return None
+    if parts.scheme != "https":
+        raise ValueError("Callback URL must use https")
+
+    try:
+        port = parts.port or 443
+        # In resolver order, without duplicates
+        addresses = list(dict.fromkeys(
+            info[4][0] for info in socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)
+        ))
+    except (socket.gaierror, UnicodeError, ValueError) as e:
+        raise ValueError(f"Callback host {host} could not be resolved") from e
+
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+        if not ip.is_global or ip.is_multicast:
+            raise ValueError(f"Callback host {host} resolves to a non-public address")
+    return addresses[0].split("%", 1)[0]
+
+
+class _PinnedHostAdapter(HTTPAdapter):
+    """Verifies TLS (SNI and certificate) against host while connecting to a pinned address."""
+
+    def __init__(self, host: str, **kwargs):
+        self.host = host
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.update(server_hostname=self.host, assert_hostname=self.host)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+
+def post_callback(url: str, payload: Dict, timeout: float = 10) -> requests.Response:
+    """
+    Validate url and POST payload to it, connecting to the validated address.
+
+    Raises ValueError if the URL is not allowed and requests.RequestException
+    if the request fails. Redirects are not followed. Proxies from the
+    environment are not used, since a proxy would resolve the host again.
+    """
+    address = validate_callback_url(url)
+    if address is None:
+        return requests.post(url, json=payload, timeout=timeout, allow_redirects=False)
+
+    parts = urlsplit(url)
+    host = parts.hostname
+    port = f":{parts.port}" if parts.port else ""
+    pinned = f"[{address}]" if ":" in address else address
+    pinned_url = urlunsplit((parts.scheme, pinned + port, parts.path, parts.query, ""))
+    host_header = (f"[{host}]" if ":" in host else host) + port
+
+    with requests.Session() as session:
+        session.mount("https://", _PinnedHostAdapter(host))
+        return session.post(
+            pinned_url,
+            json=payload,
+            headers={"Host": host_header},
+            timeout=timeout,
+            allow_redirects=False,
+            proxies=NO_PROXIES,
+        )
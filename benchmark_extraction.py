@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+End-to-end extraction benchmark for POST /api/meetings.
+
+Drives the Flask app at a fixed concurrency against mock_gemini_server.py
+and reports latency percentiles and throughput. By default the mock and the
+app both run in this process (Flask test client, throwaway SQLite database);
+pass --base-url to drive an already running server instead (start it with
+GEMINI_API_URL pointing at a running mock).
+
+Usage:
+    python benchmark_extraction.py --requests 200 --concurrency 16 --latency-ms 800
+    python benchmark_extraction.py --endpoint stream --error-rate 0.05
+    python benchmark_extraction.py --base-url http://localhost:5000 --requests 100
+"""
+import argparse
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from mock_gemini_server import api_url, build_parser, start_server
+
+ENDPOINTS = {
+    "create": "/api/meetings/",
+    "stream": "/api/meetings/stream",
+}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    # Smallest value with at least pct% of the values at or below it
+    rank = math.ceil(pct / 100.0 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def make_transcript(index, lines, unique):
+    speakers = ["Alice", "Bob", "Carol"]
+    tag = f" (meeting {index})" if unique else ""
+    return "\n".join(
+        f"{speakers[i % 3]}: Item {i} - we reviewed the rollout plan and agreed on owners{tag}."
+        for i in range(lines)
+    )
+
+
+def make_payload(index, args):
+    return {
+        "title": f"Benchmark meeting {index}",
+        "transcript": make_transcript(index, args.transcript_lines, not args.repeat_transcript),
+        "meeting_date": datetime.utcnow().isoformat(),
+        "agenda_items": ["Rollout plan", "Budget"],
+        "requested_card_types": args.card_types.split(","),
+    }
+
+
+class Driver:
+    """One HTTP client per worker thread (Flask test client or requests session)."""
+
+    def __init__(self, base_url=None, app=None):
+        self.base_url = base_url
+        self.app = app
+        self._local = threading.local()
+
+    def post(self, path, payload):
+        if self.base_url:
+            import requests
+            session = getattr(self._local, "session", None)
+            if session is None:
+                session = self._local.session = requests.Session()
+            response = session.post(self.base_url + path, json=payload, timeout=300)
+            _ = response.content
+            return response.status_code
+
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.post(path, json=payload)
+        _ = response.get_data()  # Drain streamed responses
+        return response.status_code
+
+    def get_json(self, path):
+        if self.base_url:
+            import requests
+            return requests.get(self.base_url + path, timeout=30).json()
+        return self.app.test_client().get(path).get_json()
+
+
+def run(args):
+    server = None
+    if args.base_url:
+        driver = Driver(base_url=args.base_url.rstrip("/"))
+    else:
+        server, mock = start_server(args)
+        os.environ["GEMINI_API_URL"] = api_url(server)
+        os.environ.setdefault("GEMINI_API_KEY", "mock-key")
+        os.environ.setdefault("GEMINI_REQUESTS_PER_MINUTE", "0")
+        os.environ.setdefault("GEMINI_TOKENS_PER_MINUTE", "0")
+        if args.database_url:
+            os.environ["DATABASE_URL"] = args.database_url
+        else:
+            database = os.path.join(tempfile.mkdtemp(prefix="scholarsidekick-bench-"), "bench.db")
+            os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+
+        from app.main import app  # Imported after the environment is configured
+        driver = Driver(app=app)
+
+    path = ENDPOINTS[args.endpoint]
+    for i in range(args.warmup):
+        driver.post(path, make_payload(-1 - i, args))
+    if server:
+        mock.reset_stats()
+
+    latencies = []
+    statuses = Counter()
+    lock = threading.Lock()
+
+    def one(index):
+        started = time.perf_counter()
+        try:
+            status = driver.post(path, make_payload(index, args))
+        except Exception as e:
+            status = type(e).__name__
+        elapsed = time.perf_counter() - started
+        with lock:
+            statuses[status] += 1
+            if status in (200, 201, 202):
+                latencies.append(elapsed)
+
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(one, range(args.requests)))
+    wall = time.perf_counter() - wall_started
+
+    latencies.sort()
+    print("=" * 70)
+    print(f"EXTRACTION BENCHMARK - {args.endpoint}, {args.requests} requests, concurrency {args.concurrency}")
+    print("=" * 70)
+    print(f"   Status codes:   {dict(statuses)}")
+    print(f"   Wall time:      {wall:.2f} s")
+    print(f"   Throughput:     {len(latencies) / wall:.2f} successful req/s ({args.requests / wall:.2f} total req/s)")
+    if latencies:
+        print(f"   Latency p50:    {percentile(latencies, 50) * 1000:.0f} ms")
+        print(f"   Latency p95:    {percentile(latencies, 95) * 1000:.0f} ms")
+        print(f"   Latency p99:    {percentile(latencies, 99) * 1000:.0f} ms")
+        print(f"   Latency max:    {latencies[-1] * 1000:.0f} ms")
+        print(f"   Latency mean:   {sum(latencies) / len(latencies) * 1000:.0f} ms")
+    if server:
+        print(f"   Mock Gemini:    {mock.stats}")
+        server.shutdown()
+
+    try:
+        metrics = driver.get_json("/api/metrics/gemini")
+        pool = metrics.get("pool") or {}
+        resilience = metrics.get("resilience") or {}
+        print(f"   Client pool:    {pool}")
+        print(f"   Breaker:        {(resilience.get('circuit_breaker') or {}).get('state')}")
+    except Exception as e:
+        print(f"   (metrics unavailable: {e})")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="End-to-end extraction benchmark", parents=[build_parser(add_help=False)]
+    )
+    parser.set_defaults(port=0)
+    parser.add_argument("--base-url", help="Drive a running server instead of the in-process app")
+    parser.add_argument("--database-url",
+                        help="Database for the in-process app (default: a throwaway SQLite file; "
+                             "SQLite serializes writers, so use PostgreSQL for high concurrency)")
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="create")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--transcript-lines", type=int, default=40)
+    parser.add_argument("--card-types", default="tldr,todo,decision")
+    parser.add_argument("--repeat-transcript", action="store_true",
+                        help="Send the same transcript every time (measures the cache-hit path)")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
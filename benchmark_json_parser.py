@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for parsing LLM extraction responses.
+
+Compares the previous bracket-counting parser with parse_json_response on
+large card arrays, and checks how each handles brackets inside card content
+and a truncated response.
+
+Usage: python benchmark_json_parser.py [--cards 2000] [--repeat 20]
+"""
+import argparse
+import json
+import timeit
+
+from app.services.json_stream import JsonArrayStream, parse_json_response
+
+
+def legacy_parse_json_response(text):
+    """The parser previously used by ExtractionService, kept for comparison."""
+    cleaned = text.strip()
+
+    if cleaned.startswith("```"):
+        lines = cleaned.split("\n")
+        lines = lines[1:]
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        cleaned = "\n".join(lines)
+
+    cleaned = cleaned.strip()
+
+    if not cleaned.startswith('[') and not cleaned.startswith('{'):
+        arr_start = cleaned.find('[')
+        obj_start = cleaned.find('{')
+
+        if arr_start >= 0 and (obj_start < 0 or arr_start < obj_start):
+            cleaned = cleaned[arr_start:]
+        elif obj_start >= 0:
+            cleaned = cleaned[obj_start:]
+
+    if cleaned.startswith('['):
+        bracket_count = 0
+        for i, char in enumerate(cleaned):
+            if char == '[':
+                bracket_count += 1
+            elif char == ']':
+                bracket_count -= 1
+                if bracket_count == 0:
+                    cleaned = cleaned[:i+1]
+                    break
+    elif cleaned.startswith('{'):
+        brace_count = 0
+        for i, char in enumerate(cleaned):
+            if char == '{':
+                brace_count += 1
+            elif char == '}':
+                brace_count -= 1
+                if brace_count == 0:
+                    cleaned = cleaned[:i+1]
+                    break
+
+    return json.loads(cleaned)
+
+
+def make_response(card_count, with_brackets=False):
+    cards = []
+    for i in range(card_count):
+        content = f"Follow up with the vendor about invoice #{i} before the quarterly review."
+        if with_brackets:
+            content += " Options: a) pay now, b] dispute; see {draft}."
+        cards.append({
+            "type": "todo",
+            "title": f"Action item {i}",
+            "content": content,
+            "segment": f"Alice: Can someone follow up on invoice {i}? Bob: I will.",
+        })
+    return "```json\n" + json.dumps(cards, indent=2) + "\n```", cards
+
+
+def stream_parse(text, chunk_size=64):
+    parser = JsonArrayStream()
+    items = []
+    for i in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[i:i + chunk_size]))
+    return items
+
+
+def check(name, func, text, expected_count):
+    try:
+        result = func(text)
+        status = "ok" if len(result) == expected_count else f"{len(result)} of {expected_count} cards"
+    except Exception as e:
+        status = f"failed ({type(e).__name__})"
+    print(f"   {name:<12} {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    text, cards = make_response(args.cards)
+    print("=" * 70)
+    print(f"JSON PARSER BENCHMARK - {args.cards} cards, {len(text) / 1024:.0f} KiB response")
+    print("=" * 70)
+
+    parsers = [
+        ("legacy", legacy_parse_json_response),
+        ("new", parse_json_response),
+        ("stream", stream_parse),
+    ]
+    for name, func in parsers:
+        assert func(text) == cards, name
+        seconds = min(timeit.repeat(lambda: func(text), number=1, repeat=args.repeat))
+        print(f"   {name:<12} {seconds * 1000:8.2f} ms  ({len(text) / seconds / 1e6:6.1f} MB/s)")
+
+    print("\nBrackets inside card content:")
+    bracket_text, bracket_cards = make_response(args.cards, with_brackets=True)
+    for name, func in parsers:
+        check(name, func, bracket_text, len(bracket_cards))
+
+    print("\nTruncated response (cut mid-card):")
+    truncated = text[:len(text) // 2]
+    expected = len(stream_parse(truncated))
+    for name, func in parsers:
+        check(name, func, truncated, expected)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark skip/limit against cursor pagination on GET /api/cards/.
+
+Seeds a separate database with one meeting and --rows cards (once; reruns
+reuse it), then times fetching one page at increasing depths with
+?skip= and with ?cursor=. Offset pages get slower the deeper they are
+because the database walks every skipped row; cursor pages seek on the
+(created_at, id) index and stay flat. Also checks that a cursor walk and
+an offset walk return the same rows.
+
+Usage: python benchmark_pagination.py [--rows 1000000] [--limit 100] [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+parser.add_argument("--rows", type=int, default=1_000_000)
+parser.add_argument("--limit", type=int, default=100)
+parser.add_argument("--repeat", type=int, default=5)
+parser.add_argument("--depths", default="0,1000,10000,100000,500000,990000",
+                    help="comma-separated row offsets to time")
+parser.add_argument("--database", default="sqlite:////tmp/scholarsidekick_pagination.db")
+args = parser.parse_args()
+
+# The app reads DATABASE_URL at import time
+os.environ["DATABASE_URL"] = args.database
+
+from app.main import app  # noqa: E402
+from app.database import db  # noqa: E402
+from app.models import Meeting, Card, CardType, CardStatus  # noqa: E402
+from app.api.pagination import encode_cursor  # noqa: E402
+
+BATCH_SIZE = 50_000
+
+
+def seed(rows):
+    """Bulk-insert cards; ten share each created_at so the id tiebreak is exercised."""
+    with app.app_context():
+        existing = db.session.query(db.func.count(Card.id)).scalar()
+        if existing >= rows:
+            print(f"Reusing {existing:,} cards in {args.database}")
+            return
+        if existing:
+            raise SystemExit(f"{args.database} has {existing:,} cards; delete it or pass --rows {existing}")
+
+        meeting = Meeting(title="Pagination benchmark", transcript="", meeting_date=datetime(2025, 11, 26))
+        db.session.add(meeting)
+        db.session.commit()
+
+        print(f"Seeding {rows:,} cards into {args.database} ...")
+        start = time.perf_counter()
+        base = datetime(2025, 1, 1)
+        table = Card.__table__
+        with db.engine.begin() as connection:
+            for offset in range(0, rows, BATCH_SIZE):
+                connection.execute(table.insert(), [
+                    {
+                        "meeting_id": meeting.id,
+                        "card_type": CardType.TODO,
+                        "status": CardStatus.DRAFT,
+                        "title": f"Card {i}",
+                        "content": f"Benchmark card number {i}",
+                        "is_generated": True,
+                        "created_at": base + timedelta(seconds=i // 10),
+                        "updated_at": base + timedelta(seconds=i // 10),
+                    }
+                    for i in range(offset, min(offset + BATCH_SIZE, rows))
+                ])
+        print(f"Seeded in {time.perf_counter() - start:.1f}s")
+
+
+def cursor_at(depth):
+    """Cursor for the page starting at row depth, as a client walking the list would hold."""
+    if depth == 0:
+        return ""
+    with app.app_context():
+        row = Card.query.order_by(Card.created_at, Card.id).offset(depth - 1).limit(1).one()
+        return encode_cursor(row.created_at, row.id)
+
+
+def time_get(client, url):
+    samples = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        response = client.get(url)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, f"{url} returned {response.status_code}"
+    return statistics.median(samples), response.get_json()
+
+
+def main():
+    seed(args.rows)
+    depths = [int(d) for d in args.depths.split(",") if int(d) < args.rows]
+
+    print("=" * 70)
+    print(f"PAGINATION BENCHMARK - {args.rows:,} cards, {args.limit} per page, median of {args.repeat}")
+    print("=" * 70)
+    print(f"   {'depth':>10}  {'skip/limit':>12}  {'cursor':>12}  {'speedup':>8}")
+
+    with app.test_client() as client:
+        for depth in depths:
+            offset_ms, offset_rows = time_get(client, f"/api/cards/?skip={depth}&limit={args.limit}")
+            cursor = cursor_at(depth)
+            cursor_ms, page = time_get(client, f"/api/cards/?cursor={cursor}&limit={args.limit}")
+            assert [c["id"] for c in page["items"]] == [c["id"] for c in offset_rows], f"pages differ at {depth}"
+            print(f"   {depth:>10,}  {offset_ms:>9.2f} ms  {cursor_ms:>9.2f} ms  {offset_ms / cursor_ms:>7.1f}x")
+
+        # Walk a few pages each way and compare
+        walked, cursor = [], ""
+        for _ in range(5):
+            _, page = time_get(client, f"/api/cards/?cursor={cursor}&limit={args.limit}")
+            walked.extend(c["id"] for c in page["items"])
+            cursor = page["next_cursor"]
+        _, offset_rows = time_get(client, f"/api/cards/?skip=0&limit={5 * args.limit}")
+        assert walked == [c["id"] for c in offset_rows], "cursor walk does not match offset order"
+        print(f"\n✅ Cursor walk of 5 pages matches skip/limit order")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Behavior test for the Gemini resilience primitives and single-flight.
+
+Circuit breaker, retry and limiter timing runs on a fake clock swapped in
+for the modules' time, so no test sleeps through a backoff or reset
+timeout. Thread interleavings are forced with events rather than sleeps.
+No API key, server or database is needed.
+"""
+import os
+import random
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import requests
+
+from app.services import gemini_client, resilience
+from app.services.gemini_client import GeminiClient
+from app.services.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitTimeout,
+    RetryPolicy,
+    UpstreamUnavailableError,
+)
+from app.services.single_flight import SingleFlight, fcntl
+
+# Seconds a thread may take to reach a point the test waits for
+THREAD_TIMEOUT = 5
+
+
+class FakeClock:
+    """Stands in for the time module; sleep() advances the clock instantly."""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def monotonic(self):
+        with self._lock:
+            return self.now
+
+    perf_counter = monotonic
+
+    def time(self):
+        return self.monotonic()
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+    def advance(self, seconds):
+        with self._lock:
+            self.now += seconds
+
+
+class fake_time:
+    """Swap the time module of the given modules for a FakeClock."""
+
+    def __init__(self, *modules):
+        self.modules = modules
+        self.clock = FakeClock()
+
+    def __enter__(self):
+        self.saved = [module.time for module in self.modules]
+        for module in self.modules:
+            module.time = self.clock
+        return self.clock
+
+    def __exit__(self, *exc):
+        for module, saved in zip(self.modules, self.saved):
+            module.time = saved
+
+
+def wait_until(predicate, message):
+    """Poll (in real time) until another thread has reached a state."""
+    event = threading.Event()
+    for _ in range(THREAD_TIMEOUT * 100):
+        if predicate():
+            return
+        event.wait(0.01)
+    raise AssertionError(f"timed out waiting until {message}")
+
+
+def run_threads(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(THREAD_TIMEOUT)
+        assert not thread.is_alive(), "thread did not finish"
+
+
+def test_circuit_breaker():
+    print("\n✓ CircuitBreaker")
+    with fake_time(resilience) as clock:
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED, "a success must reset the failure count"
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        try:
+            breaker.before_call()
+            raise AssertionError("open circuit allowed a call")
+        except CircuitOpenError as e:
+            assert e.retry_after == 30
+        clock.advance(10)
+        try:
+            breaker.before_call()
+        except CircuitOpenError as e:
+            assert e.retry_after == 20, e.retry_after
+        print("  ✅ opens after 3 consecutive failures; Retry-After counts down")
+
+        # Half-open: exactly one of many concurrent callers gets the trial
+        clock.advance(20)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        start = threading.Barrier(8)
+        outcomes = []
+
+        def caller():
+            start.wait()
+            try:
+                breaker.before_call()
+                outcomes.append("trial")
+            except CircuitOpenError:
+                outcomes.append("rejected")
+
+        run_threads([caller] * 8)
+        assert outcomes.count("trial") == 1, outcomes
+        print("  ✅ half-open admits a single trial among 8 concurrent callers")
+
+        # A failed trial re-opens for a full reset_timeout
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.stats()["opened_total"] == 2
+        clock.advance(29)
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.advance(1)
+
+        # A released trial slot can be taken again; a successful trial closes
+        breaker.before_call()
+        breaker.release_trial()
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.before_call()
+        print("  ✅ failed trial re-opens, released trial is reusable, successful trial closes")
+
+
+def test_retry_policy():
+    print("\n✓ RetryPolicy")
+    policy = RetryPolicy(max_retries=3, base_delay=1.0, max_delay=30)
+    assert policy.delay(0, retry_after=2.5) == 2.5
+    assert policy.delay(5, retry_after=120) == 120, "Retry-After must not be cut short"
+    assert policy.delay(0, retry_after=-1) == 0
+    random.seed(7)
+    for attempt in range(8):
+        assert 0 <= policy.delay(attempt) <= min(30, 2 ** attempt)
+    print("  ✅ Retry-After overrides jittered backoff and is returned as given")
+
+    assert RetryPolicy.parse_retry_after("3") == 3.0
+    assert RetryPolicy.parse_retry_after(None) is None
+    assert RetryPolicy.parse_retry_after("soon") is None
+    when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=120), usegmt=True)
+    assert 110 <= RetryPolicy.parse_retry_after(when) <= 120
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(seconds=120), usegmt=True)
+    assert RetryPolicy.parse_retry_after(past) == 0
+    print("  ✅ Retry-After parsed as seconds or HTTP date")
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None, lines=None, error=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.lines = lines or []
+        self.error = error
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self, decode_unicode=False):
+        yield from self.lines
+        if self.error:
+            raise self.error
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeSession:
+    """Returns the given responses in order and counts posts."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.posts = 0
+
+    def post(self, *args, **kwargs):
+        self.posts += 1
+        return self.responses.pop(0)
+
+
+def test_client_honours_retry_after():
+    print("\n✓ GeminiClient retries")
+    with fake_time(resilience, gemini_client) as clock:
+        client = GeminiClient(api_key="test", timeout=60)
+        client._session = FakeSession([FakeResponse(429, {"Retry-After": "7"}), FakeResponse(200)])
+        response = client._request("https://gemini.test", {}, {}, "prompt")
+        client._finish(response)
+        assert client._session.posts == 2
+        assert clock.sleeps == [7.0], clock.sleeps
+        print("  ✅ 429 with Retry-After: 7 waits exactly 7s, then succeeds")
+
+        client = GeminiClient(api_key="test", timeout=60)
+        client._session = FakeSession([FakeResponse(503, {"Retry-After": "90"})])
+        clock.sleeps.clear()
+        try:
+            client._request("https://gemini.test", {}, {}, "prompt", timeout=20)
+            raise AssertionError("expected UpstreamUnavailableError")
+        except UpstreamUnavailableError as e:
+            assert e.retry_after == 90
+        assert clock.sleeps == [] and client._session.posts == 1
+        print("  ✅ Retry-After past the deadline fails fast and is passed to the caller")
+
+        client = GeminiClient(api_key="test", timeout=60)
+        client._session = FakeSession([FakeResponse(429, {"Retry-After": "45"})])
+        try:
+            client._request("https://gemini.test", {}, {}, "prompt")
+            raise AssertionError("expected UpstreamUnavailableError")
+        except UpstreamUnavailableError as e:
+            assert e.retry_after == 45
+        assert clock.sleeps == [] and client._session.posts == 1
+        print("  ✅ Retry-After above max_delay fails fast instead of retrying early")
+
+
+def test_stream_failure_trips_breaker():
+    print("\n✓ GeminiClient streams")
+    event = 'data: {"candidates": [{"content": {"parts": [{"text": "piece"}]}}]}'
+    with fake_time(resilience, gemini_client):
+        client = GeminiClient(api_key="test", timeout=60)
+        client.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        broken = requests.ConnectionError("connection reset mid-stream")
+        client._session = FakeSession([
+            FakeResponse(200, lines=[event], error=broken),
+            FakeResponse(200, lines=[event], error=broken),
+        ])
+        for _ in range(2):
+            pieces = []
+            try:
+                for piece in client.stream_generate("prompt"):
+                    pieces.append(piece)
+                raise AssertionError("expected the stream error to propagate")
+            except requests.ConnectionError:
+                pass
+            assert pieces == ["piece"]
+        assert client.breaker.state == CircuitBreaker.OPEN
+        assert client.pool_stats()["errors_total"] == 2
+        assert client.concurrency.stats()["in_flight"] == 0
+        print("  ✅ streams that break partway count as breaker failures and free their slot")
+
+        client = GeminiClient(api_key="test", timeout=60)
+        client.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        client._session = FakeSession([FakeResponse(200, lines=[event])])
+        assert list(client.stream_generate("prompt")) == ["piece"]
+        assert client.breaker.state == CircuitBreaker.CLOSED
+        print("  ✅ complete streams still count as successes")
+
+
+def test_concurrency_limiter():
+    print("\n✓ AdaptiveConcurrencyLimiter")
+    limiter = AdaptiveConcurrencyLimiter(initial=8, minimum=1, maximum=4)
+    assert limiter.limit == 4, "initial limit is capped at maximum"
+
+    for expected in (2, 1, 1):
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        assert limiter.limit == expected, (limiter.limit, expected)
+    print("  ✅ overload halves the limit down to the minimum")
+
+    # Additive increase: +1/limit per success (1 -> 2 -> 2.5 -> 2.9 -> 3.24 ...)
+    for expected in (2, 2, 2, 3, 3, 3, 4):
+        limiter.acquire()
+        limiter.release()
+        assert limiter.limit == expected, (limiter.limit, expected)
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 4, "limit must not exceed maximum"
+    print("  ✅ successes raise the limit additively up to the maximum")
+
+    limiter = AdaptiveConcurrencyLimiter(initial=1, minimum=1, maximum=1)
+    limiter.acquire()
+    try:
+        limiter.acquire(timeout=0)
+        raise AssertionError("acquired past the limit")
+    except RateLimitTimeout:
+        pass
+    acquired = threading.Event()
+
+    def waiter():
+        limiter.acquire(timeout=THREAD_TIMEOUT)
+        acquired.set()
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    assert not acquired.wait(0.05), "waiter ran past a full limiter"
+    limiter.release()
+    thread.join(THREAD_TIMEOUT)
+    assert acquired.is_set() and limiter.stats()["in_flight"] == 1
+    print("  ✅ callers block at the limit and are woken by release")
+
+
+def test_single_flight():
+    print("\n✓ SingleFlight")
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def leader_fn():
+        calls.append("leader")
+        release.wait(THREAD_TIMEOUT)
+        return {"cards": [1, 2]}
+
+    def call(fn):
+        def target():
+            results.append(flight.do("key", fn))
+        return target
+
+    leader = threading.Thread(target=call(leader_fn))
+    leader.start()
+    wait_until(lambda: calls, "the leader is running")
+    waiters = [threading.Thread(target=call(lambda: calls.append("waiter"))) for _ in range(4)]
+    for thread in waiters:
+        thread.start()
+    wait_until(lambda: flight.stats()["coalesced"] == 4, "4 callers are waiting")
+    release.set()
+    for thread in [leader] + waiters:
+        thread.join(THREAD_TIMEOUT)
+    assert calls == ["leader"], calls
+    assert results == [{"cards": [1, 2]}] * 5
+    results[0]["cards"].append(3)
+    assert all(result["cards"] == [1, 2] for result in results[1:]), "waiters must get copies"
+    print("  ✅ 5 concurrent callers, 1 call; waiters receive copies of the result")
+
+    # A leader's exception is raised in every waiter, and the key is freed
+    release.clear()
+    errors = []
+    started = threading.Event()
+
+    def failing_fn():
+        started.set()
+        release.wait(THREAD_TIMEOUT)
+        raise ValueError("upstream parse error")
+
+    def failing_call():
+        try:
+            flight.do("bad", failing_fn)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=failing_call)
+    leader.start()
+    started.wait(THREAD_TIMEOUT)
+    coalesced = flight.stats()["coalesced"]
+    waiters = [threading.Thread(target=failing_call) for _ in range(3)]
+    for thread in waiters:
+        thread.start()
+    wait_until(lambda: flight.stats()["coalesced"] == coalesced + 3, "3 callers are waiting")
+    release.set()
+    for thread in [leader] + waiters:
+        thread.join(THREAD_TIMEOUT)
+    assert len(errors) == 4 and len({id(e) for e in errors}) == 1, errors
+    assert flight.stats()["in_flight"] == 0
+    assert flight.do("bad", lambda: "recovered") == "recovered"
+    print("  ✅ leader failure reaches all 3 waiters; the next call runs again")
+
+    # A waiter that times out runs the call itself
+    release.clear()
+    leader = threading.Thread(target=lambda: flight.do("slow", lambda: release.wait(THREAD_TIMEOUT)))
+    leader.start()
+    wait_until(lambda: flight.stats()["in_flight"] == 1, "the slow leader is running")
+    assert flight.do("slow", lambda: "own result", timeout=0.01) == "own result"
+    release.set()
+    leader.join(THREAD_TIMEOUT)
+    assert flight.stats()["wait_timeouts"] == 1
+    print("  ✅ a waiter past its timeout runs the call itself")
+
+
+def test_single_flight_cross_process():
+    print("\n✓ SingleFlight cross-process handoff")
+    if fcntl is None:
+        print("  ⚠️  fcntl not available; skipped")
+        return
+
+    with tempfile.TemporaryDirectory() as lock_dir:
+        # Separate instances share nothing in memory, like two worker
+        # processes; flock() conflicts between separately opened files
+        first, second = SingleFlight(lock_dir=lock_dir), SingleFlight(lock_dir=lock_dir)
+        running, release = threading.Event(), threading.Event()
+        calls, results = [], {}
+
+        def first_fn():
+            calls.append("first")
+            running.set()
+            release.wait(THREAD_TIMEOUT)
+            return {"cards": ["a"]}
+
+        def run(name, flight, fn):
+            def target():
+                results[name] = flight.do("cross", fn)
+            return target
+
+        first_thread = threading.Thread(target=run("first", first, first_fn))
+        first_thread.start()
+        running.wait(THREAD_TIMEOUT)
+        second_thread = threading.Thread(target=run("second", second, lambda: calls.append("second")))
+        second_thread.start()
+        second_thread.join(0.1)
+        assert second_thread.is_alive(), "second process must wait for the file lock"
+        release.set()
+        first_thread.join(THREAD_TIMEOUT)
+        second_thread.join(THREAD_TIMEOUT)
+
+        assert calls == ["first"], calls
+        assert results["second"] == {"cards": ["a"]}
+        assert second.stats()["cross_process_hits"] == 1
+        assert os.path.exists(os.path.join(lock_dir, "cross.json"))
+        print("  ✅ second process waits on the lock and reuses the handoff file")
+
+        # An expired handoff is not reused
+        expired = SingleFlight(lock_dir=lock_dir, handoff_ttl_seconds=0)
+        os.utime(os.path.join(lock_dir, "cross.json"), (0, 0))
+        assert expired.do("cross", lambda: {"cards": ["fresh"]}) == {"cards": ["fresh"]}
+        print("  ✅ handoff files past their TTL are ignored")
+
+
+def test_concurrency():
+    print("=" * 70)
+    print("🧪 RESILIENCE AND SINGLE-FLIGHT BEHAVIOR")
+    print("=" * 70)
+
+    test_circuit_breaker()
+    test_retry_policy()
+    test_client_honours_retry_after()
+    test_stream_failure_trips_breaker()
+    test_concurrency_limiter()
+    test_single_flight()
+    test_single_flight_cross_process()
+
+    print("\n" + "=" * 70)
+    print("🎉 ALL CONCURRENCY CHECKS PASSED")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_concurrency()
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        raise SystemExit(1)
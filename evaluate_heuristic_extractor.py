@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Precision/recall of the heuristic extractor against recorded LLM output.
+
+Record Gemini's cards for a set of transcripts once (needs GEMINI_API_KEY),
+then score the rule-based backend against those recordings offline:
+
+    python evaluate_heuristic_extractor.py --record --output heuristic_recordings.json
+    python evaluate_heuristic_extractor.py --recordings heuristic_recordings.json
+
+--input takes a JSON list of {"name", "transcript", "agenda_items",
+"requested_card_types"} objects; the built-in stand-up samples are used
+otherwise. A heuristic card matches a recorded card of the same type (todo
+and action_item count as one type unless --strict-types) when their content
+or quoted segment overlap by at least --threshold word Jaccard.
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+
+from app.models import CardType
+from app.services.heuristic_extractor import HeuristicExtractor
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+SAMPLES = [
+    {
+        "name": "standup",
+        "transcript": """Alice: Morning everyone, quick stand-up today.
+Bob: Yesterday I finished the login API. Today I'll write the integration tests for it.
+Carol: I'm still blocked on the design review. Alice, can you ping the design team?
+Alice: Sure, I'll ping them after this call.
+Bob: Should we move the demo to Thursday?
+Alice: Yes, we decided to move the demo to Thursday.
+Carol: TODO: update the onboarding doc with the new login flow.
+Alice: Let's follow up on the staging outage next meeting.""",
+        "agenda_items": ["Blockers", "Demo date", "Staging outage"],
+        "requested_card_types": ["tldr", "todo", "action_item", "decision", "question", "follow_up"],
+    },
+    {
+        "name": "planning",
+        "transcript": """Dana: Let's talk about the Q3 roadmap.
+Eli: We agreed on shipping the export feature first.
+Dana: Who owns the export API?
+Eli: Frank will own the export API and the CSV format.
+Frank: I can take care of the CSV format by next Friday.
+Dana: We need to estimate the reporting dashboard before the next planning session.
+Eli: What about the mobile app?
+Dana: The mobile app waits until Q4; let's go with web only for now.
+Frank: Could you share the customer interview notes?
+Dana: I'll share them this afternoon.""",
+        "agenda_items": ["Q3 roadmap", "Export feature", "Hiring plan"],
+        "requested_card_types": ["tldr", "action_item", "decision", "question", "discussion_point"],
+    },
+    {
+        "name": "retro",
+        "transcript": """Grace: What went well this sprint?
+Hank: Deployments were smooth, the new pipeline saved a lot of time.
+Ivy: The flaky tests still slowed us down. We should quarantine the flaky tests.
+Grace: Agreed. Decision: flaky tests go into a quarantine suite until fixed.
+Hank: I will write a script to report the flakiest tests every week.
+Ivy: Can we revisit the on-call rotation next retro?
+Grace: Yes, let's circle back on on-call next time.""",
+        "agenda_items": ["What went well", "Flaky tests", "On-call rotation"],
+        "requested_card_types": ["todo", "action_item", "decision", "question", "follow_up"],
+    },
+]
+
+# Gemini uses todo and action_item interchangeably for the same commitment
+EQUIVALENT_TYPES = {CardType.ACTION_ITEM.value: "todo/action_item", CardType.TODO.value: "todo/action_item"}
+
+
+def kind_of(card, strict_types):
+    return card["type"] if strict_types else EQUIVALENT_TYPES.get(card["type"], card["type"])
+
+
+def words(text):
+    return set(_WORD.findall((text or "").lower()))
+
+
+def jaccard(a, b):
+    union = a | b
+    return len(a & b) / len(union) if union else 0.0
+
+
+def similarity(card, other):
+    content = jaccard(words(card["content"]), words(other["content"]))
+    segment = 0.0
+    if card.get("segment") and other.get("segment"):
+        segment = jaccard(words(card["segment"]), words(other["segment"]))
+    return max(content, segment)
+
+
+def match_cards(predicted, expected, threshold, strict_types):
+    """Greedy one-to-one matching, best pairs first; returns matched (pred, exp) index pairs."""
+    pairs = []
+    for i, card in enumerate(predicted):
+        for j, other in enumerate(expected):
+            if kind_of(card, strict_types) == kind_of(other, strict_types):
+                score = similarity(card, other)
+                if score >= threshold:
+                    pairs.append((score, i, j))
+    pairs.sort(reverse=True)
+
+    used_pred, used_exp, matches = set(), set(), []
+    for _, i, j in pairs:
+        if i not in used_pred and j not in used_exp:
+            used_pred.add(i)
+            used_exp.add(j)
+            matches.append((i, j))
+    return matches
+
+
+def prf(tp, predicted, expected):
+    precision = tp / predicted if predicted else 0.0
+    recall = tp / expected if expected else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def load_samples(path):
+    if not path:
+        return SAMPLES
+    with open(path) as f:
+        return json.load(f)
+
+
+def record(args):
+    from app.services.extraction_service import ExtractionService
+
+    service = ExtractionService()
+    recordings = []
+    for sample in load_samples(args.input):
+        types = [CardType(t) for t in sample["requested_card_types"]]
+        started = time.perf_counter()
+        cards, uncovered = service.analyze_meeting(
+            sample["transcript"], sample.get("agenda_items"), types, backend="llm"
+        )
+        elapsed = time.perf_counter() - started
+        print(f"   {sample['name']}: {len(cards)} cards in {elapsed:.2f} s")
+        recordings.append(dict(
+            sample,
+            llm_cards=[{k: card.get(k, "") for k in ("type", "title", "content", "segment")} for card in cards],
+            llm_uncovered_agenda_items=uncovered,
+            llm_seconds=round(elapsed, 3),
+        ))
+    with open(args.output, "w") as f:
+        json.dump(recordings, f, indent=2)
+    print(f"Saved {len(recordings)} recordings to {args.output}")
+
+
+def evaluate(args):
+    with open(args.recordings) as f:
+        recordings = json.load(f)
+
+    extractor = HeuristicExtractor()
+    totals = defaultdict(lambda: [0, 0, 0])  # card kind -> [tp, predicted, expected]
+    agenda = [0, 0]  # [agreements, items]
+    heuristic_seconds = 0.0
+    llm_seconds = 0.0
+
+    print("=" * 70)
+    print(f"HEURISTIC EXTRACTOR vs RECORDED LLM OUTPUT ({len(recordings)} transcripts)")
+    print("=" * 70)
+    for sample in recordings:
+        types = [CardType(t) for t in sample["requested_card_types"]]
+        started = time.perf_counter()
+        predicted = extractor.extract_cards(sample["transcript"], sample.get("agenda_items"), types)
+        uncovered = extractor.find_uncovered_agenda_items(sample.get("agenda_items") or [], sample["transcript"])
+        heuristic_seconds += time.perf_counter() - started
+        llm_seconds += sample.get("llm_seconds") or 0.0
+
+        # A TL;DR always "matches" in kind but never in wording, so it is not scored
+        predicted = [c for c in predicted if c["type"] != CardType.TLDR.value]
+        expected = [c for c in sample["llm_cards"] if c["type"] != CardType.TLDR.value]
+        matches = match_cards(predicted, expected, args.threshold, args.strict_types)
+
+        for card in predicted:
+            totals[kind_of(card, args.strict_types)][1] += 1
+        for card in expected:
+            totals[kind_of(card, args.strict_types)][2] += 1
+        for i, _ in matches:
+            totals[kind_of(predicted[i], args.strict_types)][0] += 1
+
+        for item in sample.get("agenda_items") or []:
+            agenda[1] += 1
+            agenda[0] += (item in uncovered) == (item in sample.get("llm_uncovered_agenda_items", []))
+
+        precision, recall, f1 = prf(len(matches), len(predicted), len(expected))
+        print(f"   {sample['name']:<20} P={precision:.2f} R={recall:.2f} F1={f1:.2f} "
+              f"({len(matches)} matched, {len(predicted)} heuristic, {len(expected)} LLM)")
+        if args.verbose:
+            matched_pred = {i for i, _ in matches}
+            matched_exp = {j for _, j in matches}
+            for i, card in enumerate(predicted):
+                if i not in matched_pred:
+                    print(f"      + [{card['type']}] {card['content']}")
+            for j, card in enumerate(expected):
+                if j not in matched_exp:
+                    print(f"      - [{card['type']}] {card['content']}")
+
+    print("\nPer type:")
+    tp_all = pred_all = exp_all = 0
+    for card_type in sorted(totals):
+        tp, pred, exp = totals[card_type]
+        tp_all, pred_all, exp_all = tp_all + tp, pred_all + pred, exp_all + exp
+        precision, recall, f1 = prf(tp, pred, exp)
+        print(f"   {card_type:<20} P={precision:.2f} R={recall:.2f} F1={f1:.2f} ({pred} heuristic, {exp} LLM)")
+
+    precision, recall, f1 = prf(tp_all, pred_all, exp_all)
+    print(f"\nOverall:                P={precision:.2f} R={recall:.2f} F1={f1:.2f}")
+    if agenda[1]:
+        print(f"Agenda coverage agreement: {agenda[0]}/{agenda[1]} items")
+    print(f"Heuristic time:         {heuristic_seconds * 1000:.1f} ms total")
+    if llm_seconds:
+        print(f"Recorded LLM time:      {llm_seconds:.2f} s total")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score the heuristic extractor against recorded LLM cards")
+    parser.add_argument("--record", action="store_true", help="Call Gemini and save recordings (needs GEMINI_API_KEY)")
+    parser.add_argument("--input", help="JSON list of samples to record (default: built-in samples)")
+    parser.add_argument("--output", default="heuristic_recordings.json", help="Where --record writes recordings")
+    parser.add_argument("--recordings", default="heuristic_recordings.json", help="Recordings to evaluate against")
+    parser.add_argument("--threshold", type=float, default=0.3, help="Minimum word Jaccard for a match")
+    parser.add_argument("--strict-types", action="store_true", help="Do not treat todo and action_item as equivalent")
+    parser.add_argument("--verbose", "-v", action="store_true", help="List unmatched cards")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args)
+        return
+    try:
+        evaluate(args)
+    except FileNotFoundError:
+        print(f"No recordings at {args.recordings}; run with --record first.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
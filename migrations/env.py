@@ -0,0 +1,63 @@
+"""
+Alembic environment.
+
+The app runs migrations on startup (app.database.upgrade_database) and
+passes its own connection in config.attributes. From the command line
+(alembic upgrade head, alembic revision --autogenerate) the database is
+DATABASE_URL, with relative SQLite paths resolved into instance/ the way
+Flask-SQLAlchemy resolves them.
+"""
+import os
+import sys
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from app.database import db  # noqa: E402
+import app.models  # noqa: E402,F401  (registers the tables on db.metadata)
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("connection") is None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = db.metadata
+
+
+def cli_database_url():
+    url = make_url(os.getenv("DATABASE_URL", "sqlite:///scholarsidekick.db"))
+    if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:") \
+            and not os.path.isabs(url.database):
+        url = url.set(database=os.path.join(ROOT, "instance", url.database))
+    return url
+
+
+def run_migrations(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_offline():
+    context.configure(url=cli_database_url(), target_metadata=target_metadata, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+elif config.attributes.get("connection") is not None:
+    run_migrations(config.attributes["connection"])
+else:
+    engine = create_engine(cli_database_url())
+    with engine.connect() as connection:
+        run_migrations(connection)
@@ -0,0 +1,172 @@
+"""Baseline: the schema previously created by db.create_all()
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-16 23:03:46.884544
+
+Databases created before migrations existed run it too; tables they
+already have are skipped, so only the missing ones are created.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created by db.create_all() before migrations existed already
+    # have some of these tables; only the missing ones are created
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    if 'meetings' not in existing:
+        op.create_table(
+            'meetings',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=255), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('transcript', sa.Text(), nullable=False),
+            sa.Column('agenda_items', sa.JSON(), nullable=True),
+            sa.Column('uncovered_agenda_items', sa.JSON(), nullable=True),
+            sa.Column('meeting_date', sa.DateTime(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+        )
+    if 'canvases' not in existing:
+        op.create_table(
+            'canvases',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('meeting_id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=255), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id']),
+            sa.PrimaryKeyConstraint('id'),
+        )
+    if 'cards' not in existing:
+        op.create_table(
+            'cards',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('meeting_id', sa.Integer(), nullable=True),
+            sa.Column('canvas_id', sa.Integer(), nullable=True),
+            sa.Column('card_type', sa.Enum(
+                'TLDR', 'TODO', 'DECISION', 'QUESTION', 'ACTION_ITEM', 'DISCUSSION_POINT', 'FOLLOW_UP', 'CUSTOM',
+                name='cardtype'), nullable=False),
+            sa.Column('title', sa.String(length=255), nullable=False),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('status', sa.Enum('DRAFT', 'ACTIVE', 'COMPLETED', 'ARCHIVED', name='cardstatus'), nullable=True),
+            sa.Column('is_generated', sa.Boolean(), nullable=True),
+            sa.Column('transcript_segment', sa.Text(), nullable=True),
+            sa.Column('parent_card_id', sa.Integer(), nullable=True),
+            sa.Column('assigned_to', sa.String(length=100), nullable=True),
+            sa.Column('due_date', sa.DateTime(), nullable=True),
+            sa.Column('position_x', sa.Integer(), nullable=True),
+            sa.Column('position_y', sa.Integer(), nullable=True),
+            sa.Column('tags', sa.JSON(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['canvas_id'], ['canvases.id']),
+            sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id']),
+            sa.ForeignKeyConstraint(['parent_card_id'], ['cards.id']),
+            sa.PrimaryKeyConstraint('id'),
+        )
+    if 'card_updates' not in existing:
+        op.create_table(
+            'card_updates',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('card_id', sa.Integer(), nullable=False),
+            sa.Column('author', sa.String(length=100), nullable=False),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('is_ping', sa.Boolean(), nullable=True),
+            sa.Column('pinged_user', sa.String(length=100), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['card_id'], ['cards.id']),
+            sa.PrimaryKeyConstraint('id'),
+        )
+    if 'extraction_cache' not in existing:
+        op.create_table(
+            'extraction_cache',
+            sa.Column('key', sa.String(length=64), nullable=False),
+            sa.Column('kind', sa.String(length=50), nullable=False),
+            sa.Column('payload', sa.JSON(), nullable=False),
+            sa.Column('hits', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('expires_at', sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint('key'),
+        )
+        op.create_index('ix_extraction_cache_expires_at', 'extraction_cache', ['expires_at'])
+    if 'extraction_jobs' not in existing:
+        op.create_table(
+            'extraction_jobs',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('meeting_id', sa.Integer(), nullable=False),
+            sa.Column('canvas_id', sa.Integer(), nullable=True),
+            sa.Column('status', sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='jobstatus'), nullable=False),
+            sa.Column('requested_card_types', sa.JSON(), nullable=True),
+            sa.Column('callback_url', sa.String(length=2048), nullable=True),
+            sa.Column('attempts', sa.Integer(), nullable=True),
+            sa.Column('cards_created', sa.Integer(), nullable=True),
+            sa.Column('error', sa.Text(), nullable=True),
+            sa.Column('callback_status', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('started_at', sa.DateTime(), nullable=True),
+            sa.Column('finished_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['canvas_id'], ['canvases.id']),
+            sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id']),
+            sa.PrimaryKeyConstraint('id'),
+        )
+        op.create_index('ix_extraction_jobs_status', 'extraction_jobs', ['status'])
+    if 'transcript_chunks' not in existing:
+        op.create_table(
+            'transcript_chunks',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('meeting_id', sa.Integer(), nullable=False),
+            sa.Column('sequence', sa.Integer(), nullable=False),
+            sa.Column('text', sa.Text(), nullable=False),
+            sa.Column('start_offset', sa.Integer(), nullable=False),
+            sa.Column('extracted', sa.Boolean(), nullable=False),
+            sa.Column('cards_created', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id']),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('meeting_id', 'sequence'),
+        )
+        op.create_index('ix_transcript_chunks_meeting_id', 'transcript_chunks', ['meeting_id'])
+    if 'extraction_calls' not in existing:
+        op.create_table(
+            'extraction_calls',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('kind', sa.String(length=32), nullable=False),
+            sa.Column('model', sa.String(length=64), nullable=True),
+            sa.Column('meeting_id', sa.Integer(), nullable=True),
+            sa.Column('latency_ms', sa.Integer(), nullable=False),
+            sa.Column('input_tokens', sa.Integer(), nullable=True),
+            sa.Column('output_tokens', sa.Integer(), nullable=True),
+            sa.Column('retries', sa.SmallInteger(), nullable=False),
+            sa.Column('cache_hit', sa.Boolean(), nullable=False),
+            sa.Column('outcome', sa.String(length=16), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+        )
+        op.create_index('ix_extraction_calls_created_at', 'extraction_calls', ['created_at'])
+        op.create_index('ix_extraction_calls_kind', 'extraction_calls', ['kind'])
+        op.create_index('ix_extraction_calls_meeting_id', 'extraction_calls', ['meeting_id'])
+
+
+def downgrade():
+    op.drop_table('extraction_calls')
+    op.drop_table('transcript_chunks')
+    op.drop_table('extraction_jobs')
+    op.drop_table('extraction_cache')
+    op.drop_table('card_updates')
+    op.drop_table('cards')
+    op.drop_table('canvases')
+    op.drop_table('meetings')
+    sa.Enum(name='jobstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='cardstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='cardtype').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,43 @@
+"""Indexes for the columns list, detail and re-extraction queries filter on
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 23:20:00.000000
+
+Uses IF NOT EXISTS because databases created by db.create_all() after the
+(created_at, id) indexes were declared already have those.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    # Re-extraction deletes/upserts filter_by(meeting_id, is_generated); also
+    # serves meeting_id alone (meeting cards, list_cards?meeting_id=)
+    ('ix_cards_meeting_id_is_generated', 'cards', ['meeting_id', 'is_generated']),
+    ('ix_cards_canvas_id', 'cards', ['canvas_id']),
+    ('ix_cards_parent_card_id', 'cards', ['parent_card_id']),
+    ('ix_canvases_meeting_id', 'canvases', ['meeting_id']),
+    # Card updates are listed newest first per card
+    ('ix_card_updates_card_id_created_at', 'card_updates', ['card_id', 'created_at']),
+    ('ix_extraction_jobs_meeting_id', 'extraction_jobs', ['meeting_id']),
+    # Keyset pagination order of the list endpoints
+    ('ix_meetings_created_at_id', 'meetings', ['created_at', 'id']),
+    ('ix_cards_created_at_id', 'cards', ['created_at', 'id']),
+    ('ix_canvases_created_at_id', 'canvases', ['created_at', 'id']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,69 @@
+"""Transcript length, word count and hash on meetings
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 23:50:00.000000
+
+List responses summarize the transcript from these columns instead of
+loading it. Existing rows are backfilled in batches.
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+meetings = sa.table(
+    'meetings',
+    sa.column('id', sa.Integer),
+    sa.column('transcript', sa.Text),
+    sa.column('transcript_length', sa.Integer),
+    sa.column('transcript_word_count', sa.Integer),
+    sa.column('transcript_hash', sa.String),
+)
+
+
+def upgrade():
+    op.add_column('meetings', sa.Column('transcript_length', sa.Integer(), nullable=True))
+    op.add_column('meetings', sa.Column('transcript_word_count', sa.Integer(), nullable=True))
+    op.add_column('meetings', sa.Column('transcript_hash', sa.String(length=64), nullable=True))
+
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(meetings.c.id, meetings.c.transcript)
+            .where(meetings.c.id > last_id)
+            .order_by(meetings.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            meetings.update().where(meetings.c.id == sa.bindparam('row_id')),
+            [
+                {
+                    'row_id': row.id,
+                    'transcript_length': len(row.transcript),
+                    'transcript_word_count': len(row.transcript.split()),
+                    'transcript_hash': hashlib.sha256(row.transcript.encode('utf-8')).hexdigest(),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade():
+    with op.batch_alter_table('meetings') as batch_op:
+        batch_op.drop_column('transcript_hash')
+        batch_op.drop_column('transcript_word_count')
+        batch_op.drop_column('transcript_length')
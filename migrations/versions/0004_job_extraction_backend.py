@@ -0,0 +1,27 @@
+"""Extraction backend on extraction jobs
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 10:00:00.000000
+
+Asynchronous and batch jobs run with the backend requested when they were
+created. Existing jobs keep NULL and run with the server default.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('extraction_jobs', sa.Column('extraction_backend', sa.String(length=16), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('extraction_jobs') as batch_op:
+        batch_op.drop_column('extraction_backend')
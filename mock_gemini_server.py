@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Mock Gemini Server - a local stand-in for the Gemini generateContent API.
+
+Serves generateContent and streamGenerateContent (alt=sse) with configurable
+latency, error rates and canned card payloads, so extraction throughput can
+be measured without an API key or network access.
+
+Run it and point the app at it:
+
+    python mock_gemini_server.py --port 8089 --latency-ms 800 --error-rate 0.02
+    export GEMINI_API_URL=http://localhost:8089/v1beta/models/gemini-2.0-flash:generateContent
+    python run.py
+
+GET /stats returns request counters; POST /stats/reset clears them.
+"""
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+_REQUESTED_TYPES = re.compile(r"following card types:\n((?:- \w+\n)+)")
+_TRANSCRIPT = re.compile(r'Transcript:\n"""(.*?)"""', re.DOTALL)
+
+
+def build_parser(add_help=True):
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the Gemini generateContent API", add_help=add_help
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=500,
+                        help="Mean time before the response (or first streamed piece)")
+    parser.add_argument("--latency-jitter-ms", type=float, default=100,
+                        help="Spread of the latency distribution")
+    parser.add_argument("--latency-dist", choices=["fixed", "uniform", "normal", "lognormal"], default="normal")
+    parser.add_argument("--stream-chunk-ms", type=float, default=20,
+                        help="Delay between streamed pieces")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with 429 and Retry-After")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--cards-per-type", type=int, default=2)
+    parser.add_argument("--cards-file", help="JSON file with a list of canned cards to return")
+    parser.add_argument("--seed", type=int)
+    return parser
+
+
+class MockGemini:
+    """Response generation and counters shared by all handler threads."""
+
+    def __init__(self, options):
+        self.options = options
+        self.random = random.Random(options.seed)
+        self.canned_cards = None
+        if options.cards_file:
+            with open(options.cards_file) as f:
+                self.canned_cards = json.load(f)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {"requests": 0, "streamed": 0, "errors": 0, "rate_limited": 0, "in_flight": 0, "peak_in_flight": 0}
+
+    def count(self, key, delta=1):
+        with self._lock:
+            self.stats[key] += delta
+            if key == "in_flight":
+                self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self.stats["in_flight"])
+
+    def latency(self):
+        mean = self.options.latency_ms / 1000.0
+        jitter = self.options.latency_jitter_ms / 1000.0
+        dist = self.options.latency_dist
+        with self._lock:
+            if dist == "fixed" or jitter <= 0:
+                value = mean
+            elif dist == "uniform":
+                value = self.random.uniform(mean - jitter, mean + jitter)
+            elif dist == "normal":
+                value = self.random.gauss(mean, jitter)
+            else:
+                # Lognormal with the requested mean and standard deviation (long tail)
+                sigma2 = math.log(1 + (jitter / mean) ** 2) if mean > 0 else 0.0
+                mu = math.log(mean) - sigma2 / 2 if mean > 0 else 0.0
+                value = self.random.lognormvariate(mu, math.sqrt(sigma2))
+        return max(0.0, value)
+
+    def failure(self):
+        """Return (status, headers) for an injected failure, or None."""
+        with self._lock:
+            roll = self.random.random()
+        if roll < self.options.rate_limit_rate:
+            return 429, {"Retry-After": str(self.options.retry_after)}
+        if roll < self.options.rate_limit_rate + self.options.error_rate:
+            return self.options.error_status, {}
+        return None
+
+    def answer(self, prompt):
+        """Text the model would return for one of the app's prompts."""
+        if "NOT discussed" in prompt:
+            return "[]"
+        if "summaries of consecutive parts" in prompt:
+            return "The team reviewed progress, agreed on next steps and assigned owners."
+        if "Find the exact snippet" in prompt:
+            return self._first_line(prompt)
+        return json.dumps(self._cards(prompt))
+
+    def _cards(self, prompt):
+        match = _REQUESTED_TYPES.search(prompt)
+        types = re.findall(r"- (\w+)", match.group(1)) if match else ["tldr", "todo"]
+        if self.canned_cards is not None:
+            return [card for card in self.canned_cards if card.get("type") in types]
+
+        segment = self._first_line(prompt)
+        cards = []
+        for card_type in types:
+            count = 1 if card_type == "tldr" else self.options.cards_per_type
+            for i in range(count):
+                cards.append({
+                    "type": card_type,
+                    "title": f"{card_type.replace('_', ' ').title()} {i + 1}",
+                    "content": f"Mock {card_type} {i + 1}: {segment[:80]}",
+                    "segment": "" if card_type == "tldr" else segment,
+                })
+        return cards
+
+    @staticmethod
+    def _first_line(prompt):
+        match = _TRANSCRIPT.search(prompt)
+        lines = [line.strip() for line in (match.group(1) if match else "").splitlines() if line.strip()]
+        return lines[0] if lines else ""
+
+
+def _response_body(text, prompt, final=True):
+    body = {
+        "candidates": [{
+            "content": {"parts": [{"text": text}], "role": "model"},
+            "finishReason": "STOP" if final else None,
+            "index": 0,
+        }],
+        "modelVersion": "mock-gemini",
+    }
+    if final:
+        prompt_tokens = max(1, len(prompt) // 4)
+        output_tokens = max(1, len(text) // 4)
+        body["usageMetadata"] = {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": output_tokens,
+            "totalTokenCount": prompt_tokens + output_tokens,
+        }
+    return body
+
+
+def make_handler(mock):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _json(self, status, body, headers=None):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if urlparse(self.path).path == "/stats":
+                with mock._lock:
+                    stats = dict(mock.stats)
+                return self._json(200, stats)
+            return self._json(200, {"status": "ok"})
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+
+            if url.path == "/stats/reset":
+                mock.reset_stats()
+                return self._json(200, {"status": "reset"})
+
+            streaming = url.path.endswith(":streamGenerateContent")
+            if not (streaming or url.path.endswith(":generateContent")):
+                return self._json(404, {"error": {"code": 404, "message": "Not found"}})
+
+            try:
+                prompt = json.loads(raw)["contents"][0]["parts"][0]["text"]
+            except (ValueError, KeyError, IndexError):
+                return self._json(400, {"error": {"code": 400, "message": "Invalid request body"}})
+
+            mock.count("requests")
+            mock.count("in_flight")
+            try:
+                time.sleep(mock.latency())
+                failure = mock.failure()
+                if failure:
+                    status, headers = failure
+                    mock.count("rate_limited" if status == 429 else "errors")
+                    return self._json(status, {"error": {"code": status, "message": "Injected failure"}}, headers)
+
+                text = mock.answer(prompt)
+                if streaming and parse_qs(url.query).get("alt") == ["sse"]:
+                    mock.count("streamed")
+                    return self._stream(text, prompt)
+                return self._json(200, _response_body(text, prompt))
+            finally:
+                mock.count("in_flight", -1)
+
+        def _stream(self, text, prompt):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            pieces = [text[i:i + 120] for i in range(0, len(text), 120)] or [""]
+            for i, piece in enumerate(pieces):
+                if i:
+                    time.sleep(mock.options.stream_chunk_ms / 1000.0)
+                event = _response_body(piece, prompt, final=i == len(pieces) - 1)
+                self.wfile.write(f"data: {json.dumps(event)}\r\n\r\n".encode("utf-8"))
+                self.wfile.flush()
+
+    return Handler
+
+
+def start_server(options):
+    """Start the mock in a daemon thread; returns (server, mock)."""
+    mock = MockGemini(options)
+    server = ThreadingHTTPServer((options.host, options.port), make_handler(mock))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, mock
+
+
+def api_url(server, model="gemini-2.0-flash"):
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/v1beta/models/{model}:generateContent"
+
+
+if __name__ == "__main__":
+    options = build_parser().parse_args()
+    mock = MockGemini(options)
+    server = ThreadingHTTPServer((options.host, options.port), make_handler(mock))
+    server.daemon_threads = True
+    print(f"Mock Gemini listening on {api_url(server)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
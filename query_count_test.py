@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Query-count test for the detail endpoints.
+
+Seeds a small and a large meeting directly in the database (no LLM call)
+and checks that each detail endpoint issues the same bounded number of
+SELECTs for both, i.e. no per-card or per-canvas lazy loads. Re-extraction's
+card upsert is held to the same rule.
+"""
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.main import app
+from app.database import db
+from app.models import Meeting, Canvas, Card, CardType, CardUpdate
+from app.services.meeting_extraction import upsert_generated_cards
+
+# Maximum statements per request
+QUERY_BUDGETS = {
+    "GET /api/meetings/<id>": 4,     # meeting, cards, canvases, canvas card ids
+    "GET /api/cards/<id>": 3,        # card, updates, child cards
+    "GET /api/canvas/<id>": 2,       # canvas, cards
+    "GET /api/canvas/?meeting_id": 2,
+    "GET /api/meetings/<id>?include=": 1,          # no relations requested, none loaded
+    "GET /api/canvas/<id>?fields=cards.title": 2,
+    "upsert_generated_cards": 5,   # cards, updates, child cards, canvases, canvas card count
+}
+
+
+class QueryCounter:
+    """Counts statements executed on the engine while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+def seed_meeting(n_cards, n_canvases=2, n_updates=3):
+    """Meeting with cards spread over canvases; the first card has updates and children."""
+    meeting = Meeting(
+        title=f"Query count test ({n_cards} cards)",
+        transcript="Alice: Let's go through the list.\nBob: Sounds good.",
+        meeting_date=datetime(2025, 11, 26, 10, 0),
+    )
+    db.session.add(meeting)
+    db.session.flush()
+
+    canvases = [Canvas(meeting_id=meeting.id, title=f"Canvas {i + 1}") for i in range(n_canvases)]
+    db.session.add_all(canvases)
+    db.session.flush()
+
+    cards = [
+        Card(
+            meeting_id=meeting.id,
+            canvas_id=canvases[i % n_canvases].id,
+            card_type=CardType.TODO,
+            title=f"Card {i + 1}",
+            content=f"Task number {i + 1}",
+            is_generated=True,
+        )
+        for i in range(n_cards)
+    ]
+    db.session.add_all(cards)
+    db.session.flush()
+
+    for i in range(1, min(n_cards, 1 + n_updates)):
+        cards[i].parent_card_id = cards[0].id
+    db.session.add_all([
+        CardUpdate(card_id=cards[0].id, author="Tester", content=f"Update {i + 1}")
+        for i in range(n_updates)
+    ])
+    db.session.commit()
+    return meeting.id, canvases[0].id, cards[0].id
+
+
+def count_queries(client, engine, url):
+    with QueryCounter(engine) as counter:
+        response = client.get(url)
+    assert response.status_code == 200, f"{url} returned {response.status_code}"
+    return len(counter.statements), response.get_json()
+
+
+def count_upsert_selects(engine, meeting_id, canvas_id):
+    """SELECTs issued by a re-extraction that drops every generated card; rolled back."""
+    meeting = db.session.get(Meeting, meeting_id)
+    canvas = db.session.get(Canvas, canvas_id)
+    with QueryCounter(engine) as counter:
+        result = upsert_generated_cards(meeting, canvas, [], [CardType.TODO])
+    db.session.rollback()
+    selects = [s for s in counter.statements if s.lstrip().upper().startswith("SELECT")]
+    return len(selects), result
+
+
+def test_query_counts():
+    print("=" * 70)
+    print("🧪 DETAIL ENDPOINT QUERY COUNTS")
+    print("=" * 70)
+
+    with app.app_context():
+        small = seed_meeting(n_cards=5)
+        large = seed_meeting(n_cards=60, n_canvases=4, n_updates=10)
+        engine = db.engine
+
+    try:
+        with app.test_client() as client:
+            for label, (meeting_id, canvas_id, card_id) in (("small", small), ("large", large)):
+                print(f"\n✓ {label} meeting (ID {meeting_id})")
+                urls = {
+                    "GET /api/meetings/<id>": f"/api/meetings/{meeting_id}",
+                    "GET /api/cards/<id>": f"/api/cards/{card_id}",
+                    "GET /api/canvas/<id>": f"/api/canvas/{canvas_id}",
+                    "GET /api/canvas/?meeting_id": f"/api/canvas/?meeting_id={meeting_id}",
+                    "GET /api/meetings/<id>?include=": f"/api/meetings/{meeting_id}?include=",
+                    "GET /api/canvas/<id>?fields=cards.title": f"/api/canvas/{canvas_id}?fields=cards.title",
+                }
+                for endpoint, url in urls.items():
+                    queries, body = count_queries(client, engine, url)
+                    budget = QUERY_BUDGETS[endpoint]
+                    assert queries <= budget, f"{endpoint}: {queries} queries (budget {budget})"
+                    print(f"  ✅ {endpoint}: {queries} queries (budget {budget})")
+
+                    if endpoint == "GET /api/meetings/<id>":
+                        card_ids = [card["id"] for card in body["cards"]]
+                        assert len(card_ids) == len(set(card_ids)), "duplicate cards in meeting detail"
+                        assert all("cards" not in canvas for canvas in body["canvases"])
+                        referenced = [cid for canvas in body["canvases"] for cid in canvas["card_ids"]]
+                        assert sorted(referenced) == sorted(card_ids)
+                        print(f"     - {len(card_ids)} cards serialized once, referenced by card_ids")
+                    elif endpoint == "GET /api/canvas/<id>?fields=cards.title":
+                        assert set(body) == {"id", "cards"}
+                        assert all(set(card) == {"id", "title"} for card in body["cards"])
+
+                with app.app_context():
+                    queries, result = count_upsert_selects(engine, meeting_id, canvas_id)
+                budget = QUERY_BUDGETS["upsert_generated_cards"]
+                assert queries <= budget, f"upsert_generated_cards: {queries} SELECTs (budget {budget})"
+                assert result["kept_modified"] == 1, result
+                print(f"  ✅ upsert_generated_cards: {queries} SELECTs (budget {budget})")
+    finally:
+        with app.app_context():
+            for meeting_id, _, _ in (small, large):
+                meeting = db.session.get(Meeting, meeting_id)
+                if meeting:
+                    Card.query.filter_by(meeting_id=meeting_id).update({Card.parent_card_id: None})
+                    db.session.delete(meeting)
+            db.session.commit()
+
+    print("\n" + "=" * 70)
+    print("🎉 QUERY COUNTS WITHIN BUDGET")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_query_counts()
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        raise SystemExit(1)
@@ -11,10 +11,10 @@ Usage:
 
 import os
 from app.main import create_app
-from app.database import db
+from app.database import db, upgrade_database
 
 def setup_database():
-    """Create all database tables"""
+    """Create or migrate the database tables"""
     database_url = os.getenv('DATABASE_URL') or os.getenv('POSTGRES_URL')
     
     if not database_url:
@@ -32,20 +32,20 @@ def setup_database():
     os.environ['DATABASE_URL'] = database_url
     app = create_app()
     
-    print("📦 Creating database tables...")
+    print("📦 Applying database migrations...")
     
     with app.app_context():
         try:
-            # Create all tables
-            db.create_all()
-            print("✅ All tables created successfully!")
+            # Build the schema from migrations/ (or bring an existing one to head)
+            upgrade_database()
+            print("✅ Database schema is up to date!")
             
             # List created tables
             from sqlalchemy import inspect
             inspector = inspect(db.engine)
             tables = inspector.get_table_names()
             
-            print("\n📋 Created tables:")
+            print("\n📋 Tables:")
             for table in tables:
                 print(f"  - {table}")
             
@@ -56,7 +56,7 @@ def setup_database():
             return True
             
         except Exception as e:
-            print(f"❌ Error creating tables: {e}")
+            print(f"❌ Error migrating database: {e}")
             return False
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Transcript preprocessor test.
+
+Checks that normalization strips only caption noise and repeated speaker
+labels: spoken numbers and times, and label lines such as "TODO:" or
+"Note:", must reach the prompt unchanged. No API key or database is needed.
+"""
+from app.services.transcript_preprocessor import TranscriptPreprocessor
+
+# (description, transcript, expected normalized text)
+CASES = [
+    (
+        "SRT cue numbers and timings are stripped",
+        "1\n00:00:01,000 --> 00:00:04,000\nAlice: Welcome.\n\n2\n00:00:04,000 --> 00:00:06,000\nBob: Thanks.",
+        "Alice: Welcome.\nBob: Thanks.",
+    ),
+    (
+        "WEBVTT header and cues are stripped",
+        "WEBVTT\n\n00:01.000 --> 00:04.000\nAlice: Hello.",
+        "Alice: Hello.",
+    ),
+    (
+        "spoken numbers on their own line are kept",
+        "Alice: The target year is\n2024\nBob: and the budget is\n15000",
+        "Alice: The target year is\n2024\nBob: and the budget is\n15000",
+    ),
+    (
+        "timestamps before a speaker label or on their own are stripped",
+        "00:01:23 Alice: Let's start.\n[00:01:30] Bob: Sure.\n00:02:00\n(12:34) Bob: Next item.",
+        "Alice: Let's start.\nBob: Sure. Next item.",
+    ),
+    (
+        "spoken times are kept",
+        "Alice: When should we meet?\n10:30 works for me\nBob: 9:15 - no, 10:30 is fine.",
+        "Alice: When should we meet?\n10:30 works for me\nBob: 9:15 - no, 10:30 is fine.",
+    ),
+    (
+        "consecutive lines of one speaker are compacted",
+        "Alice: First point.\nAlice: Second point.\nBob: Reply.",
+        "Alice: First point. Second point.\nBob: Reply.",
+    ),
+    (
+        "TODO and action lines are never compacted",
+        "TODO: send the slides\nTODO: book the room\nAction item: Bob updates the roadmap\nAction item: Carol files the ticket",
+        "TODO: send the slides\nTODO: book the room\nAction item: Bob updates the roadmap\nAction item: Carol files the ticket",
+    ),
+    (
+        "Note and Decision lines are never compacted",
+        "Note: budget is frozen\nNote: hiring paused\nDecision: ship Friday\nDecision: skip the beta",
+        "Note: budget is frozen\nNote: hiring paused\nDecision: ship Friday\nDecision: skip the beta",
+    ),
+    (
+        "a label line ends the speaker's turn",
+        "Alice: Two things.\nTODO: update docs\nAlice: And one more.",
+        "Alice: Two things.\nTODO: update docs\nAlice: And one more.",
+    ),
+    (
+        "filler words are removed",
+        "Alice: Um, so, uh, we ship on Friday.",
+        "Alice: so, we ship on Friday.",
+    ),
+]
+
+
+def test_preprocessor():
+    print("=" * 70)
+    print("🧪 TRANSCRIPT PREPROCESSOR")
+    print("=" * 70)
+
+    preprocessor = TranscriptPreprocessor()
+    for description, transcript, expected in CASES:
+        text = preprocessor.process(transcript)["text"]
+        assert text == expected, f"{description}:\n  expected {expected!r}\n  got      {text!r}"
+        print(f"  ✅ {description}")
+
+    print("\n" + "=" * 70)
+    print("🎉 PREPROCESSOR CASES PASSED")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_preprocessor()
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        raise SystemExit(1)